@@ -1,296 +1,34 @@
 import streamlit as st
 import pandas as pd
 import io
-from fpdf import FPDF
-import zipfile
 import os
-import math
-
-def turkce_sirala_anahtar(metin):
-    turkce_harf_agirliklari = {
-        'a': 1, 'b': 2, 'c': 3, 'ç': 4, 'd': 5, 'e': 6, 'f': 7, 'g': 8, 'ğ': 9, 'h': 10,
-        'ı': 11, 'i': 12, 'j': 13, 'k': 14, 'l': 15, 'm': 16, 'n': 17, 'o': 18, 'ö': 19,
-        'p': 20, 'r': 21, 's': 22, 'ş': 23, 't': 24, 'u': 25, 'ü': 26, 'v': 27, 'y': 28, 'z': 29,
-        'A': 1, 'B': 2, 'C': 3, 'Ç': 4, 'D': 5, 'E': 6, 'F': 7, 'G': 8, 'Ğ': 9, 'H': 10,
-        'I': 11, 'İ': 12, 'J': 13, 'K': 14, 'L': 15, 'M': 16, 'N': 17, 'O': 18, 'Ö': 19,
-        'P': 20, 'R': 21, 'S': 22, 'Ş': 23, 'T': 24, 'U': 25, 'Ü': 26, 'V': 27, 'Y': 28, 'Z': 29
-    }
-    
-    metin_kucuk = metin.lower()
-    anahtar = []
-    
-    for harf in metin_kucuk:
-        if harf in turkce_harf_agirliklari:
-            anahtar.append(f"{turkce_harf_agirliklari[harf]:02d}")
-        else:
-            anahtar.append("99")
-    
-    return "".join(anahtar)
-
-class SinavPDF(FPDF):
-    def __init__(self, uni, fakulte, bolum, ders, sinav_turu, tarih, saat, hoca, *args, **kwargs):
-        super().__init__(*args, **kwargs)
-        self.uni_str = uni
-        self.fak_str = fakulte
-        self.bol_str = bolum
-        self.der_str = ders
-        self.sinav_turu = sinav_turu
-        self.tar_str = tarih
-        self.saa_str = saat
-        self.hoc_str = hoca
-        
-        # UTF-8 desteğini etkinleştir
-        self.set_auto_page_break(auto=True, margin=15)
-        
-        # DejaVu fontunu kullan (Türkçe karakter desteği için)
-        try:
-            # Streamlit Cloud için DejaVu fontu
-            self.add_font('DejaVu', '', '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', uni=True)
-            self.add_font('DejaVu', 'B', '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf', uni=True)
-            self.fnt = 'DejaVu'
-            self.font_added = True
-        except:
-            try:
-                # Arial Unicode MS (Windows) - geniş Unicode desteği
-                self.add_font('ArialUnicode', '', 'arialuni.ttf', uni=True)
-                self.add_font('ArialUnicode', 'B', 'arialunib.ttf', uni=True)
-                self.fnt = 'ArialUnicode'
-                self.font_added = True
-            except:
-                # Font eklenemediyse Helvetica kullan ama Türkçe karakterleri değiştir
-                self.fnt = 'Helvetica'
-                self.font_added = False
-                # Türkçe karakter mapping
-                self.turkce_replace = {
-                    'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
-                    'Ç': 'C', 'Ğ': 'G', 'İ': 'I', 'Ö': 'O', 'Ş': 'S', 'Ü': 'U'
-                }
-
-    def _clean_text(self, text):
-        """Türkçe karakterleri temizle (eğer font desteklemiyorsa)"""
-        if not self.font_added:
-            if hasattr(self, 'turkce_replace'):
-                for turkce, latin in self.turkce_replace.items():
-                    text = text.replace(turkce, latin)
-        return text
-
-    def yoklama_header(self, sinif):
-        # Başlıkları temizle
-        uni_clean = self._clean_text(self.uni_str)
-        fak_clean = self._clean_text(self.fak_str)
-        bol_clean = self._clean_text(self.bol_str)
-        der_clean = self._clean_text(self.der_str)
-        sinif_clean = self._clean_text(sinif)
-        
-        self.set_font(self.fnt, 'B', 10)
-        self.cell(0, 5, f"{uni_clean} {fak_clean}", ln=True, align='C')
-        self.cell(0, 5, f"{bol_clean} {self._clean_text(self.sinav_turu)} TUTANAĞI", ln=True, align='C')
-        self.ln(5)
-        
-        self.set_font(self.fnt, 'B', 9)
-        self.cell(25, 8, " Dersin Adı", 1)
-        self.set_font(self.fnt, '', 9)
-        self.cell(168, 8, f" {der_clean}", 1, ln=True)
-        
-        self.set_font(self.fnt, 'B', 9)
-        self.cell(25, 8, " Sınıf No", 1)
-        self.set_font(self.fnt, '', 9)
-        self.cell(40, 8, f" {sinif_clean}", 1)
-        
-        self.set_font(self.fnt, 'B', 9)
-        self.cell(20, 8, " Tarih", 1)
-        self.set_font(self.fnt, '', 9)
-        self.cell(45, 8, f" {self.tar_str}", 1)
-        
-        self.set_font(self.fnt, 'B', 9)
-        self.cell(21, 8, " Saat", 1)
-        self.set_font(self.fnt, '', 9)
-        self.cell(42, 8, f" {self.saa_str}", 1, ln=True)
-        self.ln(3)
-
-    def kapi_listesi_header(self, sinif):
-        # Başlıkları temizle
-        uni_clean = self._clean_text(self.uni_str)
-        fak_clean = self._clean_text(self.fak_str)
-        bol_clean = self._clean_text(self.bol_str)
-        der_clean = self._clean_text(self.der_str)
-        sinif_clean = self._clean_text(sinif)
-        
-        self.set_font(self.fnt, 'B', 14)
-        self.cell(0, 8, uni_clean, ln=True, align='C')
-        self.ln(2)
-        
-        self.set_font(self.fnt, 'B', 12)
-        self.cell(0, 7, fak_clean, ln=True, align='C')
-        self.ln(2)
-        
-        self.set_font(self.fnt, 'B', 11)
-        self.cell(0, 6, f"{bol_clean} - {der_clean} {self._clean_text(self.sinav_turu)}", ln=True, align='C')
-        self.ln(3)
-        
-        self.set_font(self.fnt, 'B', 13)
-        self.cell(0, 8, f"Sınıf Listesi - {sinif_clean}", ln=True, align='C')
-        self.ln(8)
-    
-    def yoklama_tablo(self, room_list, sinif_adi):
-        """Dinamik yoklama tablosu - öğrenci sayısına göre otomatik ayarlanır"""
-        sinif_adi_clean = self._clean_text(sinif_adi)
-        
-        # Tablo başlıkları
-        self.set_font(self.fnt, 'B', 8)
-        for _ in range(2):
-            self.cell(8, 7, "S.N", 1, 0, 'C')
-            self.cell(20, 7, "No", 1, 0, 'C')
-            self.cell(42, 7, "Adı Soyadı", 1, 0, 'C')
-            self.cell(25, 7, "İmza", 1, 0, 'C')
-            if _ == 0: self.cell(2, 7, "", 0, 0)
-        self.ln(7)
-        
-        # Öğrenci sayısını al
-        ogrenci_sayisi = len(room_list)
-        
-        # Kaç sayfa gerektiğini hesapla (her sayfa 50 kişi)
-        sayfa_sayisi = math.ceil(ogrenci_sayisi / 50)
-        
-        for sayfa_no in range(sayfa_sayisi):
-            if sayfa_no > 0:
-                self.add_page()
-                self.yoklama_header(sinif_adi_clean)
-                # Tablo başlıklarını tekrar yaz
-                self.set_font(self.fnt, 'B', 8)
-                for _ in range(2):
-                    self.cell(8, 7, "S.N", 1, 0, 'C')
-                    self.cell(20, 7, "No", 1, 0, 'C')
-                    self.cell(42, 7, "Adı Soyadı", 1, 0, 'C')
-                    self.cell(25, 7, "İmza", 1, 0, 'C')
-                    if _ == 0: self.cell(2, 7, "", 0, 0)
-                self.ln(7)
-            
-            # Bu sayfadaki öğrenci aralığı
-            baslangic = sayfa_no * 50
-            bitis = min((sayfa_no + 1) * 50, ogrenci_sayisi)
-            
-            # İlk 25 öğrenci için
-            self.set_font(self.fnt, '', 7.5)
-            for i in range(25):
-                sira_no = baslangic + i
-                if sira_no < bitis:
-                    s = room_list.iloc[sira_no]
-                    ad_soyad = f"{s.iloc[1]} {s.iloc[2]}"
-                    ad_soyad_clean = self._clean_text(ad_soyad)
-                    self.cell(8, 6.5, str(sira_no + 1), 1, 0, 'C')
-                    self.cell(20, 6.5, str(s.iloc[0]), 1, 0, 'C')
-                    self.cell(42, 6.5, f" {ad_soyad_clean}", 1, 0, 'L')
-                    self.cell(25, 6.5, "", 1, 0)
-                else:
-                    for w in [8, 20, 42, 25]: self.cell(w, 6.5, "", 1, 0)
-                self.cell(2, 6.5, "", 0, 0)
-                
-                # Sağ taraftaki 25 öğrenci (26-50)
-                sira_no_sag = baslangic + i + 25
-                if sira_no_sag < bitis:
-                    s = room_list.iloc[sira_no_sag]
-                    ad_soyad = f"{s.iloc[1]} {s.iloc[2]}"
-                    ad_soyad_clean = self._clean_text(ad_soyad)
-                    self.cell(8, 6.5, str(sira_no_sag + 1), 1, 0, 'C')
-                    self.cell(20, 6.5, str(s.iloc[0]), 1, 0, 'C')
-                    self.cell(42, 6.5, f" {ad_soyad_clean}", 1, 0, 'L')
-                    self.cell(25, 6.5, "", 1, 1)
-                else:
-                    for w in [8, 20, 42]: self.cell(w, 6.5, "", 1, 0)
-                    self.cell(25, 6.5, "", 1, 1)
-            
-            # **DEĞİŞİKLİK BAŞLANGICI: Her sayfaya alt bilgileri ekle**
-            self.ln(4)
-            self.set_font(self.fnt, '', 9)
-            self.cell(0, 5, "Bu sınıfta ................. öğrenci sınava girmiş ve sınav kağıtları teslim edilmiştir.", ln=True)
-            self.ln(2)
-            
-            y_pos = self.get_y()
-            box_w = 62.4
-
-            for j in range(3):
-                x_coord = 10 + (j * (box_w + 1.9))
-                self.rect(x_coord, y_pos, box_w, 25)
-                self.set_xy(x_coord, y_pos + 1)
-                titles = ["Gözetmen 1", "Gözetmen 2", "Öğretim Üyesi"]
-                self.set_font(self.fnt, 'B', 9)
-                self.cell(box_w, 5, titles[j], 0, 1, 'C')
-                self.set_font(self.fnt, '', 8)
-                if j == 2:
-                    hoca_clean = self._clean_text(self.hoc_str)
-                    self.set_x(x_coord); self.cell(box_w, 5, f" {hoca_clean}", 0, 1, 'C')
-                else:
-                    self.set_x(x_coord); self.cell(box_w, 5, " Adı Soyadı:", 0, 1, 'L')
-                self.set_x(x_coord); self.cell(box_w, 5, " İmza:", 0, 1, 'L')
-            # **DEĞİŞİKLİK SONU**
-    
-    def kapi_listesi_tablo(self, room_list, sinif_adi):
-        """Dinamik kapı listesi tablosu - öğrenci sayısına göre otomatik ayarlanır"""
-        sinif_adi_clean = self._clean_text(sinif_adi)
-        
-        # Tablo başlıkları
-        self.set_font(self.fnt, 'B', 8)
-        for _ in range(2):
-            self.cell(8, 7, "S.N", 1, 0, 'C')
-            self.cell(20, 7, "No", 1, 0, 'C')
-            self.cell(70, 7, "Adı Soyadı", 1, 0, 'C')
-            if _ == 0: self.cell(2, 7, "", 0, 0)
-        self.ln(7)
-        
-        # Öğrenci sayısını al
-        ogrenci_sayisi = len(room_list)
-        
-        # Kaç sayfa gerektiğini hesapla (her sayfa 50 kişi)
-        sayfa_sayisi = math.ceil(ogrenci_sayisi / 50)
-        
-        for sayfa_no in range(sayfa_sayisi):
-            if sayfa_no > 0:
-                self.add_page()
-                self.kapi_listesi_header(sinif_adi_clean)
-                # Tablo başlıklarını tekrar yaz
-                self.set_font(self.fnt, 'B', 8)
-                for _ in range(2):
-                    self.cell(8, 7, "S.N", 1, 0, 'C')
-                    self.cell(20, 7, "No", 1, 0, 'C')
-                    self.cell(70, 7, "Adı Soyadı", 1, 0, 'C')
-                    if _ == 0: self.cell(2, 7, "", 0, 0)
-                self.ln(7)
-            
-            # Bu sayfadaki öğrenci aralığı
-            baslangic = sayfa_no * 50
-            bitis = min((sayfa_no + 1) * 50, ogrenci_sayisi)
-            
-            # İlk 25 öğrenci için
-            self.set_font(self.fnt, '', 7.5)
-            for i in range(25):
-                sira_no = baslangic + i
-                if sira_no < bitis:
-                    s = room_list.iloc[sira_no]
-                    ad_soyad = f"{s.iloc[1]} {s.iloc[2]}"
-                    ad_soyad_clean = self._clean_text(ad_soyad)
-                    self.cell(8, 6.5, str(sira_no + 1), 1, 0, 'C')
-                    self.cell(20, 6.5, str(s.iloc[0]), 1, 0, 'C')
-                    self.cell(70, 6.5, f" {ad_soyad_clean}", 1, 0, 'L')
-                else:
-                    for w in [8, 20, 70]: self.cell(w, 6.5, "", 1, 0)
-                self.cell(2, 6.5, "", 0, 0)
-                
-                # Sağ taraftaki 25 öğrenci (26-50)
-                sira_no_sag = baslangic + i + 25
-                if sira_no_sag < bitis:
-                    s = room_list.iloc[sira_no_sag]
-                    ad_soyad = f"{s.iloc[1]} {s.iloc[2]}"
-                    ad_soyad_clean = self._clean_text(ad_soyad)
-                    self.cell(8, 6.5, str(sira_no_sag + 1), 1, 0, 'C')
-                    self.cell(20, 6.5, str(s.iloc[0]), 1, 0, 'C')
-                    self.cell(70, 6.5, f" {ad_soyad_clean}", 1, 1, 'L')
-                else:
-                    for w in [8, 20, 70]: self.cell(w, 6.5, "", 1, 0)
-                    self.ln(6.5)
+import secrets
+import sqlite3
+
+from depo import SinavDeposu
+from isler import IsKuyrugu
+from olcum import Olcum, asama, gunluk_ayarla
+from okuma import DESTEKLENEN_UZANTILAR, icerik_ozeti, liste_oku
+from yerlestirme import ERISIM_SUTUNU, STRATEJILER, SUBE_SUTUNU, yeni_tohum
 
 st.set_page_config(page_title="Sınav Yoklama ve Duyuru Sistemi", layout="wide")
 st.title("🎓 Sınav Yoklama ve Duyuru Sistemi")
+# Tanılama ölçümleri biten işlerden sonra sunucu günlüğüne de yazılır (bkz. IsKuyrugu)
+gunluk_ayarla()
+
+@st.cache_data(show_spinner=False)
+def sablon_excel():
+    """Boş öğrenci listesi şablonu; indirme düğmesine tıklanınca oluşturulur (openpyxl ancak o zaman yüklenir) ve önbelleğe alınır"""
+    template_data = pd.DataFrame({
+        "No": [""],
+        "Ad": [""],
+        "Soyad": [""]
+    })
+
+    template_buffer = io.BytesIO()
+    with pd.ExcelWriter(template_buffer, engine='openpyxl') as writer:
+        template_data.to_excel(writer, index=False, sheet_name='Öğrenci Listesi')
+    return template_buffer.getvalue()
 
 with st.expander("📋 Sistem Kullanım Talimatları", expanded=False):
     col1, col2 = st.columns([2, 1])
@@ -306,30 +44,22 @@ with st.expander("📋 Sistem Kullanım Talimatları", expanded=False):
         5. Şablondaki ilgili alanlara (No, Ad, Soyad) yapıştırınız
         6. Dosyayı **"sinav_sablon_ogr_list.xlsx"** olarak kaydediniz (isim kesinlikle değiştirilmemeli)
         7. Aşağıdaki BROWSE alanından dosyayı yükleyiniz
+           **Not:** Öğrenci otomasyonundan alınan CSV (UTF-8 veya Windows-1254) ya da Parquet dosyaları da doğrudan yüklenebilir
         8. **'Tüm Belgeleri Oluştur'** butonuna basarak PDF belgelerinizi oluşturunuz
+           **Not:** Belgeler arka planda oluşturulur; ilerleme "Üretim İşleri" bölümünde sınıf sınıf izlenir. Sayfa yenilense de iş kaybolmaz, çıktı bir gün boyunca iş numarasıyla indirilebilir
+        9. Öğrenciler sınav yerlerini (sınıf, sıra) numara ve soyadlarının ilk harfleriyle sorgu sayfasından öğrenebilir: sunucuda **`python sorgu.py`** çalıştırınız
         
         **Dikkat:**
         - Şablon dosyasının ismini kesinlikle değiştirmeyiniz, aksi takdirde sistem çalışmaz
-        - Toplam sınıf kapasitesi Excel'deki öğrenci sayısı ile tam olarak eşleşmeli
-        - Örneğin, 144 öğrenci için 50-50-44 veya 48-48-48 şeklinde dağıtım yapılabilir
-        - Toplam kapasite ne eksik ne fazla olmalıdır
+        - Sınıf kapasiteleri üst sınırdır; toplam kapasite öğrenci sayısından az olmamalı
+        - Örneğin, 144 öğrenci için 50-50-50 kapasiteli üç sınıf tanımlanabilir
+        - Gelişmiş Ayarlar'dan yerleşim yöntemi seçilebilir: **Dengeli** tüm sınıfları aynı oranda doldurur, **Kısıtlı** ayrıca aynı şubedeki öğrencileri sınıflara dağıtır ve listede "Erişilebilirlik" sütunu dolu olan öğrencileri erişilebilir (♿) sınıflara yerleştirir
        """)
     
     with col2:
-        template_data = pd.DataFrame({
-            "No": [""],
-            "Ad": [""],
-            "Soyad": [""]
-        })
-
-        template_buffer = io.BytesIO()
-        with pd.ExcelWriter(template_buffer, engine='openpyxl') as writer:
-            template_data.to_excel(writer, index=False, sheet_name='Öğrenci Listesi')
-        template_buffer.seek(0)
-
         st.download_button(
             label="📥 Şablonu İndir",
-            data=template_buffer,
+            data=sablon_excel,
             file_name="sinav_sablon_ogr_list.xlsx",
             mime="application/vnd.openxmlformats-officedocument.spreadsheetml.sheet",
             use_container_width=True
@@ -340,25 +70,104 @@ st.divider()
 if 'rooms' not in st.session_state:
     st.session_state.rooms = []
 
+if 'tohum' not in st.session_state:
+    st.session_state.tohum = yeni_tohum()
+
+@st.cache_resource
+def belge_onbellegi():
+    """Değişmeyen sınıfların PDF'lerini yeniden kullanmak için paylaşılan önbellek"""
+    # uretim (fpdf, fontTools) ilk üretimde yüklenir; sayfanın ilk açılışını yavaşlatmaz
+    from uretim import BelgeOnbellegi
+    return BelgeOnbellegi()
+
+@st.cache_resource
+def sinav_deposu():
+    """Sınıf katalogları, sınav tanımları ve yerleşimler için paylaşılan SQLite deposu"""
+    return SinavDeposu()
+
+# Kenar çubuğu listeleri her rerun'da depoya gitmez; uygulamadan kayıt yapılınca
+# önbellek temizlenir, toplu_uretim.py gibi dışarıdan eklenenler ttl sonunda görünür
+@st.cache_data(ttl=60, show_spinner=False)
+def sinav_listesi():
+    """Kayıtlı sınavlar (en yeni oturum önce)"""
+    return sinav_deposu().sinavlar()
+
+@st.cache_data(ttl=60, show_spinner=False)
+def katalog_listesi():
+    """Kayıtlı sınıf kataloglarının adları"""
+    return sinav_deposu().kataloglar()
+
+@st.cache_resource
+def is_kuyrugu():
+    """Tüm oturumların paylaştığı arka plan üretim kuyruğu; biten yerleşimler depoya yazılır"""
+    return IsKuyrugu(depo=sinav_deposu())
+
+SINAV_TURLERI = ["Vize Sınavı", "Final Sınavı", "Bütünleme Sınavı", "Mazeret Sınavı", "Diğer"]
+
+# Başlık alanı → kenar çubuğundaki giriş kutusunun anahtarı
+BASLIK_GIRISLERI = {
+    "uni": "uni_inp", "fakulte": "fak_inp", "bolum": "bol_inp", "ders": "der_inp",
+    "sinav_turu": "sinav_turu_inp", "hoca": "hoc_inp", "tarih": "tar_inp", "saat": "saa_inp",
+}
+
+def kayitli_sinavi_yukle():
+    """Seçilen kayıtlı sınavın başlık alanlarını ve sınıflarını forma aktar"""
+    kayit = sinav_deposu().sinav_al(st.session_state.kayitli_sinav)
+    if kayit is None:
+        return
+    baslik, siniflar, _ = kayit
+    for alan, anahtar in BASLIK_GIRISLERI.items():
+        st.session_state[anahtar] = baslik[alan] or ""
+    if st.session_state.sinav_turu_inp not in SINAV_TURLERI:
+        st.session_state.sinav_turu_inp = "Diğer"
+    st.session_state.rooms = siniflar
+
+def katalogu_yukle():
+    st.session_state.rooms = sinav_deposu().katalog_al(st.session_state.katalog_secimi)
+
+# Tarayıcı yenilendiğinde işlerin yeniden bulunabilmesi için oturum anahtarı adreste tutulur
+if "oturum" not in st.query_params:
+    st.query_params["oturum"] = secrets.token_hex(8)
+oturum = st.query_params["oturum"]
+
 with st.sidebar:
     st.header("📋 Sınav Bilgileri")
+
+    kayitli_sinavlar = {k["id"]: k for k in sinav_listesi()}
+    if kayitli_sinavlar:
+        with st.expander("🗂️ Kayıtlı sınavdan yükle"):
+            st.selectbox(
+                "Sınav", list(kayitli_sinavlar), key="kayitli_sinav",
+                format_func=lambda i: f"{kayitli_sinavlar[i]['ders']} – {kayitli_sinavlar[i]['sinav_turu']} ({kayitli_sinavlar[i]['tarih']} {kayitli_sinavlar[i]['saat']})"
+            )
+            st.button(
+                "Bilgileri ve Sınıfları Yükle", use_container_width=True, on_click=kayitli_sinavi_yukle,
+                help="Başlık alanları ve sınıflar seçilen sınavdan doldurulur; tarih ve saati güncellemeyi unutmayın."
+            )
     
-    uni_inp = st.text_input("Üniversite", placeholder="Üniversite adını giriniz")
-    fak_inp = st.text_input("Fakülte", placeholder="Fakülte adını giriniz")
-    bol_inp = st.text_input("Bölüm", placeholder="Bölüm adını giriniz")
-    der_inp = st.text_input("Dersin Adı", placeholder="Ders adını giriniz")
+    uni_inp = st.text_input("Üniversite", placeholder="Üniversite adını giriniz", key="uni_inp")
+    fak_inp = st.text_input("Fakülte", placeholder="Fakülte adını giriniz", key="fak_inp")
+    bol_inp = st.text_input("Bölüm", placeholder="Bölüm adını giriniz", key="bol_inp")
+    der_inp = st.text_input("Dersin Adı", placeholder="Ders adını giriniz", key="der_inp")
     
-    sinav_turu_inp = st.selectbox(
-        "Sınav Türü",
-        ["Vize Sınavı", "Final Sınavı", "Bütünleme Sınavı", "Mazeret Sınavı", "Diğer"]
-    )
+    sinav_turu_inp = st.selectbox("Sınav Türü", SINAV_TURLERI, key="sinav_turu_inp")
     
-    hoc_inp = st.text_input("Öğretim Üyesi", placeholder="Öğretim üyesi adını giriniz")
-    tar_inp = st.text_input("Sınav Tarihi", placeholder="GG.AA.YYYY")
-    saa_inp = st.text_input("Sınav Saati", placeholder="SS:DD")
+    hoc_inp = st.text_input("Öğretim Üyesi", placeholder="Öğretim üyesi adını giriniz", key="hoc_inp")
+    tar_inp = st.text_input("Sınav Tarihi", placeholder="GG.AA.YYYY", key="tar_inp")
+    saa_inp = st.text_input("Sınav Saati", placeholder="SS:DD", key="saa_inp")
     
     st.divider()
     st.subheader("🏫 Sınıf Tanımlama")
+
+    kataloglar = katalog_listesi()
+    if kataloglar:
+        k1, k2 = st.columns([3, 1])
+        with k1:
+            st.selectbox("Kayıtlı sınıf kataloğu", kataloglar, key="katalog_secimi")
+        with k2:
+            st.write("")
+            st.write("")
+            st.button("Yükle", use_container_width=True, on_click=katalogu_yukle, key="katalog_yukle")
     
     c1, c2, c3 = st.columns([2, 1, 1])
     with c1:
@@ -368,12 +177,14 @@ with st.sidebar:
     with c3:
         st.write("")
         st.write("")
-        if st.button("Ekle", type="primary", use_container_width=True):
-            if rn:
-                st.session_state.rooms.append({"Ad": rn, "Kap": int(rc)})
-                st.rerun()
-            else:
-                st.warning("Lütfen sınıf adı giriniz")
+        ekle = st.button("Ekle", type="primary", use_container_width=True)
+    erisilebilir_inp = st.checkbox("♿ Erişilebilir sınıf", key="erisilebilir")
+    if ekle:
+        if rn:
+            st.session_state.rooms.append({"Ad": rn, "Kap": int(rc), "Erisilebilir": bool(erisilebilir_inp)})
+            st.rerun()
+        else:
+            st.warning("Lütfen sınıf adı giriniz")
     
     if st.session_state.rooms:
         st.divider()
@@ -386,7 +197,7 @@ with st.sidebar:
             cols = st.columns(3)
             for idx, r in enumerate(st.session_state.rooms):
                 with cols[idx % 3]:
-                    st.info(f"**{r['Ad']}**\n({r['Kap']} kişi)")
+                    st.info(f"**{r['Ad']}**{' ♿' if r.get('Erisilebilir') else ''}\n({r['Kap']} kişi)")
                 total_capacity += r['Kap']
         
         st.info(f"**Toplam Kapasite:** {total_capacity} öğrenci")
@@ -395,33 +206,116 @@ with st.sidebar:
             st.session_state.rooms = []
             st.rerun()
 
+        with st.expander("💾 Sınıfları katalog olarak kaydet"):
+            katalog_adi = st.text_input("Katalog adı", placeholder="ör. Mühendislik A Blok")
+            if st.button("Kaydet", use_container_width=True, key="katalog_kaydet"):
+                try:
+                    sinav_deposu().katalog_kaydet(katalog_adi, st.session_state.rooms)
+                    katalog_listesi.clear()
+                    st.success(f"'{katalog_adi.strip()}' kataloğu kaydedildi.")
+                except ValueError as e:
+                    st.warning(str(e))
+    
+    st.divider()
+    with st.expander("⚙️ Gelişmiş Ayarlar"):
+        cikti_inp = st.radio(
+            "Çıktı biçimi", ["zip", "pdf"],
+            format_func=lambda x: {"zip": "ZIP (her liste ayrı PDF)", "pdf": "Tek PDF (sınıf yer imli, tek seferde yazdırılır)"}[x],
+        )
+        is_sayisi_inp = st.number_input(
+            "Paralel işçi sayısı", 1, is_kuyrugu().surec_sayisi, 1, disabled=cikti_inp == "pdf",
+            help="1'den büyükse her sınıfın yoklama ve kapı listeleri ayrı süreçlerde oluşturulur. "
+                 "İşçi süreçleri tüm kullanıcıların işleri arasında paylaşılır."
+        )
+        sikistirma_inp = st.selectbox(
+            "ZIP sıkıştırma", ["deflate", "stored"], disabled=cikti_inp == "pdf",
+            format_func=lambda x: {"deflate": "DEFLATE", "stored": "STORED (sıkıştırmasız, daha hızlı)"}[x],
+            help="PDF'ler zaten sıkıştırılmış olduğundan DEFLATE boyutu çok az küçültür."
+        )
+        seviye_inp = st.slider("Sıkıştırma seviyesi", 1, 9, 6, disabled=sikistirma_inp == "stored" or cikti_inp == "pdf")
+        strateji_inp = st.selectbox(
+            "Yerleşim yöntemi", list(STRATEJILER),
+            format_func=lambda x: STRATEJILER[x].aciklama,
+            help=f"Kısıtlı yöntem listedeki '{SUBE_SUTUNU}' ve '{ERISIM_SUTUNU}' sütunlarını kullanır."
+        )
+        pano_sutunu_inp = st.radio(
+            "Pano listesi sütun sayısı", [1, 2, 3], horizontal=True,
+            help="Kalabalık sınavlarda 2 veya 3 sütun sayfa sayısını azaltır. Her sayfada başlıklar tekrarlanır; en sonda harf dizini yer alır."
+        )
+        st.number_input(
+            "Yerleşim tohumu", 0, 2**31 - 1, key="tohum",
+            help="Aynı öğrenci listesi ve aynı tohum her zaman aynı yerleşimi verir."
+        )
+        st.button(
+            "🎲 Yeni Yerleşim", use_container_width=True,
+            on_click=lambda: st.session_state.update(tohum=yeni_tohum())
+        )
+        tanilama_inp = st.checkbox(
+            "🩺 Tanılama ölçümleri",
+            help="Her aşama ve sınıf için süre, işlemci süresi, sayfa sayısı ve boyut kaydedilir; sonuçlar Tanılama panelinde gösterilir."
+        )
+        bellek_inp = st.checkbox(
+            "Tepe bellek ölçümü (tracemalloc)", disabled=not tanilama_inp,
+            help="Üretimi belirgin şekilde yavaşlatır."
+        )
+        profil_inp = st.checkbox(
+            "cProfile profili al", disabled=not tanilama_inp,
+            help="Tek bir üretim çalışmasının profilini alır; paralel işçi süreçler profile dahil edilmez."
+        )
+
+# Okuma ve üretim aynı ölçüm nesnesine kaydedilir
+olcum = Olcum(bellek=bellek_inp) if tanilama_inp else None
+
+@st.cache_data(max_entries=16, show_spinner=False)
+def ogrenci_listesi_yukle(ozet, _veri, dosya_adi):
+    """Yüklenen listeyi içerik özetine göre önbelleğe alarak bir kez oku"""
+    return liste_oku(_veri, dosya_adi)
+
 st.subheader("📤 Excel Dosyasını Yükleme")
-uploaded_file = st.file_uploader("Öğrenci listesi Excel dosyasını yükleyin (sinav_sablon_ogr_list.xlsx)", type=["xlsx"])
+uploaded_file = st.file_uploader(
+    "Öğrenci listesi Excel dosyasını yükleyin (sinav_sablon_ogr_list.xlsx). Öğrenci otomasyonundan alınan CSV veya Parquet dosyaları da kabul edilir.",
+    type=DESTEKLENEN_UZANTILAR
+)
 
+df = None
 if uploaded_file:
     try:
-        if uploaded_file.name != "sinav_sablon_ogr_list.xlsx":
+        if uploaded_file.name.lower().endswith(".xlsx") and uploaded_file.name != "sinav_sablon_ogr_list.xlsx":
             st.warning("Lütfen indirdiğiniz şablon dosyasını değiştirmeden kullanın. Dosya adı 'sinav_sablon_ogr_list.xlsx' olmalıdır.")
         
-        df = pd.read_excel(uploaded_file)
+        # Liste dosya değiştiğinde bir kez okunur; kenar çubuğundaki düzenlemelerle gelen
+        # rerun'lar özet hesaplamaz ve DataFrame'i önbellekten kopyalamaz
+        if st.session_state.get('liste_kimligi') != uploaded_file.file_id:
+            veri = uploaded_file.getvalue()
+            with asama(olcum, 'okuma', dosya=uploaded_file.name) as ek:
+                st.session_state.liste = ogrenci_listesi_yukle(icerik_ozeti(veri), veri, uploaded_file.name)
+                ek['bayt'] = len(veri)
+            st.session_state.liste_kimligi = uploaded_file.file_id
+        elif olcum is not None:
+            olcum.ekle('okuma', bayt=uploaded_file.size, dosya=uploaded_file.name, onbellek=True)
+        df = st.session_state.liste
         
         if len(df.columns) >= 3:
             st.success(f"✅ {len(df)} öğrenci başarıyla yüklendi!")
             
             if st.session_state.rooms:
                 total_capacity = sum(r['Kap'] for r in st.session_state.rooms)
-                if total_capacity != len(df):
-                    st.error(f"⚠️ Uyarı: Toplam sınıf kapasitesi ({total_capacity}) öğrenci sayısı ({len(df)}) ile uyuşmuyor!")
-                    st.info(f"Lütfen sınıf kapasitelerini toplamı {len(df)} olacak şekilde düzenleyin.")
+                if total_capacity < len(df):
+                    st.error(f"⚠️ Uyarı: Toplam sınıf kapasitesi ({total_capacity}) öğrenci sayısından ({len(df)}) az!")
+                    st.info(f"Lütfen en az {len(df) - total_capacity} kişilik daha sınıf ekleyin.")
                 else:
-                    st.success(f"✓ Sınıf kapasitesi ({total_capacity}) öğrenci sayısı ile uyuşuyor.")
+                    st.success(f"✓ Sınıf kapasitesi ({total_capacity}) yeterli, {total_capacity - len(df)} boş yer kalacak.")
         else:
-            st.error("Excel dosyasında en az 3 sütun (No, Ad, Soyad) olmalıdır.")
+            st.error("Öğrenci listesinde en az 3 sütun (No, Ad, Soyad) olmalıdır.")
+            df = None
     except Exception as e:
         st.error(f"Dosya okunurken hata oluştu: {str(e)}")
+        df = None
+elif 'liste' in st.session_state:
+    # Dosya kaldırıldı; okunan liste oturumda tutulmasın
+    del st.session_state['liste'], st.session_state['liste_kimligi']
 
-if uploaded_file and st.session_state.rooms:
-    df = pd.read_excel(uploaded_file)
+if df is not None and st.session_state.rooms:
     total_capacity = sum(r['Kap'] for r in st.session_state.rooms)
     
     required_fields = [uni_inp, fak_inp, bol_inp, der_inp, sinav_turu_inp, hoc_inp, tar_inp, saa_inp]
@@ -434,108 +328,177 @@ if uploaded_file and st.session_state.rooms:
     
     if missing_fields:
         st.error(f"Lütfen aşağıdaki alanları doldurun: {', '.join(missing_fields)}")
-    elif total_capacity == len(df):
+    elif total_capacity >= len(df):
         if st.button("🚀 Tüm Belgeleri Oluştur", type="primary", use_container_width=True):
-            with st.spinner("Belgeler oluşturuluyor..."):
-                shuffled = df.sample(frac=1).reset_index(drop=True)
-                zip_buffer = io.BytesIO()
-                
-                with zipfile.ZipFile(zip_buffer, "a", zipfile.ZIP_DEFLATED, False) as zip_file:
-                    ptr = 0
-                    all_assigned_students = []
-
-                    for room in st.session_state.rooms:
-                        end_ptr = ptr + room['Kap']
-                        room_list = shuffled.iloc[ptr:end_ptr].sort_values(by=df.columns[0]).reset_index(drop=True)
-                        ptr = end_ptr
-                        
-                        temp_df = room_list.copy()
-                        temp_df['Sınıf'] = room['Ad']
-                        all_assigned_students.append(temp_df)
-
-                        # YOKLAMA PDF
-                        pdf = SinavPDF(uni_inp, fak_inp, bol_inp, der_inp, sinav_turu_inp, tar_inp, saa_inp, hoc_inp)
-                        pdf.add_page()
-                        pdf.yoklama_header(room['Ad'])
-                        pdf.yoklama_tablo(room_list, room['Ad'])
-
-                        pdf_output = pdf.output()
-                        if isinstance(pdf_output, str): 
-                            pdf_output = pdf_output.encode('latin-1', 'replace')
-                        zip_file.writestr(f"Yoklama_{room['Ad']}.pdf", pdf_output)
-
-                        # KAPI LİSTESİ PDF
-                        pdf_kapi = SinavPDF(uni_inp, fak_inp, bol_inp, der_inp, sinav_turu_inp, tar_inp, saa_inp, hoc_inp)
-                        pdf_kapi.add_page()
-                        pdf_kapi.kapi_listesi_header(room['Ad'])
-                        pdf_kapi.kapi_listesi_tablo(room_list, room['Ad'])
-
-                        kapi_output = pdf_kapi.output()
-                        if isinstance(kapi_output, str): 
-                            kapi_output = kapi_output.encode('latin-1', 'replace')
-                        zip_file.writestr(f"Kapi_Listesi_{room['Ad']}.pdf", kapi_output)
-
-                    # PANO LİSTESİ
-                    pano_df = pd.concat(all_assigned_students).reset_index(drop=True)
-                    pano_df['Siralama_Anahtari'] = pano_df.iloc[:, 2].apply(turkce_sirala_anahtar)
-                    pano_df = pano_df.sort_values(by='Siralama_Anahtari').reset_index(drop=True)
-                    pano_df.insert(0, 'Sıra', range(1, len(pano_df) + 1))
-                    
-                    pdf_p = SinavPDF(uni_inp, fak_inp, bol_inp, der_inp, sinav_turu_inp, tar_inp, saa_inp, hoc_inp)
-                    pdf_p.add_page()
-                    pdf_p.set_font(pdf_p.fnt, 'B', 12)
-                    
-                    # Pano başlığı için temizlenmiş metin
-                    der_clean = pdf_p._clean_text(der_inp)
-                    sinav_turu_clean = pdf_p._clean_text(sinav_turu_inp)
-                    pdf_p.cell(0, 10, f"{der_clean} {sinav_turu_clean} YERLEŞİM PLANI", ln=True, align='C')
-                    pdf_p.ln(5)
-                    
-                    pdf_p.set_font(pdf_p.fnt, 'B', 9)
-                    pdf_p.cell(15, 8, "Sıra", 1, 0, 'C')
-                    pdf_p.cell(25, 8, "No", 1, 0, 'C')
-                    pdf_p.cell(50, 8, "Adı", 1)
-                    pdf_p.cell(50, 8, "Soyadı", 1)
-                    pdf_p.cell(25, 8, "SINIF", 1, 1, 'C')
-                    
-                    pdf_p.set_font(pdf_p.fnt, '', 7.5)
-                    for r in pano_df.itertuples(index=False):
-                        # r[0]: Sıra, r[1]: No, r[2]: Ad, r[3]: Soyad, r[4]: Sınıf
-                        ad_clean = pdf_p._clean_text(str(r[2]))
-                        soyad_clean = pdf_p._clean_text(str(r[3]))
-                        sinif_clean = pdf_p._clean_text(str(r[4]))
-                        pdf_p.cell(15, 7, str(r[0]), 1, 0, 'C')
-                        pdf_p.cell(25, 7, str(r[1]), 1, 0, 'C')
-                        pdf_p.cell(50, 7, f" {ad_clean}", 1)
-                        pdf_p.cell(50, 7, f" {soyad_clean}", 1)
-                        pdf_p.cell(25, 7, f" {sinif_clean}", 1, 1, 'C')
-                    
-                    p_output = pdf_p.output()
-                    if isinstance(p_output, str): 
-                        p_output = p_output.encode('latin-1', 'replace')
-                    zip_file.writestr("Pano_Listesi.pdf", p_output)
-
-            st.success("✅ Tüm belgeler başarıyla oluşturuldu!")
-            
+            baslik = {
+                "uni": uni_inp, "fakulte": fak_inp, "bolum": bol_inp, "ders": der_inp,
+                "sinav_turu": sinav_turu_inp, "tarih": tar_inp, "saat": saa_inp, "hoca": hoc_inp,
+            }
+            tohum = int(st.session_state.tohum)
+            # Sınav tanımı depoya kaydedilir; iş bitince yerleşim de bu kayda yazılır
+            try:
+                sinav_id = sinav_deposu().sinav_kaydet(baslik, st.session_state.rooms, tohum, strateji_inp)
+                sinav_listesi.clear()
+            except sqlite3.Error as e:
+                sinav_id = None
+                st.warning(f"Sınav kaydedilemedi, belgeler yine de oluşturulacak: {e}")
+            # Üretim arka planda çalışır; sayfa beklemez, ilerleme aşağıdaki iş listesinde izlenir
+            try:
+                is_ = is_kuyrugu().gonder(
+                    oturum, baslik, df, st.session_state.rooms,
+                    cikti=cikti_inp, tohum=tohum, strateji=strateji_inp,
+                    pano_sutunu=pano_sutunu_inp, is_sayisi=int(is_sayisi_inp),
+                    sikistirma=sikistirma_inp, seviye=seviye_inp, onbellek=belge_onbellegi(),
+                    olcum=olcum, profil=olcum is not None and profil_inp, sinav_id=sinav_id,
+                )
+                # Ölçüm nesnesi artık işe ait; iş bitince kapatılır
+                olcum = None
+                st.toast(f"İş kuyruğa eklendi: {is_.no}")
+            except ValueError as e:
+                st.error(str(e))
+    else:
+        st.warning("Lütfen toplam kapasite öğrenci sayısını karşılayacak kadar sınıf ekleyin.")
+
+if olcum is not None:
+    olcum.kapat()
+
+
+def tanilama_goster(is_, yer):
+    """İşin aşama ölçümleri ve (varsa) profili"""
+    olcum = is_.olcum
+    with st.expander("🩺 Tanılama", expanded=True):
+        tepe_rss = olcum.tepe_rss()
+        st.markdown(
+            f"**Toplam üretim süresi:** {is_.sure:.2f} sn"
+            + (f" | **Süreç tepe belleği (RSS):** {tepe_rss / 2**20:.0f} MiB" if tepe_rss else "")
+        )
+        ozet = pd.DataFrame(olcum.ozet())
+        ozet["duvar"] = ozet["duvar"].round(3)
+        ozet["cpu"] = ozet["cpu"].round(3)
+        st.dataframe(ozet, use_container_width=True, hide_index=True)
+        siniflar = pd.DataFrame([k for k in olcum.sozluk_satirlari() if k["asama"] in ("sinif", "havuz_sinif")])
+        if not siniflar.empty:
+            st.caption("Sınıf başına (en yavaştan hızlıya)")
+            st.dataframe(siniflar.sort_values("duvar", ascending=False), use_container_width=True, hide_index=True)
+        # İş listesi her saniye yeniden çizilir; indirme içerikleri yalnızca tıklanınca hazırlanır
+        st.download_button(
+            "📥 Ölçümleri İndir (JSON satırları)", lambda: olcum.json_satirlari(**is_.ortak_alanlar()),
+            file_name=f"olcumler_{is_.no}.jsonl", mime="application/x-ndjson", key=f"{yer}_olcum_{is_.no}"
+        )
+        if is_.profil is not None:
+            st.code(is_.profil.metin(), language=None)
             st.download_button(
-                label="📥 Tüm Belgeleri İndir (ZIP)",
-                data=zip_buffer.getvalue(),
-                file_name="sinav_belgeleri.zip",
-                mime="application/zip",
-                use_container_width=True
+                "📥 Profili İndir (.prof)", is_.profil.bayt,
+                file_name=f"uretim_{is_.no}.prof", mime="application/octet-stream", key=f"{yer}_profil_{is_.no}"
             )
-            
-            st.info(f"""
-            **Oluşturulan Dosyalar:**
-            - Yoklama Listeleri: {len(st.session_state.rooms)} adet (her biri gerekirse çok sayfalı)
-            - Kapı Listeleri: {len(st.session_state.rooms)} adet (her biri gerekirse çok sayfalı)  
-            - Pano Listesi: 1 adet (Türkçe alfabetik sıralı)
-            
-            **Toplam:** {2*len(st.session_state.rooms) + 1} PDF dosyası
-            **Not:** Büyük sınıflar için otomatik çok sayfalı PDF'ler oluşturuldu.
-            """)
+
+
+def dosya_okuyucu(yol):
+    """Dosyayı yalnızca indirme düğmesine tıklandığında okuyan fonksiyon.
+
+    İş listesi her saniye yeniden çizilir; çıktı her seferinde belleğe
+    okunmaz ve Streamlit'in dosya deposunda tutulmaz.
+    """
+    def oku():
+        with open(yol, "rb") as f:
+            return f.read()
+    return oku
+
+
+def is_sonucu_goster(is_, yer):
+    """Biten işin indirme düğmesi ve özeti"""
+    sonuc = is_.sonuc
+    st.success(f"✅ Tüm belgeler başarıyla oluşturuldu! ({is_.sure:.1f} sn)")
+    st.download_button(
+        label=f"📥 Tüm Belgeleri İndir ({'PDF' if is_.cikti == 'pdf' else 'ZIP'})",
+        data=dosya_okuyucu(is_.dosya),
+        file_name=is_.dosya_adi,
+        mime=is_.mime,
+        use_container_width=True,
+        key=f"{yer}_indir_{is_.no}"
+    )
+
+    if is_.cikti == "pdf":
+        st.info(f"""
+        **Oluşturulan Dosya:** Tek PDF ({os.path.getsize(is_.dosya) // 1024} KB)
+        - {sonuc['sinif_sayisi']} sınıfın yoklama ve kapı listeleri (her sınıf için yer imi)
+        - Pano Listesi (Türkçe alfabetik sıralı, {sonuc['pano_sutunu']} sütunlu, harf dizinli, en sonda)
+        """)
     else:
-        st.warning("Lütfen önce sınıf kapasitelerini öğrenci sayısı ile eşleştirin.")
+        st.info(f"""
+        **Oluşturulan Dosyalar:**
+        - Yoklama Listeleri: {sonuc['sinif_sayisi']} adet (her biri gerekirse çok sayfalı)
+        - Kapı Listeleri: {sonuc['sinif_sayisi']} adet (her biri gerekirse çok sayfalı)  
+        - Pano Listesi: 1 adet (Türkçe alfabetik sıralı, {sonuc['pano_sutunu']} sütunlu, harf dizinli)
+
+        **Toplam:** {sonuc['dosya_sayisi']} PDF dosyası
+        **Not:** Büyük sınıflar için otomatik çok sayfalı PDF'ler oluşturuldu.
+        """)
+
+    yeniden = sonuc['yeniden']
+    st.caption(
+        f"Yerleşim tohumu: {sonuc['tohum']} ({'PDF anahtar kelimelerine' if is_.cikti == 'pdf' else 'ZIP açıklamasına'} da yazıldı)"
+        + (f" | Değişmeyen {yeniden} sınıf/pano belgesi yeniden kullanıldı" if yeniden else "")
+        + (f" | Yerleşim {sonuc['sinav_id']} numaralı sınav kaydına yazıldı" if sonuc.get('sinav_id') and not is_.uyari else "")
+    )
+    if is_.uyari:
+        st.warning(is_.uyari)
+    if is_.olcum is not None:
+        tanilama_goster(is_, yer)
+
+
+def is_karti(is_, yer):
+    """Bir işin durumu: sırada, çalışıyor (sınıf sınıf ilerleme), hata veya sonuç"""
+    with st.container(border=True):
+        st.markdown(
+            f"**{is_.baslik['ders']} – {is_.baslik['sinav_turu']}** · İş no: `{is_.no}` · "
+            + ("Tek PDF" if is_.cikti == "pdf" else "ZIP")
+        )
+        if is_.durum == "sirada":
+            st.info(
+                f"⏳ Sırada, önünde {is_kuyrugu().sira(is_)} iş var"
+                + (" (kalabalık sınavlar ayrı kuyrukta çalışır)" if is_.buyuk else "")
+            )
+        elif is_.durum == "calisiyor":
+            son = ", ".join(is_.biten[-5:])
+            st.progress(
+                is_.ilerleme,
+                text=f"Belgeler oluşturuluyor: {len(is_.biten)}/{is_.toplam} sınıf hazır ({is_.sure:.0f} sn)"
+                + (f" — son biten: {son}" if son else "")
+            )
+        elif is_.durum == "hata":
+            st.error(is_.hata)
+        else:
+            is_sonucu_goster(is_, yer)
+
+
+isler = is_kuyrugu().oturum_isleri(oturum)
+if isler:
+    st.divider()
+    st.subheader("📦 Üretim İşleri")
+    izleniyor = any(i.aktif for i in isler)
+
+    # Çalışan iş varken yalnızca bu bölüm saniyede bir yenilenir
+    @st.fragment(run_every=1.0 if izleniyor else None)
+    def is_listesi():
+        isler = is_kuyrugu().oturum_isleri(oturum)
+        for is_ in isler:
+            is_karti(is_, "liste")
+        if izleniyor and not any(i.aktif for i in isler):
+            # Son iş bitti: yenilemeyi durdurmak için sayfa bir kez yeniden çalıştırılır
+            st.rerun()
+
+    is_listesi()
+
+with st.expander("🔎 İş numarasıyla indir"):
+    st.caption("Tarayıcı kapansa da işler ve çıktıları bir gün boyunca iş numarasıyla indirilebilir.")
+    aranan = st.text_input("İş numarası", placeholder="ör. 3f9a1c2b7d4e")
+    if aranan:
+        bulunan = is_kuyrugu().al(aranan)
+        if bulunan is None:
+            st.warning("Bu numarada bir iş bulunamadı (süresi dolmuş olabilir).")
+        else:
+            is_karti(bulunan, "arama")
 
 st.divider()
 st.caption("📧 [Designed by Refik YASLIKAYA](mailto:refik@kku.edu.tr) | Sınav Yoklama ve Duyuru Sistemi v1.0")
\ No newline at end of file
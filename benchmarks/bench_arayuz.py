@@ -0,0 +1,148 @@
+"""Streamlit arayüzünün ilk çizim ve yeniden çalıştırma (rerun) sürelerini ölçer.
+
+Kullanım:
+    python benchmarks/bench_arayuz.py [--soguk 3] [--rerun 20] [--kisi 2000] [--json sonuc.json]
+
+    ilk_cizim   yeni bir süreçte app.py'nin ilk çalıştırılması (modül içe
+                aktarmaları dahil; streamlit'in kendisi önceden yüklenir)
+    rerun       kenar çubuğunda bir alan değiştirildiğinde betiğin yeniden
+                çalışması; liste yüklenmemişken ve --kisi öğrencilik liste
+                yüklüyken ayrı ayrı ölçülür
+
+Ölçüm streamlit.testing AppTest ile tarayıcısız yapılır; süreler sunucu
+tarafındaki betik süresidir (ağ ve tarayıcı çizimi hariç). İlk çizimden
+sonra fpdf, fontTools ve openpyxl modüllerinin yüklenip yüklenmediği de
+yazdırılır. Depo ve iş klasörü geçici bir klasörde tutulur.
+"""
+import argparse
+import json
+import os
+import statistics
+import subprocess
+import sys
+import tempfile
+import time
+import warnings
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK)
+
+UYGULAMA = os.path.join(KOK, "app.py")
+AGIR_MODULLER = ("fpdf", "fontTools", "openpyxl")
+
+
+def ilk_cizim():
+    """Bu süreçte app.py'yi ilk kez çalıştırır; (süre, yüklenen ağır modüller) döndürür"""
+    from streamlit.testing.v1 import AppTest
+    at = AppTest.from_file(UYGULAMA, default_timeout=120)
+    t0 = time.perf_counter()
+    at.run()
+    sure = time.perf_counter() - t0
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return sure, [m for m in AGIR_MODULLER if m in sys.modules]
+
+
+def liste_yukle(kisi):
+    """st.file_uploader'ı kisi öğrencilik sentetik bir şablon dosyası döndürecek şekilde değiştirir"""
+    import io
+
+    import streamlit as st
+    from sentetik import sentetik_liste
+
+    arabellek = io.BytesIO()
+    sentetik_liste(kisi).to_excel(arabellek, index=False)
+    veri = arabellek.getvalue()
+
+    class Dosya:
+        name = "sinav_sablon_ogr_list.xlsx"
+        file_id = "bench-liste"
+        size = len(veri)
+
+        def getvalue(self):
+            return veri
+
+    st.file_uploader = lambda *a, **k: Dosya()
+
+
+def derleme_onbellegi_paylas():
+    """Sunucu derlenmiş betiği rerun'lar arasında saklar; AppTest ise her çalıştırmada yeniden derler.
+
+    Rerun ölçümüne derleme süresinin karışmaması için tek bir ScriptCache paylaştırılır.
+    """
+    from streamlit.runtime.scriptrunner.script_cache import ScriptCache
+    from streamlit.testing.v1 import app_test, local_script_runner
+    paylasilan = ScriptCache()
+    app_test.ScriptCache = local_script_runner.ScriptCache = lambda: paylasilan
+
+
+def rerun_olc(adet, kisi=None):
+    """Kenar çubuğundaki ders adı her seferinde değiştirilerek adet rerun ölçülür"""
+    from streamlit.testing.v1 import AppTest
+    if kisi:
+        liste_yukle(kisi)
+    at = AppTest.from_file(UYGULAMA, default_timeout=120)
+    at.session_state.rooms = [{"Ad": f"A{i}", "Kap": 60, "Erisilebilir": False} for i in range(1, (kisi or 0) // 50 + 3)]
+    at.run()
+    sureler = []
+    for i in range(adet):
+        at.sidebar.text_input(key="der_inp").set_value(f"Veri Yapıları {i}")
+        t0 = time.perf_counter()
+        at.run()
+        sureler.append(time.perf_counter() - t0)
+    if at.exception:
+        raise RuntimeError(at.exception[0].value)
+    return sureler
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--soguk", type=int, default=3, help="İlk çizim ölçümü sayısı (her biri yeni süreçte)")
+    parser.add_argument("--rerun", type=int, default=20, help="Senaryo başına rerun sayısı")
+    parser.add_argument("--kisi", type=int, default=2000, help="Yüklü liste senaryosundaki öğrenci sayısı")
+    parser.add_argument("--json", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--ilk-cizim", action="store_true", help=argparse.SUPPRESS)
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore")
+
+    if args.ilk_cizim:
+        import streamlit  # noqa: F401  (sunucuda da önceden yüklüdür)
+        sure, moduller = ilk_cizim()
+        print(json.dumps({"sure": sure, "moduller": moduller}))
+        return
+
+    klasor = tempfile.mkdtemp(prefix="bench_arayuz_")
+    os.environ["SINAV_DEPO_YOLU"] = os.path.join(klasor, "depo.db")
+    os.environ["SINAV_IS_KLASORU"] = os.path.join(klasor, "isler")
+
+    from streamlit.logger import set_log_level
+    set_log_level("error")
+    derleme_onbellegi_paylas()
+
+    soguk = []
+    for _ in range(args.soguk):
+        cikti = subprocess.run(
+            [sys.executable, os.path.abspath(__file__), "--ilk-cizim"],
+            capture_output=True, text=True, check=True, cwd=KOK,
+        ).stdout
+        soguk.append(json.loads(cikti.strip().splitlines()[-1]))
+    ilk = sorted(s["sure"] for s in soguk)
+    print(f"İlk çizim: en iyi {ilk[0] * 1000:.0f} ms, ortanca {statistics.median(ilk) * 1000:.0f} ms "
+          f"(yüklenen: {', '.join(soguk[-1]['moduller']) or 'hiçbiri'})")
+
+    sonuc = {"ilk_cizim_ms": [1000 * s for s in ilk], "ilk_cizim_moduller": soguk[-1]["moduller"], "rerun": {}}
+    for ad, kisi in (("bos", None), ("liste", args.kisi)):
+        sureler = sorted(rerun_olc(args.rerun, kisi))
+        sonuc["rerun"][ad] = {
+            "kisi": kisi, "ortanca_ms": 1000 * statistics.median(sureler), "en_kotu_ms": 1000 * sureler[-1],
+        }
+        print(f"Rerun ({'liste yok' if kisi is None else f'{kisi} öğrencilik liste yüklü'}): "
+              f"ortanca {sonuc['rerun'][ad]['ortanca_ms']:.1f} ms, en kötü {sonuc['rerun'][ad]['en_kotu_ms']:.1f} ms")
+
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(sonuc, f, ensure_ascii=False, indent=2)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,82 @@
+"""SinavPDF font önbelleğinin belge oluşturma süresine ve boyutuna etkisini ölçer.
+
+Kullanım:
+    python benchmarks/bench_font_onbellegi.py [--sinif 30] [--kisi 50]
+
+"Önbelleksiz" satırı eski davranışı taklit eder: her belge için TTF dosyaları
+add_font ile yeniden ayrıştırılır ve tam font üzerinden alt küme oluşturulur.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from sinav_pdf import FONT_ADAYLARI, font_sablonlari
+from uretim import pdf_bayt, uretim_zamani, yeni_pdf
+
+BASLIK = {
+    "uni": "Kırıkkale Üniversitesi", "fakulte": "Mühendislik Fakültesi",
+    "bolum": "Bilgisayar Mühendisliği", "ders": "Veri Yapıları", "sinav_turu": "Final Sınavı",
+    "tarih": "15.01.2025", "saat": "10:00", "hoca": "Dr. Öğr. Üyesi Ayşe Yılmaz",
+}
+
+
+def ornek_liste(kisi):
+    adlar = ["Ahmet", "Ayşe", "Çağrı", "Gülşen", "İsmail", "Ömer", "Şükrü", "Ümmü", "Işıl"]
+    soyadlar = ["Yılmaz", "Öztürk", "Çelik", "Şahin", "Doğan", "Güneş", "Işık", "İnce", "Ağaoğlu"]
+    return pd.DataFrame({
+        "No": [str(230000000 + i) for i in range(kisi)],
+        "Ad": [adlar[i % len(adlar)] for i in range(kisi)],
+        "Soyad": [soyadlar[(i * 7) % len(soyadlar)] for i in range(kisi)],
+    })
+
+
+def belge(tur, sinif_adi, room_list, zaman, onbellek):
+    pdf = yeni_pdf(BASLIK, zaman)
+    if not onbellek:
+        aile, normal, kalin = FONT_ADAYLARI[0]
+        pdf.fonts.clear()
+        pdf.add_font(aile, '', normal)
+        pdf.add_font(aile, 'B', kalin)
+    pdf.add_page()
+    if tur == 'yoklama':
+        pdf.yoklama_header(sinif_adi)
+        pdf.yoklama_tablo(room_list, sinif_adi)
+    else:
+        pdf.kapi_listesi_header(sinif_adi)
+        pdf.kapi_listesi_tablo(room_list, sinif_adi)
+    return pdf_bayt(pdf)
+
+
+def olc(sinif, room_list, onbellek):
+    zaman = uretim_zamani()
+    font_sablonlari.cache_clear()
+    boyut = 0
+    t0 = time.perf_counter()
+    for i in range(sinif):
+        for tur in ('yoklama', 'kapi'):
+            boyut += len(belge(tur, f"A{i}", room_list, zaman, onbellek))
+    return time.perf_counter() - t0, boyut
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sinif", type=int, default=30)
+    parser.add_argument("--kisi", type=int, default=50)
+    args = parser.parse_args()
+
+    room_list = ornek_liste(args.kisi)
+    belge = 2 * args.sinif
+    print(f"{args.sinif} sınıf x {args.kisi} öğrenci, {belge} belge")
+    for ad, onbellek in (("önbelleksiz", False), ("önbellekli", True)):
+        sure, boyut = olc(args.sinif, room_list, onbellek)
+        print(f"{ad:12s} {sure:7.2f} sn  {1000 * sure / belge:7.1f} ms/belge  "
+              f"{boyut / 1024:9.1f} KiB toplam  {boyut / belge / 1024:6.1f} KiB/belge")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,93 @@
+"""Öğrenci listesi okuma süresini dosya biçimine göre karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_okuma.py [--satir 50000]
+"""
+import argparse
+import io
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+import okuma
+
+ADLAR = ["Ahmet", "Ayşe", "Çağrı", "Gülşen", "İsmail", "Ömer", "Şükrü", "Ümmü", "Işıl", "Ilgaz"]
+SOYADLAR = ["Yılmaz", "Öztürk", "Çelik", "Şahin", "Doğan", "Güneş", "Işık", "İnce", "Ağaoğlu", "Ünlü"]
+
+
+def ornek_tablo(satir, tohum=0):
+    rnd = random.Random(tohum)
+    return pd.DataFrame({
+        "No": [f"{rnd.randrange(10**8):09d}" for _ in range(satir)],
+        "Ad": [rnd.choice(ADLAR) for _ in range(satir)],
+        "Soyad": [rnd.choice(SOYADLAR) for _ in range(satir)],
+    })
+
+
+def dosyalar(df):
+    xlsx = io.BytesIO()
+    df.to_excel(xlsx, index=False)
+    sonuc = {
+        "xlsx (openpyxl)": ("liste.xlsx", xlsx.getvalue()),
+        "csv utf-8 ,": ("liste.csv", df.to_csv(index=False).encode("utf-8")),
+        "csv cp1254 ;": ("liste.csv", df.to_csv(index=False, sep=";").encode("cp1254")),
+    }
+    if okuma.PYARROW_VAR:
+        parquet = io.BytesIO()
+        df.to_parquet(parquet, index=False)
+        sonuc["parquet (pyarrow)"] = ("liste.parquet", parquet.getvalue())
+    return sonuc
+
+
+def yinelenen_basliklar():
+    """Boş ve yinelenen başlıklı CSV her iki okuyucuyla da aynı, tekil sütunlarla okunmalı"""
+    veri = "Öğrenci No;Ad;Soyad;Ad;;Not\n0123;Ali;Kaya;Veli;x;y\n".encode("utf-8")
+    pyarrow_var = okuma.PYARROW_VAR
+    try:
+        okunanlar = []
+        for okuyucu in ([True, False] if pyarrow_var else [False]):
+            okuma.PYARROW_VAR = okuyucu
+            okunanlar.append(okuma.liste_oku(veri, "liste.csv"))
+    finally:
+        okuma.PYARROW_VAR = pyarrow_var
+    for df in okunanlar:
+        assert list(df.columns) == ["No", "Ad", "Soyad", "Ad.1", "Unnamed: 4", "Not"], list(df.columns)
+        assert df.iloc[0].tolist() == ["0123", "Ali", "Kaya", "Veli", "x", "y"], df.iloc[0].tolist()
+
+
+def olc(veri, dosya_adi, tekrar):
+    en_iyi = float("inf")
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        df = okuma.liste_oku(veri, dosya_adi)
+        en_iyi = min(en_iyi, time.perf_counter() - t0)
+    return en_iyi, df
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--satir", type=int, default=50_000)
+    parser.add_argument("--tekrar", type=int, default=3)
+    args = parser.parse_args()
+
+    yinelenen_basliklar()
+    df = ornek_tablo(args.satir)
+    print(f"{args.satir} satır, pyarrow: {'var' if okuma.PYARROW_VAR else 'yok'} (en iyi {args.tekrar} ölçüm)")
+    for ad, (dosya_adi, veri) in dosyalar(df).items():
+        sure, okunan = olc(veri, dosya_adi, args.tekrar)
+        assert okunan[["No", "Ad", "Soyad"]].equals(df), ad
+        print(f"{ad:20s} {len(veri) / 1024:9.1f} KiB  {sure * 1000:9.1f} ms")
+    if okuma.PYARROW_VAR:
+        okuma.PYARROW_VAR = False
+        dosya_adi, veri = dosyalar(df)["csv utf-8 ,"]
+        sure, _ = olc(veri, dosya_adi, args.tekrar)
+        print(f"{'csv utf-8 , (C)':20s} {len(veri) / 1024:9.1f} KiB  {sure * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
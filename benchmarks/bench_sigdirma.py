@@ -0,0 +1,67 @@
+"""Ad sığdırmanın (sigdirma.py) ölçüm maliyetini fpdf'in get_string_width'iyle karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_sigdirma.py [--kisi 1000 10000 50000] [--tekrar 3]
+
+Her liste için üç ölçüm yapılır:
+
+    get_string_width  her ad için fpdf ile ayrı ölçüm (önbelleksiz yaklaşım)
+    sigdir (soğuk)    önbellek boşken; tüm adlar tek seferde numpy ile ölçülür
+    sigdir (sıcak)    aynı adlar yeniden (ör. kapı listesi, pano veya yeniden üretim)
+
+Ayrıca 42 mm'lik yoklama hücresine sığmayan, küçültülen ve kısaltılan ad sayıları yazdırılır.
+"""
+import argparse
+import os
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import sigdirma
+from sentetik import sentetik_liste
+from sinav_pdf import TABLO_YAZI, YOKLAMA_SUTUNLARI, SinavPDF, ogrenci_satirlari
+
+AD_GENISLIGI = next(w for w, _baslik, _hiza, alan in YOKLAMA_SUTUNLARI if alan == 'ad')
+
+
+def en_iyi(fonksiyon, tekrar, hazirla=None):
+    sure = float("inf")
+    for _ in range(tekrar):
+        if hazirla is not None:
+            hazirla()
+        t0 = time.perf_counter()
+        sonuc = fonksiyon()
+        sure = min(sure, time.perf_counter() - t0)
+    return sure, sonuc
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--kisi", type=int, nargs="+", default=[1000, 10000, 50000])
+    parser.add_argument("--tekrar", type=int, default=3)
+    parser.add_argument("--tohum", type=int, default=0)
+    args = parser.parse_args()
+
+    pdf = SinavPDF(*[""] * 8)
+    pdf.add_page()
+    pdf.set_font(pdf.fnt, '', TABLO_YAZI)
+    # Glif tablosu süreç başına bir kez kurulur; ölçümlere katılmaz
+    sigdirma.sigdir(pdf, [" Ahmet Yılmaz"], AD_GENISLIGI, TABLO_YAZI)
+
+    print(f"{'öğrenci':>8s} {'get_string_width':>17s} {'sigdir soğuk':>13s} {'sigdir sıcak':>13s}"
+          f" {'sığmayan':>9s} {'küçültülen':>10s} {'kısaltılan':>10s}")
+    for kisi in args.kisi:
+        metinler = [f" {ad}" for _no, ad, _ad_sayisi in ogrenci_satirlari(sentetik_liste(kisi, args.tohum))]
+        fpdf_sure, _ = en_iyi(lambda: [pdf.get_string_width(m) for m in metinler], args.tekrar)
+        soguk, sonuc = en_iyi(lambda: sigdirma.sigdir(pdf, metinler, AD_GENISLIGI, TABLO_YAZI), args.tekrar,
+                              hazirla=sigdirma._olculer.clear)
+        sicak, _ = en_iyi(lambda: sigdirma.sigdir(pdf, metinler, AD_GENISLIGI, TABLO_YAZI), args.tekrar)
+        degisen = [(m, s) for m, s in zip(metinler, sonuc) if s != (m, TABLO_YAZI)]
+        kisaltilan = sum(1 for m, s in degisen if s.metin != m)
+        print(f"{kisi:8d} {fpdf_sure * 1000:15.1f}ms {soguk * 1000:11.1f}ms {sicak * 1000:11.1f}ms"
+              f" {len(degisen):9d} {len(degisen) - kisaltilan:10d} {kisaltilan:10d}")
+
+
+if __name__ == "__main__":
+    main()
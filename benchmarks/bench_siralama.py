@@ -0,0 +1,88 @@
+"""Türkçe sıralama anahtarı üretimini eski karakter karakter yöntemle karşılaştırır.
+
+Kullanım:
+    python benchmarks/bench_siralama.py [--adet 100000]
+"""
+import argparse
+import os
+import random
+import sys
+import time
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+import pandas as pd
+
+from pano import pano_satirlari
+from siralama import coklu_anahtar, seri_anahtarlari, turkce_sirala, turkce_sirala_anahtar
+
+ADLAR = ["Ahmet", "Ayşe", "Çağrı", "Gülşen", "İsmail", "Ömer", "Şükrü", "Ümmü", "Işıl", "Ilgaz", "Ğ"]
+SOYADLAR = ["Yılmaz", "Öztürk", "Çelik", "Şahin", "Doğan", "Güneş", "Işık", "İnce", "Ağaoğlu", "Ak Yıldız", "Ünlü"]
+
+
+def eski_anahtar(metin):
+    """Önceki uygulama: her çağrıda sözlük kurar, karakter başına 'NN' parçası üretir"""
+    turkce_harf_agirliklari = {
+        'a': 1, 'b': 2, 'c': 3, 'ç': 4, 'd': 5, 'e': 6, 'f': 7, 'g': 8, 'ğ': 9, 'h': 10,
+        'ı': 11, 'i': 12, 'j': 13, 'k': 14, 'l': 15, 'm': 16, 'n': 17, 'o': 18, 'ö': 19,
+        'p': 20, 'r': 21, 's': 22, 'ş': 23, 't': 24, 'u': 25, 'ü': 26, 'v': 27, 'y': 28, 'z': 29,
+        'A': 1, 'B': 2, 'C': 3, 'Ç': 4, 'D': 5, 'E': 6, 'F': 7, 'G': 8, 'Ğ': 9, 'H': 10,
+        'I': 11, 'İ': 12, 'J': 13, 'K': 14, 'L': 15, 'M': 16, 'N': 17, 'O': 18, 'Ö': 19,
+        'P': 20, 'R': 21, 'S': 22, 'Ş': 23, 'T': 24, 'U': 25, 'Ü': 26, 'V': 27, 'Y': 28, 'Z': 29
+    }
+    anahtar = []
+    for harf in metin.lower():
+        if harf in turkce_harf_agirliklari:
+            anahtar.append(f"{turkce_harf_agirliklari[harf]:02d}")
+        else:
+            anahtar.append("99")
+    return "".join(anahtar)
+
+
+def ornek_tablo(adet, tohum=0):
+    rnd = random.Random(tohum)
+    return pd.DataFrame({
+        "No": [str(rnd.randrange(10**8, 10**9)) for _ in range(adet)],
+        "Ad": [rnd.choice(ADLAR) for _ in range(adet)],
+        "Soyad": [rnd.choice(SOYADLAR) + rnd.choice(["", "oğlu", "can", "er"]) for _ in range(adet)],
+    })
+
+
+def siniflar_arasi_esitlik():
+    """Aynı ad soyadlı öğrenciler farklı sınıflarda ve numara uzunlukları farklıyken numaraya göre sıralanmalı"""
+    a1 = pd.DataFrame({"No": ["99", "7"], "Ad": ["Ali", "Can"], "Soyad": ["Kaya", "Kaya"]})
+    a2 = pd.DataFrame({"No": ["100"], "Ad": ["Ali"], "Soyad": ["Kaya"]})
+    satirlar = [s for parca in pano_satirlari([("A1", a1), ("A2", a2)]) for s in parca]
+    assert [s.no for s in satirlar] == ["99", "100", "7"], [s.no for s in satirlar]
+
+
+def sure(fonksiyon):
+    t0 = time.perf_counter()
+    sonuc = fonksiyon()
+    return time.perf_counter() - t0, sonuc
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--adet", type=int, default=100_000)
+    args = parser.parse_args()
+
+    siniflar_arasi_esitlik()
+    df = ornek_tablo(args.adet)
+    print(f"{args.adet} isim")
+
+    olcumler = [
+        ("anahtar  eski: apply(eski_anahtar), soyad", lambda: df["Soyad"].apply(eski_anahtar)),
+        ("anahtar  yeni: apply(turkce_sirala_anahtar), soyad", lambda: df["Soyad"].apply(turkce_sirala_anahtar)),
+        ("anahtar  yeni: seri_anahtarlari (vektörel), soyad", lambda: seri_anahtarlari(df["Soyad"])),
+        ("anahtar  yeni: coklu_anahtar döngüsü, 3 seviye", lambda: [coklu_anahtar(s, a, n) for n, a, s in df.itertuples(index=False)]),
+        ("sıralama eski: apply + sort_values, soyad", lambda: df.assign(k=df["Soyad"].apply(eski_anahtar)).sort_values("k")),
+        ("sıralama yeni: turkce_sirala (vektörel), 3 seviye", lambda: turkce_sirala(df, "Soyad", "Ad", "No")),
+    ]
+    for ad, fonksiyon in olcumler:
+        gecen, _ = sure(fonksiyon)
+        print(f"{ad:52s} {gecen * 1000:9.1f} ms")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,230 @@
+"""Öğrenci yeri sorgu servisine (sorgu.py) eşzamanlı yük uygular.
+
+Kullanım:
+    python benchmarks/bench_sorgu.py [--depo sinav_deposu.db] [--url http://127.0.0.1:8503]
+                                     [--istek 20000] [--eszamanli 100]
+
+--depo verilmezse geçici bir depo --ogrenci sentetik öğrenciyle (--sinav
+sınava dağıtılarak) doldurulur. --url verilmezse servis bu depo ile ayrı bir
+süreçte, boş bir portta başlatılır ve ölçüm sonunda kapatılır.
+
+Sorgular depodaki gerçek (numara, soyad öneki) çiftlerinden, --kacirma
+oranında da olmayan numaralardan seçilir. Her eşzamanlı istemci kendi kalıcı
+(keep-alive) HTTP bağlantısını kullanır. Saniyedeki istek sayısı, gecikme
+yüzdelikleri ve hata sayısı yazdırılır; ayrıca indeks aramasının süreç içi
+süresi öğrenci sayısından bağımsız olduğunu göstermek için ayrıca ölçülür.
+
+Hata olursa veya ortanca gecikme --p50-siniri'ni (ms) aşarsa çıkış kodu 1'dir;
+ör. yanıtlara Nagle/gecikmeli ACK beklemesi (~40 ms) eklenirse ölçüm başarısız olur.
+"""
+import argparse
+import http.client
+import json
+import os
+import random
+import socket
+import statistics
+import subprocess
+import sys
+import tempfile
+import threading
+import time
+from urllib.parse import quote, urlsplit
+
+KOK = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+sys.path.insert(0, KOK)
+
+from depo import SinavDeposu
+from sentetik import sentetik_liste, sinif_duzeni
+from sorgu import ONEK, YerIndeksi
+from uretim import siniflara_dagit
+
+
+def sentetik_depo(yol, ogrenci, sinav, tohum):
+    """ogrenci kişilik listeyi sinav sınava (her biri 40'ar kişilik sınıflarla) dağıtıp depoya yazar"""
+    depo = SinavDeposu(yol)
+    df = sentetik_liste(ogrenci, tohum)
+    for i in range(sinav):
+        # Her öğrenci birkaç sınava girer
+        katilan = df.sample(frac=0.6, random_state=tohum + i).reset_index(drop=True)
+        rooms = sinif_duzeni(max(len(katilan) // 40, 1), len(katilan), tohum=tohum + i)
+        baslik = {"uni": "Kırıkkale Üniversitesi", "fakulte": "Mühendislik Fakültesi", "bolum": "Bilgisayar Mühendisliği",
+                  "ders": f"Ders {i + 1}", "sinav_turu": "Final Sınavı", "tarih": f"{15 + i // 3}.01.2025",
+                  "saat": ("09:00", "13:00", "16:00")[i % 3], "hoca": "Dr. Öğr. Üyesi Ayşe Yılmaz"}
+        sinav_id = depo.sinav_kaydet(baslik, rooms, tohum + i, "rastgele")
+        depo.yerlesim_kaydet(sinav_id, (
+            (room["Ad"], liste) for room, liste in siniflara_dagit(katilan, rooms, tohum + i, "rastgele") if not liste.empty
+        ), tohum + i, "rastgele")
+    return depo
+
+
+def sorgular(depo, adet, kacirma, tohum):
+    """(no, soyad öneki, bulunmalı mı) üçlüleri"""
+    ogrenciler = {(r["no"], r["soyad"]) for r in depo.tum_yerlesimler()}
+    ogrenciler = sorted(ogrenciler)
+    rnd = random.Random(tohum)
+    secim = []
+    for _ in range(adet):
+        no, soyad = rnd.choice(ogrenciler)
+        if rnd.random() < kacirma:
+            secim.append((f"9{no}", soyad[:ONEK + 1], False))
+        else:
+            # Öğrenciler soyadlarını küçük harfle ve farklı uzunlukta yazar
+            onek = soyad[:rnd.randint(ONEK, max(len(soyad), ONEK))]
+            secim.append((no, onek.replace("I", "ı").replace("İ", "i").lower(), True))
+    return secim
+
+
+def bos_port():
+    with socket.socket() as s:
+        s.bind(("127.0.0.1", 0))
+        return s.getsockname()[1]
+
+
+def servisi_baslat(depo_yolu):
+    """sorgu.py'yi ayrı süreçte başlatır; hazır olunca (süreç, url) döndürür"""
+    port = bos_port()
+    surec = subprocess.Popen(
+        [sys.executable, os.path.join(KOK, "sorgu.py"), "--depo", depo_yolu, "--port", str(port)],
+        stdout=subprocess.DEVNULL, stderr=subprocess.DEVNULL,
+    )
+    url = f"http://127.0.0.1:{port}"
+    for _ in range(200):
+        try:
+            baglanti = http.client.HTTPConnection("127.0.0.1", port, timeout=1)
+            baglanti.request("GET", "/api/durum")
+            if baglanti.getresponse().status == 200:
+                return surec, url
+        except OSError:
+            time.sleep(0.05)
+    surec.kill()
+    raise RuntimeError("Sorgu servisi başlatılamadı")
+
+
+def yuk_uygula(url, secim, eszamanli):
+    """Sorguları eszamanli istemciyle gönderir; (gecikmeler, hatalar, toplam süre) döndürür"""
+    adres = urlsplit(url)
+    gecikmeler = []
+    hatalar = []
+    kilit = threading.Lock()
+    parcalar = [secim[i::eszamanli] for i in range(eszamanli)]
+    baslat = threading.Barrier(eszamanli + 1)
+
+    def istemci(parca):
+        baglanti = http.client.HTTPConnection(adres.hostname, adres.port, timeout=10)
+        yerel, hata = [], []
+        baslat.wait()
+        for no, soyad, bulunmali in parca:
+            t0 = time.perf_counter()
+            try:
+                baglanti.request("GET", f"/api/yer?no={quote(no)}&soyad={quote(soyad)}")
+                yanit = baglanti.getresponse()
+                yanit.read()
+            except (OSError, http.client.HTTPException) as e:
+                hata.append(repr(e))
+                baglanti.close()
+                baglanti = http.client.HTTPConnection(adres.hostname, adres.port, timeout=10)
+                continue
+            yerel.append(time.perf_counter() - t0)
+            if yanit.status != (200 if bulunmali else 404):
+                hata.append(f"{no}: beklenmeyen durum {yanit.status}")
+        baglanti.close()
+        with kilit:
+            gecikmeler.extend(yerel)
+            hatalar.extend(hata)
+
+    iplikler = [threading.Thread(target=istemci, args=(p,)) for p in parcalar]
+    for t in iplikler:
+        t.start()
+    baslat.wait()
+    t0 = time.perf_counter()
+    for t in iplikler:
+        t.join()
+    return gecikmeler, hatalar, time.perf_counter() - t0
+
+
+def yuzdelik(degerler, oran):
+    return degerler[min(int(len(degerler) * oran), len(degerler) - 1)]
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--depo", help="Sorgulanacak SQLite deposu (verilmezse sentetik depo kurulur)")
+    parser.add_argument("--url", help="Çalışan sorgu servisinin adresi (verilmezse yerel örnek başlatılır)")
+    parser.add_argument("--ogrenci", type=int, default=5000, help="Sentetik depodaki öğrenci sayısı")
+    parser.add_argument("--sinav", type=int, default=6, help="Sentetik depodaki sınav sayısı")
+    parser.add_argument("--istek", type=int, default=20000)
+    parser.add_argument("--eszamanli", type=int, default=100)
+    parser.add_argument("--kacirma", type=float, default=0.1, help="Kayıtsız numara sorgusu oranı")
+    parser.add_argument("--tohum", type=int, default=0)
+    parser.add_argument("--p50-siniri", type=float, default=20.0, help="Ortanca gecikme üst sınırı, ms (varsayılan: 20)")
+    parser.add_argument("--json", help="Sonuçların yazılacağı JSON dosyası")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as klasor:
+        if args.depo:
+            depo = SinavDeposu(args.depo)
+        else:
+            t0 = time.perf_counter()
+            depo = sentetik_depo(os.path.join(klasor, "depo.db"), args.ogrenci, args.sinav, args.tohum)
+            print(f"Sentetik depo: {args.ogrenci} öğrenci, {args.sinav} sınav ({time.perf_counter() - t0:.1f} sn)")
+        secim = sorgular(depo, args.istek, args.kacirma, args.tohum)
+
+        # Süreç içi indeks araması (HTTP olmadan)
+        t0 = time.perf_counter()
+        indeks = YerIndeksi(depo)
+        kurulum = time.perf_counter() - t0
+        t0 = time.perf_counter()
+        for no, soyad, _ in secim:
+            indeks.ara(no, soyad)
+        arama = (time.perf_counter() - t0) / len(secim)
+        durum = indeks.durum()
+        indeks.kapat()
+        print(f"İndeks: {durum['kayit']} kayıt, {durum['anahtar']} anahtar, kurulum {kurulum * 1000:.0f} ms, "
+              f"arama {arama * 1e6:.1f} µs/sorgu")
+
+        surec = None
+        url = args.url
+        if url is None:
+            surec, url = servisi_baslat(depo.yol)
+        try:
+            gecikmeler, hatalar, sure = yuk_uygula(url, secim, args.eszamanli)
+        finally:
+            if surec is not None:
+                surec.terminate()
+                surec.wait()
+
+    gecikmeler.sort()
+    sonuc = {
+        "istek": len(secim),
+        "eszamanli": args.eszamanli,
+        "sure": sure,
+        "istek_sn": len(gecikmeler) / sure,
+        "p50_ms": 1000 * statistics.median(gecikmeler) if gecikmeler else None,
+        "p95_ms": 1000 * yuzdelik(gecikmeler, 0.95) if gecikmeler else None,
+        "p99_ms": 1000 * yuzdelik(gecikmeler, 0.99) if gecikmeler else None,
+        "en_kotu_ms": 1000 * gecikmeler[-1] if gecikmeler else None,
+        "hata": len(hatalar),
+        "indeks_kayit": durum["kayit"],
+        "arama_us": arama * 1e6,
+    }
+    print(f"{url}: {sonuc['istek']} istek, {args.eszamanli} eşzamanlı istemci, {sure:.2f} sn "
+          f"-> {sonuc['istek_sn']:.0f} istek/sn")
+    if gecikmeler:
+        print(f"Gecikme: p50 {sonuc['p50_ms']:.2f} ms, p95 {sonuc['p95_ms']:.2f} ms, "
+              f"p99 {sonuc['p99_ms']:.2f} ms, en kötü {sonuc['en_kotu_ms']:.2f} ms")
+    print(f"Hata: {len(hatalar)}")
+    for hata in hatalar[:10]:
+        print(f"  {hata}")
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(sonuc, f, ensure_ascii=False, indent=2)
+    if gecikmeler and sonuc['p50_ms'] > args.p50_siniri:
+        print(f"Ortanca gecikme {sonuc['p50_ms']:.2f} ms, sınır {args.p50_siniri:.0f} ms")
+        sys.exit(1)
+    if hatalar:
+        sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,202 @@
+"""Belge üretiminin aşamalarını sınıf ve öğrenci sayısına göre ölçer.
+
+Kullanım:
+    python benchmarks/bench_uretim.py [--sinif 1 10 50 100] [--kisi-sinif 40]
+                                      [--json sonuc.json] [--karsilastir onceki.json]
+
+Her senaryoda (sınıf sayısı x sınıf başına öğrenci) sentetik bir liste .xlsx
+olarak hazırlanır ve şu aşamalar ayrı ayrı ölçülür:
+
+    excel      liste_oku ile .xlsx ayrıştırma
+    yerlesim   strateji ile öğrencilerin sınıflara dağıtılması (karıştırma)
+    siralama   sınıf listelerinin numaraya, pano anahtarlarının soyad/ad/numaraya göre hesaplanması
+    sinif_pdf  her sınıfın yoklama ve kapı listesi PDF'leri (sıralı, tek süreç)
+    pano       pano listesi PDF'i
+    zip        hazır belgelerin ZIP'e yazılması
+
+Her aşama için --tekrar ölçümün en iyisi alınır. Sonuçlar --json ile
+kaydedilir; --karsilastir önceki bir kaydı okur ve --esik oranından fazla
+yavaşlayan aşamaları bildirir (bu durumda çıkış kodu 1 olur).
+"""
+import argparse
+import io
+import json
+import os
+import platform
+import sys
+import time
+from datetime import datetime, timezone
+from importlib import metadata
+
+sys.path.insert(0, os.path.dirname(os.path.dirname(os.path.abspath(__file__))))
+
+from okuma import liste_oku
+from sentetik import sentetik_liste, sinif_duzeni
+from sinav_pdf import ogrenci_satirlari
+from siralama import no_anahtarlari, tablo_anahtarlari
+from uretim import pano_listesi_pdf, sinif_belgeleri, uretim_zamani, zipe_akit
+from yerlestirme import STRATEJILER, strateji_al
+
+BASLIK = {
+    "uni": "Kırıkkale Üniversitesi", "fakulte": "Mühendislik Fakültesi",
+    "bolum": "Bilgisayar Mühendisliği", "ders": "Veri Yapıları", "sinav_turu": "Final Sınavı",
+    "tarih": "15.01.2025", "saat": "10:00", "hoca": "Dr. Öğr. Üyesi Ayşe Yılmaz",
+}
+
+ASAMALAR = ("excel", "yerlesim", "siralama", "sinif_pdf", "pano", "zip")
+
+
+def en_iyi(fonksiyon, tekrar):
+    """fonksiyon'u tekrar kez çalıştırır; (en kısa süre, son sonuç) döndürür"""
+    sure = float("inf")
+    for _ in range(tekrar):
+        t0 = time.perf_counter()
+        sonuc = fonksiyon()
+        sure = min(sure, time.perf_counter() - t0)
+    return sure, sonuc
+
+
+def senaryo_olc(sinif, kisi, args):
+    """Bir senaryonun aşama sürelerini ve çıktı boyutlarını döndürür"""
+    df = sentetik_liste(kisi, args.tohum)
+    rooms = sinif_duzeni(sinif, kisi, tohum=args.tohum)
+    xlsx = io.BytesIO()
+    df.to_excel(xlsx, index=False)
+    xlsx = xlsx.getvalue()
+    zaman = uretim_zamani()
+    strateji = strateji_al(args.strateji)
+    sureler = {}
+
+    sureler["excel"], df = en_iyi(lambda: liste_oku(xlsx, "liste.xlsx"), args.tekrar)
+    sureler["yerlesim"], konumlar = en_iyi(lambda: strateji.dagit(df, rooms, args.tohum), args.tekrar)
+
+    def sirala():
+        # uretim.siniflara_dagit ve pano.pano_satirlari ile aynı anahtarlar
+        listeler = [
+            (room["Ad"], df.iloc[k].sort_values(by=df.columns[0], key=no_anahtarlari).reset_index(drop=True))
+            for room, k in zip(rooms, konumlar) if len(k)
+        ]
+        for _, liste in listeler:
+            tablo_anahtarlari(liste, "Soyad", "Ad", "No")
+        return listeler
+    sureler["siralama"], listeler = en_iyi(sirala, args.tekrar)
+
+    def sinif_pdfleri():
+        belgeler = []
+        for ad, liste in listeler:
+            yoklama, kapi = sinif_belgeleri(BASLIK, ad, ogrenci_satirlari(liste), zaman)
+            belgeler += [(f"Yoklama_{ad}.pdf", yoklama), (f"Kapi_Listesi_{ad}.pdf", kapi)]
+        return belgeler
+    sureler["sinif_pdf"], belgeler = en_iyi(sinif_pdfleri, args.tekrar)
+
+    pano_siniflari = [(ad, liste.iloc[:, :3]) for ad, liste in listeler]
+    sureler["pano"], pano = en_iyi(lambda: pano_listesi_pdf(BASLIK, pano_siniflari, zaman, args.pano_sutun), args.tekrar)
+    belgeler.append(("Pano_Listesi.pdf", pano))
+
+    def zip_yaz():
+        arsiv = io.BytesIO()
+        zipe_akit(arsiv, belgeler, zaman, args.sikistirma)
+        return arsiv.getbuffer().nbytes
+    sureler["zip"], zip_boyutu = en_iyi(zip_yaz, args.tekrar)
+
+    return {
+        "sinif": sinif,
+        "kisi": kisi,
+        "sureler": sureler,
+        "toplam": sum(sureler.values()),
+        "xlsx_bayt": len(xlsx),
+        "pdf_bayt": sum(len(v) for _, v in belgeler),
+        "pano_bayt": len(pano),
+        "zip_bayt": zip_boyutu,
+        "ms_sinif": 1000 * sureler["sinif_pdf"] / max(len(listeler), 1),
+    }
+
+
+def ortam():
+    """Sonuçların karşılaştırılabilmesi için sürüm ve makine bilgisi"""
+    surumler = {}
+    for paket in ("pandas", "numpy", "fpdf2", "openpyxl"):
+        try:
+            surumler[paket] = metadata.version(paket)
+        except metadata.PackageNotFoundError:
+            surumler[paket] = None
+    return {
+        "python": platform.python_version(),
+        "platform": platform.platform(),
+        "cpu": os.cpu_count(),
+        "paketler": surumler,
+    }
+
+
+def karsilastir(onceki, sonuclar, esik):
+    """Önceki kayıtla aynı senaryoların aşama sürelerini karşılaştırır; yavaşlayan aşamaları döndürür"""
+    eski = {(s["sinif"], s["kisi"]): s for s in onceki["senaryolar"]}
+    yavaslayan = []
+    print(f"\nKarşılaştırma ({onceki.get('tarih', '?')} kaydına göre, eşik x{esik:.2f}):")
+    for s in sonuclar:
+        o = eski.get((s["sinif"], s["kisi"]))
+        if o is None:
+            continue
+        oranlar = []
+        for asama in ASAMALAR:
+            once, simdi = o["sureler"].get(asama), s["sureler"][asama]
+            if not once:
+                continue
+            oran = simdi / once
+            oranlar.append(f"{asama} x{oran:.2f}")
+            # Çok kısa aşamalarda ölçüm gürültüsü oranı şişirir
+            if oran > esik and simdi - once > 0.005:
+                yavaslayan.append((s["sinif"], s["kisi"], asama, once, simdi))
+        print(f"  {s['sinif']:4d} sınıf {s['kisi']:6d} öğrenci: " + ", ".join(oranlar))
+    for sinif, kisi, asama, once, simdi in yavaslayan:
+        print(f"  YAVAŞLAMA {sinif} sınıf / {kisi} öğrenci, {asama}: {once * 1000:.1f} ms -> {simdi * 1000:.1f} ms")
+    return yavaslayan
+
+
+def main():
+    parser = argparse.ArgumentParser(description=__doc__.splitlines()[0])
+    parser.add_argument("--sinif", type=int, nargs="+", default=[1, 10, 50, 100], help="Sınıf sayıları (1-100)")
+    parser.add_argument("--kisi-sinif", type=int, default=40, help="Sınıf başına ortalama öğrenci")
+    parser.add_argument("--tekrar", type=int, default=1)
+    parser.add_argument("--tohum", type=int, default=0)
+    parser.add_argument("--strateji", choices=list(STRATEJILER), default="rastgele")
+    parser.add_argument("--pano-sutun", type=int, choices=(1, 2, 3), default=1)
+    parser.add_argument("--sikistirma", choices=("deflate", "stored"), default="deflate")
+    parser.add_argument("--json", help="Sonuçların yazılacağı JSON dosyası")
+    parser.add_argument("--karsilastir", help="Karşılaştırılacak önceki JSON kaydı")
+    parser.add_argument("--esik", type=float, default=1.25, help="Yavaşlama sayılacak süre oranı (varsayılan: 1.25)")
+    args = parser.parse_args()
+    if any(not 1 <= s <= 100 for s in args.sinif):
+        parser.error("sınıf sayısı 1 ile 100 arasında olmalıdır")
+
+    # Font ayrıştırma süreç başına bir kez yapılır; ilk senaryoya yüklenmemesi için önceden ısıtılır
+    sinif_belgeleri(BASLIK, "A1", ogrenci_satirlari(sentetik_liste(5)), uretim_zamani())
+
+    print(f"{'sınıf':>5s} {'öğrenci':>7s} " + " ".join(f"{a:>9s}" for a in ASAMALAR)
+          + f" {'toplam':>8s} {'ms/sınıf':>8s} {'ZIP KiB':>8s}")
+    sonuclar = []
+    for sinif in args.sinif:
+        s = senaryo_olc(sinif, sinif * args.kisi_sinif, args)
+        sonuclar.append(s)
+        print(f"{sinif:5d} {s['kisi']:7d} " + " ".join(f"{1000 * s['sureler'][a]:7.1f}ms" for a in ASAMALAR)
+              + f" {s['toplam']:7.2f}s {s['ms_sinif']:8.1f} {s['zip_bayt'] / 1024:8.1f}")
+
+    kayit = {
+        "tarih": datetime.now(timezone.utc).isoformat(timespec="seconds"),
+        "ortam": ortam(),
+        "ayarlar": {k: v for k, v in vars(args).items() if k not in ("json", "karsilastir")},
+        "senaryolar": sonuclar,
+    }
+    if args.json:
+        with open(args.json, "w", encoding="utf-8") as f:
+            json.dump(kayit, f, ensure_ascii=False, indent=2)
+        print(f"\nSonuçlar {args.json} dosyasına yazıldı.")
+    if args.karsilastir:
+        with open(args.karsilastir, encoding="utf-8") as f:
+            onceki = json.load(f)
+        if karsilastir(onceki, sonuclar, args.esik):
+            sys.exit(1)
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,61 @@
+"""Ölçümler için sentetik öğrenci listeleri ve sınıf düzenleri.
+
+İsimler gerçek Türkçe ad ve soyadlarından seçilir; ç/ğ/ı/İ/ö/ş/ü harflerinin
+tamamı, iki adlı öğrenciler ve birleşik soyadları bulunur. Aynı tohum her
+zaman aynı listeyi verir.
+"""
+import random
+
+import pandas as pd
+
+ADLAR = [
+    "Ahmet", "Mehmet", "Mustafa", "Ali", "Hüseyin", "Hasan", "İbrahim", "İsmail", "Osman", "Yusuf",
+    "Ömer", "Murat", "Emre", "Burak", "Çağrı", "Oğuzhan", "Doğukan", "Şükrü", "Ümit", "Tuğrul",
+    "Ayşe", "Fatma", "Emine", "Hatice", "Zeynep", "Elif", "Merve", "Büşra", "Şeyma", "Gülşen",
+    "Özge", "Çiğdem", "Ümmü", "Işıl", "Ilgın", "İrem", "Gökçe", "Ağça", "Dilşad", "Şükran",
+]
+
+SOYADLAR = [
+    "Yılmaz", "Kaya", "Demir", "Şahin", "Çelik", "Yıldız", "Yıldırım", "Öztürk", "Aydın", "Özdemir",
+    "Arslan", "Doğan", "Kılıç", "Aslan", "Çetin", "Kara", "Koç", "Kurt", "Özkan", "Şimşek",
+    "Polat", "Özcan", "Korkmaz", "Çakır", "Erdoğan", "Yavuz", "Güneş", "Işık", "İnce", "Ünal",
+    "Ağaoğlu", "Gündüz", "Bulut", "Karagöz", "Uçar", "Tuğlu", "Çağlar", "Ilıcak", "Ürgüp", "Sağlam",
+]
+
+# Sınıf adları için bina / amfi önekleri
+BINALAR = ["A", "B", "D", "M", "Amfi "]
+
+
+def sentetik_liste(kisi, tohum=0):
+    """kisi öğrencilik No, Ad, Soyad listesi (numaralar 9 haneli ve tekil)"""
+    rnd = random.Random(tohum)
+    nolar = rnd.sample(range(10**8, 10**9), kisi)
+    adlar, soyadlar = [], []
+    for _ in range(kisi):
+        ad = rnd.choice(ADLAR)
+        if rnd.random() < 0.12:
+            ad = f"{ad} {rnd.choice(ADLAR)}"
+        soyad = rnd.choice(SOYADLAR)
+        if rnd.random() < 0.04:
+            soyad = f"{soyad} {rnd.choice(SOYADLAR)}"
+        adlar.append(ad)
+        soyadlar.append(soyad)
+    return pd.DataFrame({"No": [str(n) for n in nolar], "Ad": adlar, "Soyad": soyadlar})
+
+
+def sinif_duzeni(sinif, kisi, bosluk=0.1, tohum=0):
+    """Toplam kapasitesi kisi * (1 + bosluk) olan, farklı büyüklükte sinif adet sınıf.
+
+    Kapasiteler ortalamanın yarısı ile bir buçuk katı arasında dağılır.
+    """
+    rnd = random.Random(tohum)
+    toplam = max(kisi + int(kisi * bosluk), sinif)
+    agirliklar = [rnd.uniform(0.5, 1.5) for _ in range(sinif)]
+    kapasiteler = [max(1, int(toplam * a / sum(agirliklar))) for a in agirliklar]
+    # Yuvarlama farkı ilk sınıflara dağıtılır
+    for i in range(toplam - sum(kapasiteler)):
+        kapasiteler[i % sinif] += 1
+    return [
+        {"Ad": f"{BINALAR[i % len(BINALAR)]}{100 + i // len(BINALAR) + 1}", "Kap": kap, "Erisilebilir": i % 10 == 0}
+        for i, kap in enumerate(kapasiteler)
+    ]
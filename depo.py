@@ -0,0 +1,300 @@
+"""Sınıf katalogları, sınav tanımları ve yerleşimler için yerel SQLite deposu.
+
+Dönem boyunca aynı binalar ve sınıflar kullanıldığından sınıf listeleri
+katalog olarak adıyla kaydedilip tek tıkla yüklenir; sınav başlık alanları
+önceki sınavlardan alınabilir. Üretilen her yerleşim (öğrenci → sınıf, sıra)
+sınavıyla birlikte saklanır.
+
+İndeksler:
+    sinavlar(ders), sinavlar(gun, saat)   ders ve oturuma (tarih/saat) göre sınav arama
+    yerlesimler(no)                       "öğrenci X hangi sınıfta?" sorgusu
+                                          (yoğun sorgu için bellek içi indeks: sorgu.py)
+Tarih "GG.AA.YYYY" biçimindeyse `gun` sütununda YYYY-AA-GG olarak tutulur,
+böylece sıralama ve aralık sorguları indeksi kullanır.
+
+Her işlem kendi bağlantısını açar; depo Streamlit oturumları ve arka plan
+işleri arasında paylaşılabilir. WAL kipi okumaların yazmaları beklemesini önler.
+"""
+import os
+import sqlite3
+from contextlib import closing, contextmanager
+from datetime import datetime, timezone
+
+from sinav_programi import oturum_anahtari
+
+DEPO_YOLU = os.environ.get("SINAV_DEPO_YOLU") or os.path.join(os.path.dirname(os.path.abspath(__file__)), "sinav_deposu.db")
+
+# Sınav başlık alanları (uretim.BASLIK_ALANLARI ile aynı)
+BASLIK_SUTUNLARI = ("uni", "fakulte", "bolum", "ders", "sinav_turu", "tarih", "saat", "hoca")
+
+SEMA = """
+CREATE TABLE IF NOT EXISTS kataloglar (
+    id INTEGER PRIMARY KEY,
+    ad TEXT NOT NULL UNIQUE,
+    guncelleme TEXT NOT NULL
+);
+CREATE TABLE IF NOT EXISTS katalog_siniflari (
+    katalog_id INTEGER NOT NULL REFERENCES kataloglar(id) ON DELETE CASCADE,
+    sira INTEGER NOT NULL,
+    ad TEXT NOT NULL,
+    kap INTEGER NOT NULL,
+    erisilebilir INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (katalog_id, sira)
+);
+CREATE TABLE IF NOT EXISTS sinavlar (
+    id INTEGER PRIMARY KEY,
+    uni TEXT, fakulte TEXT, bolum TEXT,
+    ders TEXT NOT NULL,
+    sinav_turu TEXT,
+    tarih TEXT NOT NULL,
+    gun TEXT NOT NULL,
+    saat TEXT NOT NULL,
+    hoca TEXT,
+    tohum INTEGER,
+    strateji TEXT,
+    olusturma TEXT NOT NULL
+);
+CREATE INDEX IF NOT EXISTS sinavlar_ders ON sinavlar(ders);
+CREATE INDEX IF NOT EXISTS sinavlar_oturum ON sinavlar(gun, saat);
+CREATE TABLE IF NOT EXISTS sinav_siniflari (
+    sinav_id INTEGER NOT NULL REFERENCES sinavlar(id) ON DELETE CASCADE,
+    sira INTEGER NOT NULL,
+    ad TEXT NOT NULL,
+    kap INTEGER NOT NULL,
+    erisilebilir INTEGER NOT NULL DEFAULT 0,
+    PRIMARY KEY (sinav_id, sira)
+);
+CREATE TABLE IF NOT EXISTS yerlesimler (
+    sinav_id INTEGER NOT NULL REFERENCES sinavlar(id) ON DELETE CASCADE,
+    sinif TEXT NOT NULL,
+    sira INTEGER NOT NULL,
+    no TEXT NOT NULL,
+    ad TEXT,
+    soyad TEXT,
+    PRIMARY KEY (sinav_id, sinif, sira)
+) WITHOUT ROWID;
+CREATE INDEX IF NOT EXISTS yerlesimler_no ON yerlesimler(no);
+"""
+
+
+def gun_anahtari(tarih):
+    """GG.AA.YYYY (veya GG/AA/YYYY, YYYY-AA-GG) tarihini YYYY-AA-GG yapar; çözülemezse olduğu gibi bırakır"""
+    tarih = " ".join(str(tarih).split())
+    for bicim in ("%d.%m.%Y", "%d/%m/%Y", "%Y-%m-%d", "%d.%m.%y"):
+        try:
+            return datetime.strptime(tarih, bicim).date().isoformat()
+        except ValueError:
+            continue
+    return tarih
+
+
+def _metin(deger):
+    return "" if deger is None or deger != deger else str(deger)
+
+
+def _strateji_adi(strateji):
+    """Strateji adı veya YerlestirmeStratejisi nesnesi → kaydedilecek ad"""
+    return strateji if strateji is None or isinstance(strateji, str) else strateji.ad
+
+
+class SinavDeposu:
+    """SQLite dosyası üzerinde katalog, sınav ve yerleşim kayıtları"""
+
+    def __init__(self, yol=DEPO_YOLU):
+        self.yol = yol
+        with self._baglanti() as db:
+            db.executescript(SEMA)
+
+    @contextmanager
+    def _baglanti(self):
+        """İşlem (transaction) açan bağlantı; hata olmazsa kaydeder"""
+        with closing(sqlite3.connect(self.yol, timeout=30)) as db:
+            db.row_factory = sqlite3.Row
+            db.execute("PRAGMA foreign_keys = ON")
+            db.execute("PRAGMA journal_mode = WAL")
+            with db:
+                yield db
+
+    # Sınıf katalogları
+
+    def katalog_kaydet(self, ad, siniflar):
+        """Sınıf listesini verilen adla kaydeder (aynı adlı katalog varsa üzerine yazar)"""
+        ad = str(ad).strip()
+        if not ad:
+            raise ValueError("Katalog adı boş olamaz.")
+        if not siniflar:
+            raise ValueError("Kaydedilecek sınıf yok.")
+        simdi = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        with self._baglanti() as db:
+            db.execute(
+                "INSERT INTO kataloglar (ad, guncelleme) VALUES (?, ?) "
+                "ON CONFLICT(ad) DO UPDATE SET guncelleme = excluded.guncelleme",
+                (ad, simdi),
+            )
+            katalog_id = db.execute("SELECT id FROM kataloglar WHERE ad = ?", (ad,)).fetchone()[0]
+            db.execute("DELETE FROM katalog_siniflari WHERE katalog_id = ?", (katalog_id,))
+            db.executemany(
+                "INSERT INTO katalog_siniflari (katalog_id, sira, ad, kap, erisilebilir) VALUES (?, ?, ?, ?, ?)",
+                [(katalog_id, i, str(r['Ad']), int(r['Kap']), int(bool(r.get('Erisilebilir')))) for i, r in enumerate(siniflar)],
+            )
+        return katalog_id
+
+    def kataloglar(self):
+        """Katalog adları, en son güncellenen önce"""
+        with self._baglanti() as db:
+            return [r[0] for r in db.execute("SELECT ad FROM kataloglar ORDER BY guncelleme DESC, ad")]
+
+    def katalog_al(self, ad):
+        """Kataloğun sınıfları ({"Ad", "Kap", "Erisilebilir"} listesi); katalog yoksa boş liste"""
+        with self._baglanti() as db:
+            satirlar = db.execute(
+                "SELECT s.ad, s.kap, s.erisilebilir FROM katalog_siniflari s "
+                "JOIN kataloglar k ON k.id = s.katalog_id WHERE k.ad = ? ORDER BY s.sira",
+                (str(ad).strip(),),
+            ).fetchall()
+        return [{"Ad": r['ad'], "Kap": r['kap'], "Erisilebilir": bool(r['erisilebilir'])} for r in satirlar]
+
+    def katalog_sil(self, ad):
+        with self._baglanti() as db:
+            db.execute("DELETE FROM kataloglar WHERE ad = ?", (str(ad).strip(),))
+
+    # Sınavlar
+
+    def sinav_kaydet(self, baslik, siniflar, tohum=None, strateji=None):
+        """Sınav tanımını ve sınıflarını kaydeder; sınav numarasını döndürür.
+
+        Başlık alanları ve sınıfları aynı olan bir sınav zaten kayıtlıysa yeni
+        kayıt açılmaz ve o kayıt değiştirilmez (aynı sınavı yeniden üretmek
+        listeyi çoğaltmaz). tohum ve strateji yalnızca yeni kayda yazılır;
+        kayıtlı sınavın tohumu, yeni yerleşimiyle birlikte yerlesim_kaydet
+        ile güncellenir. Böylece üretim başarısız olursa kayıtlı tohum ile
+        yerleşim birbirini tutmaya devam eder.
+        """
+        tarih, saat = oturum_anahtari(baslik)
+        simdi = datetime.now(timezone.utc).isoformat(timespec="seconds")
+        strateji = _strateji_adi(strateji)
+        sinif_satirlari = [(str(r['Ad']), int(r['Kap']), int(bool(r.get('Erisilebilir')))) for r in siniflar]
+        with self._baglanti() as db:
+            sinav_id = self._ayni_sinav(db, baslik, tarih, saat, sinif_satirlari)
+            if sinav_id is not None:
+                return sinav_id
+            sinav_id = db.execute(
+                "INSERT INTO sinavlar (uni, fakulte, bolum, ders, sinav_turu, tarih, gun, saat, hoca, tohum, strateji, olusturma) "
+                "VALUES (?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?, ?)",
+                (baslik['uni'], baslik['fakulte'], baslik['bolum'], baslik['ders'].strip(), baslik['sinav_turu'],
+                 tarih, gun_anahtari(tarih), saat, baslik['hoca'], tohum, strateji, simdi),
+            ).lastrowid
+            db.executemany(
+                "INSERT INTO sinav_siniflari (sinav_id, sira, ad, kap, erisilebilir) VALUES (?, ?, ?, ?, ?)",
+                [(sinav_id, i, *r) for i, r in enumerate(sinif_satirlari)],
+            )
+        return sinav_id
+
+    @staticmethod
+    def _ayni_sinav(db, baslik, tarih, saat, sinif_satirlari):
+        """Başlık alanları ve sınıfları aynı kayıtlı sınavın numarası (yoksa None)"""
+        adaylar = db.execute(
+            "SELECT * FROM sinavlar WHERE ders = ? AND gun = ? AND saat = ? ORDER BY id DESC",
+            (baslik['ders'].strip(), gun_anahtari(tarih), saat),
+        ).fetchall()
+        for kayit in adaylar:
+            if kayit['tarih'] != tarih or any(
+                kayit[alan] != baslik[alan] for alan in ("uni", "fakulte", "bolum", "sinav_turu", "hoca")
+            ):
+                continue
+            kayitli = db.execute(
+                "SELECT ad, kap, erisilebilir FROM sinav_siniflari WHERE sinav_id = ? ORDER BY sira", (kayit['id'],)
+            ).fetchall()
+            if [tuple(r) for r in kayitli] == sinif_satirlari:
+                return kayit['id']
+        return None
+
+    def sinavlar(self, ders=None, tarih=None, saat=None, en_fazla=50):
+        """Sınavları ders, tarih ve saate göre süzer (indeksli); en yeni oturum önce"""
+        kosullar, degerler = [], []
+        if ders:
+            kosullar.append("ders = ?")
+            degerler.append(str(ders).strip())
+        if tarih:
+            kosullar.append("gun = ?")
+            degerler.append(gun_anahtari(tarih))
+        if saat:
+            kosullar.append("saat = ?")
+            degerler.append(" ".join(str(saat).split()))
+        sorgu = "SELECT * FROM sinavlar"
+        if kosullar:
+            sorgu += " WHERE " + " AND ".join(kosullar)
+        sorgu += " ORDER BY gun DESC, saat DESC, id DESC LIMIT ?"
+        with self._baglanti() as db:
+            return [dict(r) for r in db.execute(sorgu, (*degerler, en_fazla))]
+
+    def sinav_al(self, sinav_id):
+        """(başlık sözlüğü, sınıf listesi, kayıt) döndürür; sınav yoksa None"""
+        with self._baglanti() as db:
+            kayit = db.execute("SELECT * FROM sinavlar WHERE id = ?", (sinav_id,)).fetchone()
+            if kayit is None:
+                return None
+            siniflar = db.execute(
+                "SELECT ad, kap, erisilebilir FROM sinav_siniflari WHERE sinav_id = ? ORDER BY sira", (sinav_id,)
+            ).fetchall()
+        baslik = {alan: kayit[alan] for alan in BASLIK_SUTUNLARI}
+        siniflar = [{"Ad": r['ad'], "Kap": r['kap'], "Erisilebilir": bool(r['erisilebilir'])} for r in siniflar]
+        return baslik, siniflar, dict(kayit)
+
+    def sinav_sil(self, sinav_id):
+        with self._baglanti() as db:
+            db.execute("DELETE FROM sinavlar WHERE id = ?", (sinav_id,))
+
+    # Yerleşimler
+
+    def yerlesim_kaydet(self, sinav_id, siniflar, tohum=None, strateji=None):
+        """Sınavın yerleşimini ve onu üreten tohum ile stratejiyi kaydeder (öncekilerin yerine).
+
+        siniflar: (sınıf adı, liste) çiftleri; listenin ilk üç sütunu No, Ad,
+        Soyad ve satır sırası yoklamadaki sıra numarasıdır. Yerleşim ve tohum
+        tek işlemde yazılır. Kaydedilen öğrenci sayısını döndürür.
+        """
+        satirlar = []
+        for sinif_adi, liste in siniflar:
+            for sira, (no, ad, soyad) in enumerate(liste.iloc[:, :3].itertuples(index=False, name=None), start=1):
+                satirlar.append((sinav_id, str(sinif_adi), sira, _metin(no).strip(), _metin(ad), _metin(soyad)))
+        with self._baglanti() as db:
+            db.execute(
+                "UPDATE sinavlar SET tohum = ?, strateji = ? WHERE id = ?", (tohum, _strateji_adi(strateji), sinav_id)
+            )
+            db.execute("DELETE FROM yerlesimler WHERE sinav_id = ?", (sinav_id,))
+            db.executemany(
+                "INSERT INTO yerlesimler (sinav_id, sinif, sira, no, ad, soyad) VALUES (?, ?, ?, ?, ?, ?)", satirlar
+            )
+        return len(satirlar)
+
+    def ogrenci_yerleri(self, no):
+        """Öğrencinin kayıtlı tüm yerleşimleri (yerlesimler(no) indeksiyle), en yeni oturum önce"""
+        with self._baglanti() as db:
+            return [dict(r) for r in db.execute(
+                "SELECT y.sinav_id, y.sinif, y.sira, y.no, y.ad, y.soyad, s.ders, s.sinav_turu, s.tarih, s.saat "
+                "FROM yerlesimler y JOIN sinavlar s ON s.id = y.sinav_id "
+                "WHERE y.no = ? ORDER BY s.gun DESC, s.saat DESC",
+                (str(no).strip(),),
+            )]
+
+    def tum_yerlesimler(self, gun=None):
+        """Tüm yerleşim satırları sınav bilgileriyle; gun (YYYY-AA-GG) verilirse o günden itibaren olanlar"""
+        sorgu = (
+            "SELECT y.sinav_id, y.sinif, y.sira, y.no, y.ad, y.soyad, s.ders, s.sinav_turu, s.tarih, s.gun, s.saat "
+            "FROM yerlesimler y JOIN sinavlar s ON s.id = y.sinav_id"
+        )
+        degerler = ()
+        if gun:
+            sorgu += " WHERE s.gun >= ?"
+            degerler = (gun_anahtari(gun),)
+        with self._baglanti() as db:
+            yield from db.execute(sorgu + " ORDER BY s.gun, s.saat, y.sinav_id", degerler)
+
+    def sinif_listesi(self, sinav_id, sinif):
+        """Bir sınavın bir sınıfına yerleşen öğrenciler, sıra numarasına göre"""
+        with self._baglanti() as db:
+            return [dict(r) for r in db.execute(
+                "SELECT sira, no, ad, soyad FROM yerlesimler WHERE sinav_id = ? AND sinif = ? ORDER BY sira",
+                (sinav_id, str(sinif)),
+            )]
@@ -0,0 +1,289 @@
+"""Belge üretimini arka planda çalıştıran iş kuyruğu.
+
+Streamlit oturumu üretimi beklemez: her üretim bir iş olarak kuyruğa
+gönderilir ve iş parçacıklarında çalışır. İşin durumu ve biten sınıflar
+anlık izlenebilir; çıktı diske (IS_KLASORU) yazıldığından tarayıcı yenilense
+veya oturum kapansa da iş numarasıyla daha sonra indirilebilir.
+
+Eşzamanlılık sınırları:
+    - normal işler `is_sayisi` iş parçacığında çalışır,
+    - öğrenci sayısı `buyuk_esik` ve üzerindeki işler ayrı bir kuyrukta
+      `buyuk_is_sayisi` iş parçacığında çalışır; böylece tek bir büyük sınav
+      diğer kullanıcıların işlerini bekletmez,
+    - bir oturum aynı anda en fazla `oturum_basina` bekleyen/çalışan işe sahip olabilir,
+    - paralel üretilen işler tek bir paylaşılan süreç havuzunu kullanır; toplam
+      işçi süreç sayısı `surec_sayisi` ile sınırlıdır ve işin `is_sayisi`
+      değeri bu sınıra indirilir.
+Biten işler ve dosyaları `saklama` saniye sonra silinir. Kuyruk süreç
+içindedir; sunucu yeniden başlarsa bekleyen işler kaybolur.
+
+Kuyruğa bir SinavDeposu verilir ve iş bir sınav numarasıyla gönderilirse,
+biten işin yerleşimi (öğrenci → sınıf, sıra) depoya kaydedilir.
+
+uretim (fpdf, fontTools) ilk iş çalıştığında yüklenir; kuyruğu oluşturmak ve
+işleri listelemek arayüzün ilk açılışını yavaşlatmaz.
+"""
+import os
+import secrets
+import sqlite3
+import tempfile
+import threading
+import time
+from concurrent.futures import ThreadPoolExecutor
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import nullcontext
+
+from olcum import Profil
+
+IS_KLASORU = os.environ.get("SINAV_IS_KLASORU") or os.path.join(tempfile.gettempdir(), "sinav_isleri")
+BUYUK_IS_OGRENCI = 2000
+SAKLAMA_SURESI = 24 * 3600
+# Tüm işlerin birlikte kullanabileceği en fazla işçi süreç sayısı
+SUREC_BUTCESI = os.cpu_count() or 1
+
+# Çıktı biçimi → (uzantı, MIME türü)
+CIKTI_TURLERI = {"zip": ("zip", "application/zip"), "pdf": ("pdf", "application/pdf")}
+
+
+class Is:
+    """Bir üretim işinin durumu: sirada, calisiyor, bitti veya hata"""
+
+    def __init__(self, no, oturum, baslik, cikti, toplam, buyuk):
+        self.no = no
+        self.oturum = oturum
+        self.baslik = baslik
+        self.cikti = cikti
+        self.toplam = toplam
+        self.buyuk = buyuk
+        self.durum = "sirada"
+        self.olusturma = time.time()
+        self.baslama = None
+        self.bitis = None
+        # Belgeleri hazır olan sınıflar (bitiş sırasıyla)
+        self.biten = []
+        self.hata = None
+        self.dosya = None
+        # ogrenci, sinif_sayisi, dosya_sayisi, tohum, pano_sutunu, yeniden, sinav_id
+        self.sonuc = {}
+        # Belgeler üretildi ama yerleşim depoya yazılamadıysa nedeni
+        self.uyari = None
+        self.olcum = None
+        self.profil = None
+
+    @property
+    def aktif(self):
+        return self.durum in ("sirada", "calisiyor")
+
+    @property
+    def ilerleme(self):
+        if self.durum == "bitti":
+            return 1.0
+        return min(len(self.biten) / self.toplam, 1.0) if self.toplam else 0.0
+
+    @property
+    def sure(self):
+        if self.baslama is None:
+            return None
+        return (self.bitis or time.time()) - self.baslama
+
+    @property
+    def dosya_adi(self):
+        return f"sinav_belgeleri.{CIKTI_TURLERI[self.cikti][0]}"
+
+    @property
+    def mime(self):
+        return CIKTI_TURLERI[self.cikti][1]
+
+    def sinif_bitti(self, sinif_adi):
+        self.biten.append(str(sinif_adi))
+
+    def ortak_alanlar(self):
+        """Ölçüm kayıtlarının her satırına eklenecek iş bilgileri"""
+        return {'is': self.no, 'cikti': self.cikti, **self.sonuc}
+
+
+class IsKuyrugu:
+    """Üretim işlerini sınırlı sayıda iş parçacığında çalıştıran, süreç içi kuyruk"""
+
+    def __init__(self, is_sayisi=2, buyuk_is_sayisi=1, oturum_basina=3, klasor=IS_KLASORU,
+                 buyuk_esik=BUYUK_IS_OGRENCI, saklama=SAKLAMA_SURESI, depo=None, surec_sayisi=SUREC_BUTCESI):
+        self.depo = depo
+        self.surec_sayisi = max(1, surec_sayisi)
+        self.oturum_basina = oturum_basina
+        self.klasor = klasor
+        self.buyuk_esik = buyuk_esik
+        self.saklama = saklama
+        self._normal = ThreadPoolExecutor(is_sayisi, thread_name_prefix="sinav-is")
+        self._buyuk = ThreadPoolExecutor(buyuk_is_sayisi, thread_name_prefix="sinav-buyuk-is")
+        # Paylaşılan süreç havuzu (ProcessPoolExecutor); ilk paralel işte açılır
+        self._surecler = None
+        self._isler = {}
+        self._kilit = threading.Lock()
+        os.makedirs(klasor, exist_ok=True)
+
+    def gonder(self, oturum, baslik, df, rooms, cikti="zip", tohum=None, strateji=None, pano_sutunu=1,
+               is_sayisi=1, sikistirma="deflate", seviye=None, onbellek=None, olcum=None, profil=False,
+               sinav_id=None):
+        """Üretimi kuyruğa ekler ve Is nesnesini döndürür.
+
+        Oturumun sınırı doluysa ValueError verir. olcum (Olcum) verilirse işe
+        bağlanır; profil True ise iş cProfile ile profillenir. sinav_id
+        verilirse yerleşim bu sınav için depoya kaydedilir.
+        """
+        if cikti not in CIKTI_TURLERI:
+            raise ValueError(f"Bilinmeyen çıktı biçimi: {cikti}")
+        self.temizle()
+        with self._kilit:
+            aktif = sum(1 for i in self._isler.values() if i.oturum == oturum and i.aktif)
+            if aktif >= self.oturum_basina:
+                raise ValueError(
+                    f"Aynı anda en fazla {self.oturum_basina} iş çalıştırılabilir; önceki işlerin bitmesini bekleyin."
+                )
+            is_ = Is(secrets.token_hex(6), oturum, dict(baslik), cikti, len(rooms), len(df) >= self.buyuk_esik)
+            is_.olcum = olcum
+            is_.profil = Profil() if profil else None
+            self._isler[is_.no] = is_
+        ayarlar = dict(tohum=tohum, strateji=strateji, pano_sutunu=pano_sutunu, is_sayisi=is_sayisi,
+                       sikistirma=sikistirma, seviye=seviye, onbellek=onbellek, sinav_id=sinav_id)
+        havuz = self._buyuk if is_.buyuk else self._normal
+        havuz.submit(self._calistir, is_, df, [dict(r) for r in rooms], ayarlar)
+        return is_
+
+    def al(self, no):
+        """İş numarasına göre işi döndürür (bulunamazsa None)"""
+        self.temizle()
+        with self._kilit:
+            return self._isler.get(str(no).strip())
+
+    def oturum_isleri(self, oturum):
+        """Oturumun işleri, en yenisi önce"""
+        with self._kilit:
+            isler = [i for i in self._isler.values() if i.oturum == oturum]
+        return sorted(isler, key=lambda i: i.olusturma, reverse=True)
+
+    def sira(self, is_):
+        """Aynı kuyrukta bu işten önce bekleyen iş sayısı (sıradaki işler için)"""
+        with self._kilit:
+            return sum(
+                1 for i in self._isler.values()
+                if i.durum == "sirada" and i.buyuk == is_.buyuk and i.olusturma < is_.olusturma
+            )
+
+    def temizle(self):
+        """Saklama süresi dolan biten işleri ve dosyalarını siler"""
+        sinir = time.time() - self.saklama
+        with self._kilit:
+            # bitis, durum "bitti"/"hata" olduktan sonra (iş kapanırken) atanır; o arada iş silinmez
+            eski = [i for i in self._isler.values() if not i.aktif and i.bitis is not None and i.bitis < sinir]
+            for i in eski:
+                del self._isler[i.no]
+        for i in eski:
+            if i.dosya and os.path.exists(i.dosya):
+                os.remove(i.dosya)
+
+    def kapat(self):
+        self._normal.shutdown(wait=False, cancel_futures=True)
+        self._buyuk.shutdown(wait=False, cancel_futures=True)
+        if self._surecler is not None:
+            self._surecler.shutdown(wait=False, cancel_futures=True)
+
+    def _surec_havuzu(self, is_sayisi):
+        """İşin kullanacağı SurecHavuzu; is_sayisi surec_sayisi ile sınırlanır, 1 ise None"""
+        from uretim import SurecHavuzu, surec_yurutucusu
+        is_sayisi = min(int(is_sayisi or 1), self.surec_sayisi)
+        if is_sayisi <= 1:
+            return None
+        with self._kilit:
+            if self._surecler is None:
+                self._surecler = surec_yurutucusu(self.surec_sayisi)
+            return SurecHavuzu(self._surecler, is_sayisi)
+
+    def _havuzu_birak(self, havuz):
+        """Çöken işçi havuzu kullanılamaz bırakır; sonraki paralel iş yeni havuz açar"""
+        with self._kilit:
+            if havuz is not None and self._surecler is havuz.yurutucu:
+                self._surecler = None
+        if havuz is not None:
+            havuz.yurutucu.shutdown(wait=False, cancel_futures=True)
+
+    def _yerlesimi_kaydet(self, is_, df, rooms, ayarlar):
+        """Yerleşim tohumdan yeniden hesaplanır (belgelerdekiyle aynıdır) ve tohumla birlikte depoya yazılır"""
+        from uretim import siniflara_dagit
+        siniflar = (
+            (room['Ad'], room_list)
+            for room, room_list in siniflara_dagit(df, rooms, ayarlar['tohum'], ayarlar['strateji'])
+            if not room_list.empty
+        )
+        try:
+            self.depo.yerlesim_kaydet(ayarlar['sinav_id'], siniflar, ayarlar['tohum'], ayarlar['strateji'])
+        except sqlite3.Error as e:
+            is_.uyari = f"Belgeler oluşturuldu ancak yerleşim kaydedilemedi: {e}"
+
+    def _calistir(self, is_, df, rooms, ayarlar):
+        from uretim import birlesik_pdf, sinav_belgeleri, uretim_zamani, zipe_akit
+        from yerlestirme import YerlestirmeHatasi, strateji_al
+        is_.durum = "calisiyor"
+        is_.baslama = time.time()
+        hedef = os.path.join(self.klasor, f"{is_.no}.{CIKTI_TURLERI[is_.cikti][0]}")
+        # Yarım kalan dosya indirilemesin diye önce geçici ada yazılır
+        gecici = hedef + ".yaziliyor"
+        tohum = ayarlar['tohum']
+        onbellek = ayarlar['onbellek']
+        isabet_once = onbellek.isabet if onbellek is not None else 0
+        havuz = None
+        try:
+            # Öğrenci düşmeyen sınıflar için belge üretilmez (ilerleme de bildirilmez);
+            # ilerleme çubuğu yalnızca dolu sınıfları sayar
+            is_.toplam = sum(
+                1 for konumlar in strateji_al(ayarlar['strateji']).dagit(df, rooms, tohum) if len(konumlar)
+            )
+            zaman = uretim_zamani()
+            with is_.profil.calistir() if is_.profil else nullcontext():
+                if is_.cikti == "pdf":
+                    sinif_sayisi = birlesik_pdf(
+                        gecici, is_.baslik, df, rooms, zaman=zaman, tohum=tohum, strateji=ayarlar['strateji'],
+                        aciklama=f"tohum={tohum}", pano_sutunu=ayarlar['pano_sutunu'],
+                        olcum=is_.olcum, ilerleme=is_.sinif_bitti,
+                    )
+                    dosya_sayisi = 1
+                else:
+                    havuz = self._surec_havuzu(ayarlar['is_sayisi'])
+                    belgeler = sinav_belgeleri(
+                        is_.baslik, df, rooms, havuz=havuz, zaman=zaman, tohum=tohum, onbellek=onbellek,
+                        strateji=ayarlar['strateji'], pano_sutunu=ayarlar['pano_sutunu'],
+                        olcum=is_.olcum, ilerleme=is_.sinif_bitti,
+                    )
+                    dosya_sayisi = zipe_akit(
+                        gecici, belgeler, zaman, ayarlar['sikistirma'], ayarlar['seviye'],
+                        aciklama=f"tohum={tohum}", olcum=is_.olcum,
+                    )
+                    sinif_sayisi = (dosya_sayisi - 1) // 2
+            os.replace(gecici, hedef)
+            is_.dosya = hedef
+            is_.sonuc = {
+                'ogrenci': len(df), 'sinif_sayisi': sinif_sayisi, 'dosya_sayisi': dosya_sayisi,
+                'tohum': tohum, 'pano_sutunu': ayarlar['pano_sutunu'],
+                # Önbellek paylaşıldığından eşzamanlı işlerde yaklaşık değerdir
+                'yeniden': (onbellek.isabet - isabet_once) if onbellek is not None else 0,
+            }
+            if self.depo is not None and ayarlar['sinav_id'] is not None:
+                is_.sonuc['sinav_id'] = ayarlar['sinav_id']
+                self._yerlesimi_kaydet(is_, df, rooms, ayarlar)
+            is_.durum = "bitti"
+            if is_.olcum is not None:
+                is_.olcum.logla(**is_.ortak_alanlar())
+        except YerlestirmeHatasi as e:
+            # Yerleşim kısıtları sağlanamadı (ör. erişilebilir sınıf kapasitesi yetersiz)
+            is_.hata = f"Yerleşim yapılamadı: {e}"
+            is_.durum = "hata"
+        except Exception as e:
+            if isinstance(e, BrokenProcessPool):
+                self._havuzu_birak(havuz)
+            is_.hata = f"Beklenmeyen hata ({type(e).__name__}): {e}"
+            is_.durum = "hata"
+        finally:
+            if os.path.exists(gecici):
+                os.remove(gecici)
+            if is_.olcum is not None:
+                is_.olcum.kapat()
+            is_.bitis = time.time()
@@ -0,0 +1,175 @@
+"""Öğrenci listesi dosyalarını okuma yardımcıları.
+
+Desteklenen biçimler: Excel şablonu (.xlsx), CSV (UTF-8 veya cp1254) ve
+Parquet. Hangi biçimden okunursa okunsun sonuç aynı şemaya getirilir: ilk üç
+sütun No, Ad, Soyad olur ve tüm değerler metin olarak tutulur.
+"""
+import csv
+import hashlib
+import io
+import os
+
+import pandas as pd
+
+try:
+    import pyarrow as pa
+    from pyarrow import csv as pa_csv
+    PYARROW_VAR = True
+except ImportError:
+    PYARROW_VAR = False
+
+DESTEKLENEN_UZANTILAR = ["xlsx", "csv", "parquet"]
+
+# Öğrenci işleri dışa aktarımlarında görülen sütun başlıkları (küçük harf, Türkçe karaktersiz)
+SUTUN_ESLEMELERI = {
+    "No": {"no", "ogrenci no", "ogrenci numarasi", "numara", "ogrenci_no", "ogrno", "student id", "student no"},
+    "Ad": {"ad", "adi", "isim", "ogrenci adi", "first name", "name"},
+    "Soyad": {"soyad", "soyadi", "ogrenci soyadi", "last name", "surname"},
+}
+
+# Kısıtlı yerleşimde kullanılan isteğe bağlı sütunlar (bkz. yerlestirme.py)
+EK_SUTUN_ESLEMELERI = {
+    "Şube": {"sube", "sube no", "grup", "section"},
+    "Erişilebilirlik": {"erisilebilirlik", "engelli", "engel durumu", "ozel gereksinim", "accessibility"},
+}
+
+# CSV için denenecek kodlamalar; Türkçe Windows dışa aktarımları çoğunlukla cp1254'tür
+CSV_KODLAMALARI = ("utf-8-sig", "cp1254")
+
+_BASLIK_TABLOSU = str.maketrans("çğıöşüÇĞİÖŞÜ", "cgiosuCGIOSU")
+
+
+def icerik_ozeti(veri):
+    """Yüklenen dosya içeriğinin SHA-256 özeti (önbellek anahtarı olarak kullanılır)"""
+    return hashlib.sha256(veri).hexdigest()
+
+
+def bicim_belirle(veri, dosya_adi=None):
+    """Dosya biçimini uzantıdan, uzantı yoksa içeriğin ilk baytlarından belirler"""
+    if dosya_adi:
+        uzanti = os.path.splitext(dosya_adi)[1].lower().lstrip(".")
+        if uzanti in DESTEKLENEN_UZANTILAR:
+            return uzanti
+    if veri[:4] == b"PAR1":
+        return "parquet"
+    if veri[:4] == b"PK\x03\x04":
+        return "xlsx"
+    return "csv"
+
+
+def _csv_metni(veri):
+    for kodlama in CSV_KODLAMALARI:
+        try:
+            return veri.decode(kodlama)
+        except UnicodeDecodeError:
+            continue
+    raise ValueError("CSV dosyasının karakter kodlaması tanınamadı (UTF-8 veya Windows-1254 olmalıdır).")
+
+
+def _csv_ayiraci(metin):
+    try:
+        return csv.Sniffer().sniff(metin[:4096], delimiters=",;\t|").delimiter
+    except csv.Error:
+        return ","
+
+
+def _basliklari_ayir(basliklar):
+    """Boş ve yinelenen başlıkları pandas'ın CSV okuyucusu gibi adlandırır ("Unnamed: 4", "Ad.1").
+
+    pyarrow yinelenen adları olduğu gibi bırakır; aynı adlı iki sütun
+    sema_normallestir'de tek sütun yerine tablo döndürür.
+    """
+    adlar, sayaclar = [], {}
+    for i, ad in enumerate(basliklar):
+        if not ad.strip():
+            ad = f"Unnamed: {i}"
+        yeni = ad
+        while yeni in adlar:
+            sayaclar[ad] = sayaclar.get(ad, 0) + 1
+            yeni = f"{ad}.{sayaclar[ad]}"
+        adlar.append(yeni)
+    return adlar
+
+
+def csv_oku(veri):
+    """CSV içeriğini oku; kodlama ve ayraç (',', ';', sekme) otomatik bulunur"""
+    metin = _csv_metni(veri)
+    ayirac = _csv_ayiraci(metin)
+    if PYARROW_VAR:
+        # Tüm sütunlar açıkça metin olarak okunur (pandas'ın pyarrow motoru dtype=str
+        # verilse bile sayıları önce tamsayıya çevirip baştaki sıfırları siler)
+        basliklar = _basliklari_ayir(next(csv.reader(io.StringIO(metin), delimiter=ayirac), []))
+        tablo = pa_csv.read_csv(
+            io.BytesIO(metin.encode("utf-8")),  # pyarrow UTF-8 bekler; kodlama yukarıda çözüldü
+            read_options=pa_csv.ReadOptions(column_names=basliklar, skip_rows=1) if basliklar else None,
+            parse_options=pa_csv.ParseOptions(delimiter=ayirac),
+            convert_options=pa_csv.ConvertOptions(
+                column_types={b: pa.string() for b in basliklar}, strings_can_be_null=True
+            ),
+        )
+        return tablo.to_pandas()
+    return pd.read_csv(io.StringIO(metin), sep=ayirac, dtype=str)
+
+
+def parquet_oku(veri):
+    if not PYARROW_VAR:
+        raise ValueError("Parquet dosyalarını okumak için pyarrow kurulu olmalıdır.")
+    # Arrow türleri korunur: boş değer içeren tamsayı sütunu float64'e dönüp
+    # numaralar "20231234.0" olarak yazılmaz
+    df = pd.read_parquet(io.BytesIO(veri), engine="pyarrow", dtype_backend="pyarrow")
+    # Sayısal sütunlar da (ör. öğrenci numarası) metne çevrilir; boş değerler korunur
+    return df.astype(str).where(df.notna())
+
+
+def _baslik_normallestir(ad):
+    return " ".join(str(ad).translate(_BASLIK_TABLOSU).lower().replace("_", " ").split())
+
+
+def sema_normallestir(df):
+    """Sütunları No, Ad, Soyad ilk üç sütun olacak şekilde düzenler.
+
+    Başlıklar tanınırsa bu sütunlar öne alınır (diğer sütunlar korunur);
+    tanınmazsa ilk üç sütun sırasıyla No, Ad, Soyad kabul edilir. Şube ve
+    erişilebilirlik sütunları tanınırsa standart adlarına çevrilir.
+    """
+    if len(df.columns) < 3:
+        return df
+    ek = {}
+    for sutun in df.columns:
+        baslik = _baslik_normallestir(sutun)
+        for hedef, adlar in EK_SUTUN_ESLEMELERI.items():
+            if baslik in adlar and hedef not in ek.values():
+                ek[sutun] = hedef
+    df = df.rename(columns=ek)
+    bulunan = {}
+    for sutun in df.columns:
+        baslik = _baslik_normallestir(sutun)
+        for hedef, adlar in SUTUN_ESLEMELERI.items():
+            if baslik in adlar and hedef not in bulunan:
+                bulunan[hedef] = sutun
+    if len(bulunan) == 3:
+        ilk = [bulunan["No"], bulunan["Ad"], bulunan["Soyad"]]
+        df = df[ilk + [c for c in df.columns if c not in ilk]]
+    return df.rename(columns=dict(zip(df.columns[:3], ["No", "Ad", "Soyad"])))
+
+
+def liste_oku(kaynak, dosya_adi=None):
+    """Öğrenci listesini oku; kaynak dosya yolu veya dosya içeriği (bytes) olabilir.
+
+    Tüm sütunlar metin olarak okunur; böylece "No" sütunu hiçbir zaman sayıya
+    (ör. 20240001.0) çevrilmez ve baştaki sıfırlar korunur.
+    """
+    if not isinstance(kaynak, (bytes, bytearray)):
+        dosya_adi = dosya_adi or os.fspath(kaynak)
+        with open(kaynak, "rb") as f:
+            kaynak = f.read()
+    veri = bytes(kaynak)
+
+    bicim = bicim_belirle(veri, dosya_adi)
+    if bicim == "parquet":
+        df = parquet_oku(veri)
+    elif bicim == "csv":
+        df = csv_oku(veri)
+    else:
+        df = pd.read_excel(io.BytesIO(veri), dtype=str)
+    return sema_normallestir(df)
@@ -0,0 +1,216 @@
+"""Belge üretimi için isteğe bağlı aşama ölçümleri ve profil alma.
+
+Olcum nesnesi uretim fonksiyonlarına `olcum=` ile verilirse her aşama
+(okuma, yerleşim, her sınıfın belgeleri, pano, ZIP'e yazma) için duvar
+saati, işlemci süresi ve istenirse tracemalloc ile tepe bellek kaydedilir;
+üretilen belgelerin sayfa sayısı ve boyutu da kayda eklenir. Kayıtlar tablo
+olarak özetlenir veya JSON satırları (yapılandırılmış günlük) olarak dışa
+aktarılır. Verilmezse üretim hiçbir ölçüm yapmaz.
+
+İşlemci süresi aşamayı çalıştıran iş parçacığınınkidir (time.thread_time);
+aynı süreçte eşzamanlı çalışan işler birbirinin süresine eklenmez. Süreç
+havuzunda üretilen sınıfların süreleri işçi süreçte ölçülür ve bu süreçteki
+aşamalardan ayrı olarak 'havuz_sinif' kayıtlarına yazılır.
+
+Kayıtlar 'olcum' günlüğüne INFO düzeyinde yazılır (bkz. gunluk_ayarla).
+
+Aşamalar iç içe açılmamalıdır: tracemalloc tepe değeri her aşamanın başında
+sıfırlanır. tracemalloc süreç genelinde olduğundan bellek ölçen Olcum
+nesneleri izlemeyi birlikte açık tutar; aynı anda çalışan işlerin bellek
+değerleri birbirini etkiler.
+"""
+import collections
+import contextlib
+import cProfile
+import io
+import json
+import logging
+import os
+import pstats
+import re
+import tempfile
+import threading
+import time
+import tracemalloc
+from datetime import datetime, timezone
+
+try:
+    import resource
+    RESOURCE_VAR = True
+except ImportError:  # Windows
+    RESOURCE_VAR = False
+
+logger = logging.getLogger(__name__)
+
+# tracemalloc'u açık tutan Olcum nesnesi sayısı; izleme dışarıda başlatıldıysa durdurulmaz
+_izleyen = 0
+_dis_izleme = False
+_izleme_kilidi = threading.Lock()
+
+# asama: okuma, yerlesim, sinif, havuz_sinif, pano, cikti, zip; bellek: aşama boyunca ek tepe bellek (bayt, ölçülmediyse None)
+OlcumKaydi = collections.namedtuple('OlcumKaydi', 'asama etiket duvar cpu bellek sayfa bayt')
+
+_SAYFA = re.compile(rb"/Type\s*/Page\b")
+
+
+def gunluk_ayarla(seviye=logging.INFO):
+    """'olcum' günlüğünü standart hataya yazacak şekilde ayarlar; tekrar çağrılırsa yalnızca seviye değişir.
+
+    Ayarlanmazsa INFO kayıtları logging'in varsayılan WARNING eşiğinde düşer.
+    """
+    logger.setLevel(seviye)
+    if not logger.handlers:
+        isleyici = logging.StreamHandler()
+        isleyici.setFormatter(logging.Formatter("%(message)s"))
+        logger.addHandler(isleyici)
+        logger.propagate = False
+
+
+def sayfa_sayisi(veri):
+    """fpdf çıktısındaki sayfa nesnelerinin sayısı"""
+    return len(_SAYFA.findall(veri))
+
+
+def asama(olcum, ad, **etiket):
+    """olcum verilmişse aşamayı ölçer, verilmemişse hiçbir şey yapmaz.
+
+    Bağlam bir sözlük verir; içine 'sayfa' ve 'bayt' yazılırsa kayda eklenir.
+    """
+    if olcum is None:
+        return contextlib.nullcontext({})
+    return olcum.asama(ad, **etiket)
+
+
+class Olcum:
+    """Bir üretim çalışmasının aşama kayıtlarını toplar"""
+
+    def __init__(self, bellek=False):
+        self.bellek = bellek
+        self.kayitlar = []
+        self.baslangic = datetime.now(timezone.utc)
+        self._izliyor = False
+        if bellek:
+            global _izleyen, _dis_izleme
+            with _izleme_kilidi:
+                if _izleyen == 0:
+                    _dis_izleme = tracemalloc.is_tracing()
+                    if not _dis_izleme:
+                        tracemalloc.start()
+                _izleyen += 1
+            self._izliyor = True
+
+    def kapat(self):
+        """Bellek izlemesini bırakır; izleyen başka Olcum kalmadıysa tracemalloc durdurulur"""
+        if self._izliyor:
+            global _izleyen
+            with _izleme_kilidi:
+                _izleyen -= 1
+                if _izleyen == 0 and not _dis_izleme:
+                    tracemalloc.stop()
+            self._izliyor = False
+
+    @contextlib.contextmanager
+    def asama(self, ad, **etiket):
+        ek = {}
+        bellek0 = None
+        if self._izliyor:
+            tracemalloc.reset_peak()
+            bellek0 = tracemalloc.get_traced_memory()[0]
+        cpu0, duvar0 = time.thread_time(), time.perf_counter()
+        try:
+            yield ek
+        finally:
+            duvar, cpu = time.perf_counter() - duvar0, time.thread_time() - cpu0
+            bellek = tracemalloc.get_traced_memory()[1] - bellek0 if bellek0 is not None else None
+            self.kayitlar.append(OlcumKaydi(ad, etiket, duvar, cpu, bellek, ek.get('sayfa'), ek.get('bayt')))
+
+    def ekle(self, ad, duvar=0.0, cpu=0.0, sayfa=None, bayt=None, **etiket):
+        """Ölçülmeden elde edilen bir kayıt ekler (ör. önbellekten gelen veya işçi süreçte üretilen belge)"""
+        self.kayitlar.append(OlcumKaydi(ad, etiket, duvar, cpu, None, sayfa, bayt))
+
+    def ozet(self):
+        """Aşama başına toplamlar: [{asama, adet, duvar, cpu, bellek, sayfa, bayt}, ...] (ilk görülme sırasıyla).
+
+        bellek aşama kayıtlarının en büyüğüdür; ölçülmeyen alanlar None kalır.
+        """
+        toplam = {}
+        for k in self.kayitlar:
+            s = toplam.setdefault(k.asama, {'asama': k.asama, 'adet': 0, 'duvar': 0.0, 'cpu': 0.0,
+                                            'bellek': None, 'sayfa': None, 'bayt': None})
+            s['adet'] += 1
+            s['duvar'] += k.duvar
+            s['cpu'] += k.cpu
+            if k.bellek is not None:
+                s['bellek'] = max(s['bellek'] or 0, k.bellek)
+            if k.sayfa is not None:
+                s['sayfa'] = (s['sayfa'] or 0) + k.sayfa
+            if k.bayt is not None:
+                s['bayt'] = (s['bayt'] or 0) + k.bayt
+        return list(toplam.values())
+
+    def sozluk_satirlari(self):
+        """Her kayıt için düz bir sözlük (etiketler üst düzeye açılır)"""
+        return [
+            {'asama': k.asama, **k.etiket, 'duvar': k.duvar, 'cpu': k.cpu, 'bellek': k.bellek,
+             'sayfa': k.sayfa, 'bayt': k.bayt}
+            for k in self.kayitlar
+        ]
+
+    def tepe_rss(self):
+        """Sürecin şimdiye kadarki en yüksek yerleşik belleği (bayt; ölçülemiyorsa None)"""
+        if not RESOURCE_VAR:
+            return None
+        tepe = resource.getrusage(resource.RUSAGE_SELF).ru_maxrss
+        # Linux KiB, macOS bayt verir
+        return tepe if os.uname().sysname == "Darwin" else tepe * 1024
+
+    def json_satirlari(self, **ortak):
+        """Kayıtları JSON satırları olarak döndürür; ortak alanlar (ör. tohum) her satıra eklenir"""
+        zaman = self.baslangic.isoformat(timespec="seconds")
+        return "".join(
+            json.dumps({'zaman': zaman, **ortak, **satir}, ensure_ascii=False, default=str) + "\n"
+            for satir in self.sozluk_satirlari()
+        )
+
+    def logla(self, **ortak):
+        """Kayıtları 'olcum' günlüğüne JSON satırları olarak yazar"""
+        for satir in self.json_satirlari(**ortak).splitlines():
+            logger.info(satir)
+
+
+class Profil:
+    """Tek bir üretim çalışmasının cProfile profili.
+
+    Yalnızca bu süreçte çalışan kod profillenir; paralel işçi süreçler dahil edilmez.
+    """
+
+    def __init__(self):
+        self.profil = cProfile.Profile()
+        # (siralama, adet) → metin; profil yeniden çalıştırılınca boşaltılır
+        self._metinler = {}
+
+    @contextlib.contextmanager
+    def calistir(self):
+        self._metinler.clear()
+        self.profil.enable()
+        try:
+            yield self
+        finally:
+            self.profil.disable()
+
+    def metin(self, siralama="cumulative", adet=30):
+        """En çok süre alan fonksiyonların pstats tablosu (bir kez hesaplanır)"""
+        metin = self._metinler.get((siralama, adet))
+        if metin is None:
+            cikti = io.StringIO()
+            pstats.Stats(self.profil, stream=cikti).strip_dirs().sort_stats(siralama).print_stats(adet)
+            metin = self._metinler[(siralama, adet)] = cikti.getvalue()
+        return metin
+
+    def bayt(self):
+        """snakeviz veya pstats ile açılabilen .prof dosyası içeriği"""
+        with tempfile.TemporaryDirectory() as klasor:
+            yol = os.path.join(klasor, "uretim.prof")
+            self.profil.dump_stats(yol)
+            with open(yol, "rb") as f:
+                return f.read()
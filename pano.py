@@ -0,0 +1,232 @@
+"""Pano listesi: tüm öğrencilerin soyada göre Türkçe alfabetik yerleşim planı.
+
+Öğrenciler sıralama anahtarlarına göre sıralanıp parça parça (öğrenci
+demetleri olarak) verilir; sayfalar bu akıştan doldurulur ve bellekte en
+fazla bir sayfalık satır tutulur. Her sayfada başlık ve sütun başlıkları
+tekrarlanır. Liste 1, 2 veya 3 sütunlu dizilebilir (sütunlar gazete düzeninde,
+önce yukarıdan aşağıya doldurulur). En sonda her harfin başladığı sıra ve
+sayfayı gösteren bir harf dizini eklenir. Ad ve soyad hücreleri sayfa sayfa
+sütun genişliğine sığdırılır (bkz. sigdirma.py).
+"""
+import collections
+import math
+
+import numpy as np
+
+from sigdirma import sigdir
+from siralama import no_genisligi, tablo_anahtarlari
+
+# Sütun düzenleri: alanlar (başlık, genişlik, hizalama, alan), sütunlar arası boşluk,
+# yazı boyutu ve satır yüksekliği. Alan: 'sira', 'no', 'ad', 'soyad', 'adsoyad', 'sinif'
+PanoDuzeni = collections.namedtuple('PanoDuzeni', 'alanlar aralik yazi satir')
+PANO_DUZENLERI = {
+    1: PanoDuzeni(
+        (("Sıra", 15, 'C', 'sira'), ("No", 25, 'C', 'no'), ("Adı", 50, 'L', 'ad'),
+         ("Soyadı", 50, 'L', 'soyad'), ("SINIF", 25, 'C', 'sinif')),
+        0, 7.5, 7,
+    ),
+    2: PanoDuzeni(
+        (("Sıra", 9, 'C', 'sira'), ("No", 19, 'C', 'no'), ("Adı Soyadı", 48, 'L', 'adsoyad'),
+         ("Sınıf", 17, 'C', 'sinif')),
+        4, 7, 6,
+    ),
+    3: PanoDuzeni(
+        (("Sıra", 8, 'C', 'sira'), ("No", 16, 'C', 'no'), ("Adı Soyadı", 27, 'L', 'adsoyad'),
+         ("Sınıf", 10, 'C', 'sinif')),
+        3.5, 6, 5.5,
+    ),
+}
+
+# Öğrenci demeti: (sıra, no, ad, soyad, sınıf)
+PanoSatiri = collections.namedtuple('PanoSatiri', 'sira no ad soyad sinif')
+
+PARCA_BOYUTU = 1000
+
+# Sığdırılan metin alanları ve sığmadıklarında kısaltma biçimi (bkz. sigdirma.sigdir)
+SIGDIRILAN_ALANLAR = {'ad': 'ad', 'soyad': None, 'adsoyad': 'ad_soyad'}
+
+# Türkçe büyük harf dönüşümü için özel durumlar ("i".upper() == "I" olurdu)
+_BUYUK_HARF = {"i": "İ", "ı": "I"}
+
+
+def bas_harf(metin):
+    """Metnin Türkçe büyük baş harfi (boşsa '#')"""
+    metin = str(metin).strip()
+    if not metin:
+        return "#"
+    harf = metin[0]
+    return _BUYUK_HARF.get(harf, harf.upper())
+
+
+def pano_satirlari(siniflar, parca_boyutu=PARCA_BOYUTU):
+    """Sınıf listelerini soyad, ad ve numaraya göre Türkçe sıralayıp parça parça verir.
+
+    siniflar: (sınıf adı, liste) çiftleri; listenin ilk üç sütunu No, Ad, Soyad.
+    Listeler birleştirilmez; yalnızca sıralama anahtarları ve konumları
+    tutulur, satırlar parça parça PanoSatiri listeleri olarak üretilir.
+    """
+    siniflar = [(ad, liste) for ad, liste in siniflar if len(liste)]
+    if not siniflar:
+        return
+    # Numaralar tüm sınıflarda aynı genişliğe doldurulur; yoksa sınıflar arası eşitlikte "100" < "99" olur
+    genislik = no_genisligi(*(liste.iloc[:, 0] for _, liste in siniflar))
+    anahtarlar, sinif_idx, satir_idx = [], [], []
+    for k, (_, liste) in enumerate(siniflar):
+        no, ad, soyad = liste.columns[:3]
+        anahtarlar.append(tablo_anahtarlari(liste, soyad, ad, no, genislik).to_numpy(dtype=object))
+        sinif_idx.append(np.full(len(liste), k))
+        satir_idx.append(np.arange(len(liste)))
+    anahtarlar = np.concatenate(anahtarlar)
+    sira = np.argsort(anahtarlar, kind='stable')
+    sinif_idx = np.concatenate(sinif_idx)[sira]
+    satir_idx = np.concatenate(satir_idx)[sira]
+    del anahtarlar
+
+    sutunlar = [(ad, [liste.iloc[:, j].tolist() for j in range(3)]) for ad, liste in siniflar]
+    for bas in range(0, len(sira), parca_boyutu):
+        parca = []
+        for n, (k, i) in enumerate(zip(sinif_idx[bas:bas + parca_boyutu], satir_idx[bas:bas + parca_boyutu])):
+            ad, (nolar, adlar, soyadlar) = sutunlar[k]
+            parca.append(PanoSatiri(bas + n + 1, nolar[i], adlar[i], soyadlar[i], ad))
+        yield parca
+
+
+def _metin(deger):
+    return "" if deger is None or (isinstance(deger, float) and math.isnan(deger)) else str(deger)
+
+
+class PanoYazici:
+    """Sıralı öğrenci akışını sayfa sayfa pano listesine yazar"""
+
+    def __init__(self, pdf, baslik, sutun_sayisi=1, yer_imleri=()):
+        if sutun_sayisi not in PANO_DUZENLERI:
+            raise ValueError(f"Pano listesi 1, 2 veya 3 sütunlu olabilir: {sutun_sayisi}")
+        self.pdf = pdf
+        self.sutun_sayisi = sutun_sayisi
+        self.duzen = PANO_DUZENLERI[sutun_sayisi]
+        self.genislik = sum(a[1] for a in self.duzen.alanlar)
+        der_clean = pdf._clean_text(baslik['ders'])
+        sinav_turu_clean = pdf._clean_text(baslik['sinav_turu'])
+        self.baslik = f"{der_clean} {sinav_turu_clean} YERLEŞİM PLANI"
+        # İlk sayfaya eklenecek (ad, seviye) yer imleri
+        self.yer_imleri = list(yer_imleri)
+        # harf → (ilk sıra, sayfa)
+        self.dizin = {}
+        self._son_harf = None
+
+    def _sayfa_basi(self):
+        pdf = self.pdf
+        pdf.add_page()
+        for ad, seviye in self.yer_imleri:
+            pdf.start_section(ad, level=seviye)
+        self.yer_imleri = []
+        pdf.set_font(pdf.fnt, 'B', 12)
+        pdf.cell(0, 10, self.baslik, ln=True, align='C')
+        pdf.ln(5)
+        pdf.set_font(pdf.fnt, 'B', 9 if self.sutun_sayisi == 1 else 8)
+        y = pdf.get_y()
+        for c in range(self.sutun_sayisi):
+            pdf.set_xy(pdf.l_margin + c * (self.genislik + self.duzen.aralik), y)
+            for baslik, w, _hiza, _alan in self.duzen.alanlar:
+                pdf.cell(w, 8, baslik, 1, 0, 'C')
+        pdf.set_xy(pdf.l_margin, y + 8)
+
+    def sayfa_satiri(self):
+        """İlk sayfa açılmadan sayfa başına düşen satır sayısı (tüm sayfalar aynı düzende)"""
+        ust = self.pdf.t_margin + 10 + 5 + 8
+        return int((self.pdf.h - self.pdf.b_margin - ust) // self.duzen.satir)
+
+    def _alan_metni(self, satir, alan):
+        pdf = self.pdf
+        if alan == 'sira':
+            return str(satir.sira)
+        if alan == 'no':
+            return _metin(satir.no)
+        if alan == 'ad':
+            return f" {pdf._clean_text(_metin(satir.ad))}"
+        if alan == 'soyad':
+            return f" {pdf._clean_text(_metin(satir.soyad))}"
+        if alan == 'adsoyad':
+            return f" {pdf._clean_text(_metin(satir.ad))} {pdf._clean_text(_metin(satir.soyad))}"
+        return f" {pdf._clean_text(_metin(satir.sinif))}"
+
+    def _sigdir(self, satirlar):
+        """Sayfadaki ad/soyad hücrelerinin sığdırılmış metinleri: {alan: [Sigdirma, ...]}"""
+        sigdirilan = {}
+        for _baslik, w, _hiza, alan in self.duzen.alanlar:
+            if alan not in SIGDIRILAN_ALANLAR:
+                continue
+            # Ad soyad alanında yalnızca ad kelimeleri kısaltılır; birleşik soyad korunur
+            ad_sayilari = [len(_metin(s.ad).split()) for s in satirlar] if alan == 'adsoyad' else None
+            sigdirilan[alan] = sigdir(self.pdf, [self._alan_metni(s, alan) for s in satirlar], w, self.duzen.yazi,
+                                      kisaltma=SIGDIRILAN_ALANLAR[alan], ad_sayilari=ad_sayilari)
+        return sigdirilan
+
+    def _hucreler(self, satir, sigdirilan):
+        """sigdirilan: bu satırın sığdırılmış metinleri {alan: Sigdirma}"""
+        pdf = self.pdf
+        for _baslik, w, hiza, alan in self.duzen.alanlar:
+            uyum = sigdirilan.get(alan)
+            if uyum is None:
+                pdf.cell(w, self.duzen.satir, self._alan_metni(satir, alan), 1, 0, hiza)
+            elif uyum.boyut != self.duzen.yazi:
+                pdf.set_font_size(uyum.boyut)
+                pdf.cell(w, self.duzen.satir, uyum.metin, 1, 0, hiza)
+                pdf.set_font_size(self.duzen.yazi)
+            else:
+                pdf.cell(w, self.duzen.satir, uyum.metin, 1, 0, hiza)
+
+    def sayfa_yaz(self, satirlar):
+        """Bir sayfalık satırları sütunlara bölerek yazar (son sayfada sütunlar dengelenir)"""
+        self._sayfa_basi()
+        pdf = self.pdf
+        y0 = pdf.get_y()
+        sutun_boyu = math.ceil(len(satirlar) / self.sutun_sayisi)
+        pdf.set_font(pdf.fnt, '', self.duzen.yazi)
+        sigdirilan = self._sigdir(satirlar)
+        for n, satir in enumerate(satirlar):
+            harf = bas_harf(satir.soyad)
+            if harf != self._son_harf:
+                self.dizin.setdefault(harf, (satir.sira, pdf.page))
+                self._son_harf = harf
+            c, r = divmod(n, sutun_boyu)
+            pdf.set_xy(pdf.l_margin + c * (self.genislik + self.duzen.aralik), y0 + r * self.duzen.satir)
+            self._hucreler(satir, {alan: uyumlar[n] for alan, uyumlar in sigdirilan.items()})
+
+    def yaz(self, parcalar):
+        """Parça parça gelen sıralı satırları sayfalara yazar; bellekte en fazla bir sayfa ve bir parça tutulur"""
+        kapasite = self.sayfa_satiri() * self.sutun_sayisi
+        bekleyen = []
+        for parca in parcalar:
+            bekleyen.extend(parca)
+            while len(bekleyen) >= kapasite:
+                self.sayfa_yaz(bekleyen[:kapasite])
+                del bekleyen[:kapasite]
+        if bekleyen or not self.dizin:
+            self.sayfa_yaz(bekleyen)
+
+    def dizin_yaz(self):
+        """Her harfin başladığı sırayı ve sayfayı gösteren harf dizini sayfası"""
+        if not self.dizin:
+            return
+        pdf = self.pdf
+        pdf.add_page()
+        pdf.set_font(pdf.fnt, 'B', 12)
+        pdf.cell(0, 10, f"{self.baslik} - HARF DİZİNİ", ln=True, align='C')
+        pdf.ln(5)
+        # Harfler üç sütuna dizilir
+        genislik, aralik = 60, 5
+        sutun_boyu = math.ceil(len(self.dizin) / 3)
+        y0 = pdf.get_y()
+        for c in range(3):
+            pdf.set_xy(pdf.l_margin + c * (genislik + aralik), y0)
+            pdf.set_font(pdf.fnt, 'B', 9)
+            for baslik, w in (("Harf", 15), ("İlk Sıra", 25), ("Sayfa", 20)):
+                pdf.cell(w, 8, baslik, 1, 0, 'C')
+        pdf.set_font(pdf.fnt, '', 9)
+        for n, (harf, (sira, sayfa)) in enumerate(self.dizin.items()):
+            c, r = divmod(n, sutun_boyu)
+            pdf.set_xy(pdf.l_margin + c * (genislik + aralik), y0 + 8 + r * 7)
+            pdf.cell(15, 7, pdf._clean_text(harf), 1, 0, 'C')
+            pdf.cell(25, 7, str(sira), 1, 0, 'C')
+            pdf.cell(20, 7, str(sayfa), 1, 0, 'C')
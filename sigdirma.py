@@ -0,0 +1,159 @@
+"""Adları sabit genişlikli tablo hücrelerine sığdırma.
+
+Yoklama (42 mm), kapı listesi (70 mm) ve pano hücrelerine adlar
+ölçülmeden yazıldığında uzun (iki adlı, birleşik soyadlı) adlar hücreden
+taşar. Sığmayan her metin için sırasıyla:
+    1. yazı boyutu BOYUT_ADIMI adımlarla en fazla EN_KUCUK_ORAN'a kadar küçültülür,
+    2. adlar baş harfe indirilir ("Ayşe Gül Yılmaz" → "A. G. Yılmaz"; soyad,
+       birleşik olsa da, korunur; ad/soyad sınırı çağırandan alınır),
+    3. yine sığmıyorsa metin en küçük boyutta kesilip "." ile bitirilir.
+Sığan metinler olduğu gibi ve aynı boyutta yazılır.
+
+Glif genişlikleri font ve stil başına bir kez numpy dizisine alınır. Bir
+listenin ölçülmemiş tüm metinleri tek seferde ölçülür: kod noktaları
+genişliklere çevrilip metin sınırlarında toplanır (np.add.reduceat). Ölçü
+yazı boyutundan bağımsızdır (em/1000) ve metne göre süreç genelindeki bir
+önbellekte tutulur; yoklama, kapı listesi ve pano aynı önbelleği kullanır,
+böylece bir öğrencinin adı her belgede ve her yeniden üretimde yeniden ölçülmez.
+"""
+import collections
+import math
+import threading
+
+import numpy as np
+from fpdf.fonts import CORE_FONTS_CHARWIDTHS
+
+BOYUT_ADIMI = 0.25
+EN_KUCUK_ORAN = 0.8
+KESME_ISARETI = "."
+
+# Önbellek bu kadar metni aşarsa boşaltılır
+ONBELLEK_SINIRI = 200_000
+
+# Sığdırılmış metin ve yazılacağı boyut (pt)
+Sigdirma = collections.namedtuple('Sigdirma', 'metin boyut')
+
+# fontkey → kod noktası başına genişlik (em/1000); son eleman BMP dışı karakterler içindir
+_tablolar = {}
+_tablo_kilidi = threading.Lock()
+# (fontkey, metin) → genişlik (em/1000)
+_olculer = {}
+
+
+def _glif_tablosu(pdf, fontkey):
+    tablo = _tablolar.get(fontkey)
+    if tablo is not None:
+        return tablo
+    with _tablo_kilidi:
+        if fontkey not in _tablolar:
+            font = pdf.fonts.get(fontkey)
+            if font is not None and hasattr(font, 'glyph_ids'):
+                # TTF: cw eksik karakterler için varsayılan genişliği veren bir defaultdict;
+                # get ile okunur, böylece sözlüğe eleman eklenmez
+                cw = font.cw
+                varsayilan = cw.default_factory()
+                tablo = np.array([cw.get(c, varsayilan) for c in range(0x10000)] + [varsayilan], dtype=np.float64)
+            else:
+                # Standart PDF fontları (Helvetica): yalnızca Latin-1
+                cw = CORE_FONTS_CHARWIDTHS[fontkey]
+                tablo = np.zeros(0x10001, dtype=np.float64)
+                for c in range(256):
+                    tablo[c] = cw.get(chr(c), 0)
+            _tablolar[fontkey] = tablo
+    return _tablolar[fontkey]
+
+
+def _kodlar(metin):
+    return np.frombuffer(metin.encode("utf-32-le"), dtype=np.uint32)
+
+
+def metin_genislikleri(pdf, fontkey, metinler):
+    """metinlerin em/1000 biriminde genişlikleri (numpy dizisi).
+
+    Önbellekte olmayanlar tek seferde ölçülür.
+    """
+    # Önbellek başka bir iş parçacığında boşaltılabileceğinden değerler yerelde toplanır
+    olculer = {"": 0.0}
+    eksik = []
+    for m in dict.fromkeys(metinler):
+        if m not in olculer:
+            olcu = _olculer.get((fontkey, m))
+            if olcu is None:
+                eksik.append(m)
+            else:
+                olculer[m] = olcu
+    if eksik:
+        tablo = _glif_tablosu(pdf, fontkey)
+        genislikler = tablo[np.minimum(_kodlar("".join(eksik)), len(tablo) - 1)]
+        sinirlar = np.cumsum([0] + [len(m) for m in eksik[:-1]])
+        yeni = dict(zip(eksik, np.add.reduceat(genislikler, sinirlar).tolist()))
+        olculer.update(yeni)
+        if len(_olculer) + len(yeni) > ONBELLEK_SINIRI:
+            _olculer.clear()
+        _olculer.update(((fontkey, m), olcu) for m, olcu in yeni.items())
+    return np.array([olculer[m] for m in metinler], dtype=np.float64)
+
+
+def _kisaltmalar(metin, kisaltma, ad_sayisi=None):
+    """Sırayla denenecek kısaltılmış metinler.
+
+    kisaltma 'ad_soyad': baştaki ad_sayisi kelime (ad) baştan başlayarak baş
+    harfe indirilir, soyad kelimeleri korunur; ad_sayisi None ise son kelime
+    dışındakiler ad sayılır. 'ad': ilk ad korunur, sonraki adlar baş harfe indirilir.
+    """
+    bas = metin[:len(metin) - len(metin.lstrip())]
+    kelimeler = metin.split()
+    if kisaltma == 'ad_soyad':
+        son_kelime = len(kelimeler) - 1
+        sira = range(son_kelime if ad_sayisi is None else min(ad_sayisi, son_kelime))
+    elif kisaltma == 'ad':
+        sira = range(1, len(kelimeler))
+    else:
+        return []
+    adaylar = []
+    for i in sira:
+        if len(kelimeler[i]) > 2:
+            kelimeler[i] = kelimeler[i][0] + "."
+            adaylar.append(bas + " ".join(kelimeler))
+    return adaylar
+
+
+def _kes(pdf, fontkey, metin, sinir):
+    """Metni sinir (em/1000) genişliğine sığacak şekilde keser ve KESME_ISARETI ekler"""
+    tablo = _glif_tablosu(pdf, fontkey)
+    kodlar = _kodlar(metin)
+    toplam = np.cumsum(tablo[np.minimum(kodlar, len(tablo) - 1)])
+    isaret = tablo[ord(KESME_ISARETI)]
+    n = int(np.searchsorted(toplam, sinir - isaret, side='right'))
+    return metin[:n].rstrip() + KESME_ISARETI
+
+
+def sigdir(pdf, metinler, genislik, boyut, stil='', kisaltma='ad_soyad', ad_sayilari=None):
+    """Her metin için Sigdirma(metin, boyut) listesi.
+
+    genislik hücre genişliğidir (kullanıcı birimi); hücre iç boşluğu (c_margin)
+    düşülür. boyut ve stil hücrenin normal yazı boyutu (pt) ve stilidir.
+    ad_sayilari verilirse her metnin baştaki ad kelimesi sayısıdır; 'ad_soyad'
+    kısaltmasında yalnızca bu kelimeler kısaltılır. Sığan metinler
+    değiştirilmeden boyut ile döner.
+    """
+    fontkey = pdf.fnt.lower() + stil
+    # Boyut başına 1 pt'de em/1000 cinsinden kullanılabilir genişlik
+    sinir = (genislik - 2 * pdf.c_margin) * pdf.k * 1000
+    en_kucuk = max(BOYUT_ADIMI, math.ceil(boyut * EN_KUCUK_ORAN / BOYUT_ADIMI) * BOYUT_ADIMI)
+    olculer = metin_genislikleri(pdf, fontkey, metinler)
+    sonuc = []
+    for n, (metin, olcu) in enumerate(zip(metinler, olculer.tolist())):
+        if olcu * boyut <= sinir:
+            sonuc.append(Sigdirma(metin, boyut))
+            continue
+        adaylar = [metin] + _kisaltmalar(metin, kisaltma, ad_sayilari[n] if ad_sayilari is not None else None)
+        for aday, aday_olcu in zip(adaylar, metin_genislikleri(pdf, fontkey, adaylar).tolist()):
+            # Sığdığı en büyük adım boyutu
+            uygun = min(boyut, int(sinir / aday_olcu / BOYUT_ADIMI) * BOYUT_ADIMI)
+            if uygun >= en_kucuk:
+                sonuc.append(Sigdirma(aday, uygun))
+                break
+        else:
+            sonuc.append(Sigdirma(_kes(pdf, fontkey, adaylar[-1], sinir / en_kucuk), en_kucuk))
+    return sonuc
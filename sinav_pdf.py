@@ -0,0 +1,490 @@
+import collections
+import copy
+import functools
+import io
+import math
+import re
+
+from fontTools import subset as ftsubset
+from fontTools import ttLib
+from fpdf import FPDF
+from fpdf.fonts import TTFFont
+# Font kopyalama ve sayfa şablonu fpdf'in iç yapılarını kullanır; requirements.txt
+# bunları 2.8.x serisine sabitler, yine de eksiklerse ic_yapilar_uygun() False döner
+try:
+    from fpdf.enums import PDFResourceType
+    from fpdf.fonts import SubsetMap
+except ImportError:
+    PDFResourceType = SubsetMap = None
+
+from sigdirma import sigdir
+
+# Denenecek Unicode fontlar (aile, normal, kalın); ilk yüklenebilen kullanılır
+FONT_ADAYLARI = (
+    # Streamlit Cloud için DejaVu fontu
+    ('DejaVu', '/usr/share/fonts/truetype/dejavu/DejaVuSans.ttf', '/usr/share/fonts/truetype/dejavu/DejaVuSans-Bold.ttf'),
+    # Arial Unicode MS (Windows) - geniş Unicode desteği
+    ('ArialUnicode', 'arialuni.ttf', 'arialunib.ttf'),
+)
+
+
+# Türkçe belgelerde kullanılan karakterler; fontlar önce bu kümeye indirgenir
+TEMEL_KARAKTERLER = ''.join(chr(c) for c in range(0x20, 0x7F)) + "çğıöşüÇĞİÖŞÜâîûÂÎÛ"
+
+# sablon: ayrıştırılmış TTFFont, tam: TTF dosyası, temel: TEMEL_KARAKTERLER alt kümesi
+FontKaynagi = collections.namedtuple('FontKaynagi', 'sablon tam temel temel_glifler')
+
+
+def _temel_alt_kume(veri):
+    """Fontu TEMEL_KARAKTERLER'e indirger; (ttf_bytes, glif_adlari) döndürür"""
+    ttfont = ttLib.TTFont(io.BytesIO(veri), recalcTimestamp=False)
+    # glyph_names=True: glif adları korunur, fpdf'in cmap eşlemesi geçerli kalır
+    options = ftsubset.Options(notdef_outline=True, recommended_glyphs=True, glyph_names=True)
+    options.drop_tables += ["FFTM", "GDEF", "GPOS", "GSUB", "MATH", "hdmx", "meta"]
+    subsetter = ftsubset.Subsetter(options)
+    subsetter.populate(unicodes=[ord(c) for c in TEMEL_KARAKTERLER])
+    subsetter.subset(ttfont)
+    cikti = io.BytesIO()
+    ttfont.save(cikti)
+    return cikti.getvalue(), frozenset(ttfont.getGlyphOrder())
+
+
+@functools.lru_cache(maxsize=None)
+def font_sablonlari():
+    """Kullanılabilir ilk Unicode fontu süreç başına bir kez ayrıştırır.
+
+    (aile, {fontkey: FontKaynagi}) döndürür; hiçbir font yüklenemezse
+    (None, {}) döner. Genişlik tabloları ve cmap tüm belgeler arasında paylaşılır.
+    """
+    for aile, normal, kalin in FONT_ADAYLARI:
+        try:
+            sablon = FPDF()
+            sablon.add_font(aile, '', normal)
+            sablon.add_font(aile, 'B', kalin)
+            fontlar = {}
+            for fontkey, font in sablon.fonts.items():
+                with open(font.ttffile, 'rb') as f:
+                    tam = f.read()
+                fontlar[fontkey] = FontKaynagi(font, tam, *_temel_alt_kume(tam))
+        except Exception:
+            continue
+        return aile, fontlar
+    return None, {}
+
+
+def _ttfont_ac(veri, font):
+    return ttLib.TTFont(
+        io.BytesIO(veri), recalcTimestamp=False, fontNumber=font.collection_font_number, lazy=True
+    )
+
+
+def _font_kopyala(kaynak, i):
+    """Önbellekteki TTFFont'tan belgeye özel bir kopya oluştur.
+
+    Ayrıştırılmış metrikler paylaşılır; fpdf çıktı sırasında alt küme (subset)
+    oluştururken ttfont nesnesini yerinde değiştirdiği için her belgeye
+    bellekteki baytlardan tembel (lazy) açılmış yeni bir ttfont verilir.
+    Bu ttfont önceden TEMEL_KARAKTERLER'e indirgenmiş küçük fonttur; belge
+    bu kümenin dışında bir glif kullanırsa çıktıdan önce tam fonta geçilir.
+    Belgeler farklı iş parçacıklarında aynı anda oluşturulabilir.
+    """
+    sablon = kaynak.sablon
+    font = TTFFont.__new__(TTFFont)
+    for alan in TTFFont.__slots__:
+        if hasattr(sablon, alan):
+            setattr(font, alan, getattr(sablon, alan))
+    font.i = i
+    # Font tanımlayıcısına çıktı sırasında nesne numarası yazılır; eşzamanlı belgeler paylaşmamalı
+    font.desc = copy.copy(sablon.desc)
+    font.ttfont = _ttfont_ac(kaynak.temel, sablon)
+    font._hbfont = None
+    font.missing_glyphs = []
+    font.biggest_size_pt = 0
+    font.subset = SubsetMap(font)
+    return font
+
+
+def _tam_fonta_gec(pdf):
+    """Temel alt kümenin dışında glif kullanan kopya fontlar için tam fonta geç"""
+    for fontkey, kaynak in font_sablonlari()[1].items():
+        font = pdf.fonts.get(fontkey)
+        if font is not None and not kaynak.temel_glifler.issuperset(font.subset.get_all_glyph_names()):
+            font.ttfont = _ttfont_ac(kaynak.tam, font)
+
+
+@functools.lru_cache(maxsize=None)
+def ic_yapilar_uygun():
+    """Font kopyalama ve sayfa şablonunun dayandığı fpdf iç yapıları çalışıyor mu.
+
+    Süreç başına bir kez küçük bir deneme belgesi üretilerek sınanır. Sınama
+    başarısızsa belgeler fontları add_font ile yükler ve sonraki sayfaları
+    şablon kopyalamadan yeniden çizer; çıktı aynı kalır, yalnızca yavaşlar.
+    """
+    if PDFResourceType is None or SubsetMap is None:
+        return False
+    try:
+        aile, fontlar = font_sablonlari()
+        pdf = FPDF()
+        for fontkey, kaynak in fontlar.items():
+            pdf.fonts[fontkey] = _font_kopyala(kaynak, len(pdf.fonts) + 1)
+        pdf.add_page()
+        for stil in ('', 'B'):
+            pdf.set_font(aile or 'Helvetica', stil, 9)
+            pdf.cell(0, 5, "Sınıf", ln=True)
+        icerik = bytes(pdf.pages[pdf.page].contents)
+        pdf.add_page()
+        pdf.pages[pdf.page].contents += icerik
+        for i in {f.i for f in pdf.fonts.values()}:
+            pdf._resource_catalog.add(PDFResourceType.FONT, i, pdf.page)
+        if not hasattr(pdf, 'current_font_is_set_on_page'):
+            return False
+        _tam_fonta_gec(pdf)
+        pdf.output()
+    except Exception:
+        return False
+    return True
+
+
+# Türkçe karakterleri desteklemeyen fontlar için karşılıklar
+TURKCE_LATIN = str.maketrans({
+    'ç': 'c', 'ğ': 'g', 'ı': 'i', 'ö': 'o', 'ş': 's', 'ü': 'u',
+    'Ç': 'C', 'Ğ': 'G', 'İ': 'I', 'Ö': 'O', 'Ş': 'S', 'Ü': 'U'
+})
+
+# İki sütunlu tablolar için (genişlik, başlık, hizalama, alan)
+YOKLAMA_SUTUNLARI = ((8, "S.N", 'C', 'sn'), (20, "No", 'C', 'no'), (42, "Adı Soyadı", 'L', 'ad'), (25, "İmza", None, None))
+KAPI_LISTESI_SUTUNLARI = ((8, "S.N", 'C', 'sn'), (20, "No", 'C', 'no'), (70, "Adı Soyadı", 'L', 'ad'))
+
+# İki sütunlu tablo düzeni: her sayfada 2 x 25 satır, satır yüksekliği ve yarılar arası boşluk
+SAYFA_SATIR = 25
+SATIR_YUKSEKLIGI = 6.5
+TABLO_YAZI = 7.5
+YARI_ARALIGI = 2
+
+# Sayfa içeriğinde font seçimi ("/F1 9.00 Tf"); tekrar çizilen sayfa şablonunun fontları için
+_FONT_SECIMI = re.compile(rb"/F(\d+) [\d.]+ Tf")
+
+# Sayfa şablonu: sayfanın sabit kısmının içerik baytları ve kullandığı fontlar
+SayfaSablonu = collections.namedtuple('SayfaSablonu', 'icerik fontlar son_y')
+
+
+def metin_temizle(text):
+    """Türkçe karakterleri temizle (eğer yüklenen font desteklemiyorsa)"""
+    if font_sablonlari()[0] is None:
+        return text.translate(TURKCE_LATIN)
+    return text
+
+
+def ogrenci_satirlari(room_list):
+    """Sınıf listesini tablo çizimi için (no, ad_soyad, ad_kelime_sayisi) demetlerine çevirir.
+
+    Sınıf başına bir kez hazırlanır ve yoklama ile kapı listesi tarafından
+    paylaşılır; ilk üç sütun No, Ad ve Soyad olarak kabul edilir. Ad kelime
+    sayısı, uzun adlar kısaltılırken birleşik soyadın korunması içindir.
+    """
+    nolar, adlar, soyadlar = (room_list.iloc[:, k].tolist() for k in range(3))
+    return [
+        (str(no), metin_temizle(f"{ad} {soyad}"), len(f"{ad}".split()))
+        for no, ad, soyad in zip(nolar, adlar, soyadlar)
+    ]
+
+
+def _satirlar(room_list):
+    if hasattr(room_list, 'iloc'):
+        return ogrenci_satirlari(room_list)
+    return room_list
+
+
+class SinavPDF(FPDF):
+    def __init__(self, uni, fakulte, bolum, ders, sinav_turu, tarih, saat, hoca, *args, **kwargs):
+        super().__init__(*args, **kwargs)
+        self.uni_str = uni
+        self.fak_str = fakulte
+        self.bol_str = bolum
+        self.der_str = ders
+        self.sinav_turu = sinav_turu
+        self.tar_str = tarih
+        self.saa_str = saat
+        self.hoc_str = hoca
+        
+        # UTF-8 desteğini etkinleştir
+        self.set_auto_page_break(auto=True, margin=15)
+        
+        # DejaVu fontunu kullan (Türkçe karakter desteği için)
+        # TTF dosyaları süreç başına bir kez ayrıştırılır, belgeler kopyasını kullanır
+        aile, fontlar = font_sablonlari()
+        if aile:
+            if ic_yapilar_uygun():
+                for fontkey, kaynak in fontlar.items():
+                    self.fonts[fontkey] = _font_kopyala(kaynak, len(self.fonts) + 1)
+            else:
+                _aile, normal, kalin = next(a for a in FONT_ADAYLARI if a[0] == aile)
+                self.add_font(aile, '', normal)
+                self.add_font(aile, 'B', kalin)
+            self.fnt = aile
+            self.font_added = True
+        else:
+            # Font eklenemediyse Helvetica kullan ama Türkçe karakterleri değiştir
+            self.fnt = 'Helvetica'
+            self.font_added = False
+
+    def header(self):
+        # fpdf'in sayfa başı ayarlarından sonra sayfa içeriğinin başladığı yer (bkz. _sablon_kaydet)
+        self._sayfa_icerik_basi = len(self.pages[self.page].contents)
+
+    def _sablon_kaydet(self):
+        """Bu sayfada şimdiye kadar çizilenleri yeniden kullanılabilir şablon olarak sakla"""
+        icerik = bytes(self.pages[self.page].contents[self._sayfa_icerik_basi:])
+        fontlar = {int(i) for i in _FONT_SECIMI.findall(icerik)}
+        return SayfaSablonu(icerik, fontlar, self.get_y())
+
+    def _sablonu_ciz(self, sablon):
+        """Kaydedilmiş sabit sayfa içeriğini yeni sayfaya olduğu gibi ekle.
+
+        Başlık, ızgara ve imza alanları yeniden yerleştirilmez; yalnızca baytlar
+        kopyalanır ve kullandıkları fontlar sayfanın kaynaklarına eklenir.
+        fpdf'in iç alanlarını kullanır; yalnızca ic_yapilar_uygun() ise çağrılır.
+        """
+        self.pages[self.page].contents += sablon.icerik
+        for i in sablon.fontlar:
+            self._resource_catalog.add(PDFResourceType.FONT, i, self.page)
+        # Şablondaki son font seçimi fpdf'in bildiğinden farklı olabilir
+        self.current_font_is_set_on_page = False
+        self.set_y(sablon.son_y)
+
+    def output(self, *args, **kwargs):
+        if ic_yapilar_uygun():
+            _tam_fonta_gec(self)
+        return super().output(*args, **kwargs)
+
+    def _clean_text(self, text):
+        """Türkçe karakterleri temizle (eğer font desteklemiyorsa)"""
+        if not self.font_added:
+            text = text.translate(TURKCE_LATIN)
+        return text
+
+    def yoklama_header(self, sinif):
+        # Başlıkları temizle
+        uni_clean = self._clean_text(self.uni_str)
+        fak_clean = self._clean_text(self.fak_str)
+        bol_clean = self._clean_text(self.bol_str)
+        der_clean = self._clean_text(self.der_str)
+        sinif_clean = self._clean_text(sinif)
+        
+        self.set_font(self.fnt, 'B', 10)
+        self.cell(0, 5, f"{uni_clean} {fak_clean}", ln=True, align='C')
+        self.cell(0, 5, f"{bol_clean} {self._clean_text(self.sinav_turu)} TUTANAĞI", ln=True, align='C')
+        self.ln(5)
+        
+        self.set_font(self.fnt, 'B', 9)
+        self.cell(25, 8, " Dersin Adı", 1)
+        self.set_font(self.fnt, '', 9)
+        self.cell(168, 8, f" {der_clean}", 1, ln=True)
+        
+        self.set_font(self.fnt, 'B', 9)
+        self.cell(25, 8, " Sınıf No", 1)
+        self.set_font(self.fnt, '', 9)
+        self.cell(40, 8, f" {sinif_clean}", 1)
+        
+        self.set_font(self.fnt, 'B', 9)
+        self.cell(20, 8, " Tarih", 1)
+        self.set_font(self.fnt, '', 9)
+        self.cell(45, 8, f" {self.tar_str}", 1)
+        
+        self.set_font(self.fnt, 'B', 9)
+        self.cell(21, 8, " Saat", 1)
+        self.set_font(self.fnt, '', 9)
+        self.cell(42, 8, f" {self.saa_str}", 1, ln=True)
+        self.ln(3)
+
+    def kapi_listesi_header(self, sinif):
+        # Başlıkları temizle
+        uni_clean = self._clean_text(self.uni_str)
+        fak_clean = self._clean_text(self.fak_str)
+        bol_clean = self._clean_text(self.bol_str)
+        der_clean = self._clean_text(self.der_str)
+        sinif_clean = self._clean_text(sinif)
+        
+        self.set_font(self.fnt, 'B', 14)
+        self.cell(0, 8, uni_clean, ln=True, align='C')
+        self.ln(2)
+        
+        self.set_font(self.fnt, 'B', 12)
+        self.cell(0, 7, fak_clean, ln=True, align='C')
+        self.ln(2)
+        
+        self.set_font(self.fnt, 'B', 11)
+        self.cell(0, 6, f"{bol_clean} - {der_clean} {self._clean_text(self.sinav_turu)}", ln=True, align='C')
+        self.ln(3)
+        
+        self.set_font(self.fnt, 'B', 13)
+        self.cell(0, 8, f"Sınıf Listesi - {sinif_clean}", ln=True, align='C')
+        self.ln(8)
+    
+    def _tablo_basliklari(self, sutunlar):
+        self.set_font(self.fnt, 'B', 8)
+        for _ in range(2):
+            for w, baslik, _hiza, _alan in sutunlar:
+                self.cell(w, 7, baslik, 1, 0, 'C')
+            if _ == 0: self.cell(2, 7, "", 0, 0)
+        self.ln(7)
+
+    def _tablo_izgarasi(self, sutunlar, y0):
+        """25 satırlık iki tablo yarısının çizgilerini tek bir yol olarak çiz.
+
+        Her hücrenin ayrı çerçevesi yerine ortak kenarlar bir kez çizilir.
+        """
+        k, h = self.k, self.h
+        yukseklik = SAYFA_SATIR * SATIR_YUKSEKLIGI
+        genislik = sum(s[0] for s in sutunlar)
+        komutlar = []
+        for x0 in (self.l_margin, self.l_margin + genislik + YARI_ARALIGI):
+            komutlar.append(f"{x0 * k:.2f} {(h - y0) * k:.2f} {genislik * k:.2f} {-yukseklik * k:.2f} re")
+            for i in range(1, SAYFA_SATIR):
+                y = (h - y0 - i * SATIR_YUKSEKLIGI) * k
+                komutlar.append(f"{x0 * k:.2f} {y:.2f} m {(x0 + genislik) * k:.2f} {y:.2f} l")
+            x = x0
+            for w, *_ in sutunlar[:-1]:
+                x += w
+                komutlar.append(f"{x * k:.2f} {(h - y0) * k:.2f} m {x * k:.2f} {(h - y0 - yukseklik) * k:.2f} l")
+        komutlar.append("S")
+        self._out("\n".join(komutlar))
+
+    def _ogrenci_hucreleri(self, sutunlar, sira_no, satir, satir_sonu, ad=None):
+        """Tek öğrencinin hücre metinlerini yaz (çerçeveler ızgarada); satir None ise boş geçilir.
+
+        ad: hücreye sığdırılmış ad soyad (Sigdirma); gerekirse küçük boyutla yazılır.
+        """
+        son = len(sutunlar) - 1
+        for k, (w, _baslik, hiza, alan) in enumerate(sutunlar):
+            ln = 1 if satir_sonu and k == son else 0
+            if satir is None or alan is None:
+                self.cell(w, SATIR_YUKSEKLIGI, "", 0, ln)
+            elif alan == 'sn':
+                self.cell(w, SATIR_YUKSEKLIGI, str(sira_no + 1), 0, ln, hiza)
+            elif alan == 'no':
+                self.cell(w, SATIR_YUKSEKLIGI, satir[0], 0, ln, hiza)
+            elif ad.boyut != TABLO_YAZI:
+                self.set_font_size(ad.boyut)
+                self.cell(w, SATIR_YUKSEKLIGI, ad.metin, 0, ln, hiza)
+                self.set_font_size(TABLO_YAZI)
+            else:
+                self.cell(w, SATIR_YUKSEKLIGI, ad.metin, 0, ln, hiza)
+
+    def _sayfa_iskeleti(self, sutunlar, sayfa_sonu):
+        """Tablo ızgarasını ve alt bilgiyi çiz; ızgaranın başladığı y konumunu döndür"""
+        y0 = self.get_y()
+        self._tablo_izgarasi(sutunlar, y0)
+        self.set_y(y0 + SAYFA_SATIR * SATIR_YUKSEKLIGI)
+        if sayfa_sonu is not None:
+            sayfa_sonu()
+        return y0
+
+    def _iki_sutunlu_tablo(self, satirlar, sutunlar, sayfa_basligi, sayfa_sonu=None):
+        """Öğrencileri her sayfada 2 sütun x 25 satır (50 kişi) olacak şekilde yerleştirir.
+
+        satirlar: (no, ad_soyad, ad_kelime_sayisi) demetleri (bkz. ogrenci_satirlari)
+        sutunlar: (genişlik, başlık, hizalama, alan) demetleri; alan 'sn', 'no', 'ad' veya None
+
+        Sayfa başlığı (çağıran tarafından ilk sayfaya çizilmiş olmalı), tablo
+        başlıkları, ızgara ve imza alanları ilk sayfada bir kez çizilip şablon
+        olarak saklanır; sonraki sayfalara bu şablon kopyalanır ve yalnızca
+        öğrenci bilgileri yazılır. fpdf'in iç yapıları kullanılamıyorsa
+        (bkz. ic_yapilar_uygun) sonraki sayfalarda sayfa_basligi() ve sabit
+        kısım yeniden çizilir.
+        """
+        self._tablo_basliklari(sutunlar)
+
+        # Öğrenci sayısını al
+        ogrenci_sayisi = len(satirlar)
+        kisi = 2 * SAYFA_SATIR
+
+        # Kaç sayfa gerektiğini hesapla (her sayfa 50 kişi)
+        sayfa_sayisi = math.ceil(ogrenci_sayisi / kisi)
+        if not sayfa_sayisi:
+            return
+
+        # Adlar sütun genişliğine bir kez sığdırılır (ölçüler yoklama ve kapı listesi arasında paylaşılır)
+        ad_genisligi = next(w for w, _baslik, _hiza, alan in sutunlar if alan == 'ad')
+        adlar = sigdir(
+            self, [f" {ad}" for _no, ad, _ad_sayisi in satirlar], ad_genisligi, TABLO_YAZI,
+            ad_sayilari=[ad_sayisi for _no, _ad, ad_sayisi in satirlar],
+        )
+
+        y0 = self._sayfa_iskeleti(sutunlar, sayfa_sonu)
+        son_y = self.get_y()
+        sablon = self._sablon_kaydet() if ic_yapilar_uygun() else None
+
+        for sayfa_no in range(sayfa_sayisi):
+            if sayfa_no > 0:
+                self.add_page()
+                if sablon is not None:
+                    self._sablonu_ciz(sablon)
+                else:
+                    sayfa_basligi()
+                    self._tablo_basliklari(sutunlar)
+                    self._sayfa_iskeleti(sutunlar, sayfa_sonu)
+
+            # Bu sayfadaki öğrenci aralığı
+            baslangic = sayfa_no * kisi
+            bitis = min((sayfa_no + 1) * kisi, ogrenci_sayisi)
+
+            # Sol tarafta ilk 25, sağ tarafta sonraki 25 öğrenci (26-50)
+            self.set_xy(self.l_margin, y0)
+            self.set_font(self.fnt, '', TABLO_YAZI)
+            for i in range(SAYFA_SATIR):
+                for sira_no, sag in ((baslangic + i, False), (baslangic + i + SAYFA_SATIR, True)):
+                    if sira_no < bitis:
+                        self._ogrenci_hucreleri(sutunlar, sira_no, satirlar[sira_no], sag, adlar[sira_no])
+                    else:
+                        self._ogrenci_hucreleri(sutunlar, sira_no, None, sag)
+                    if not sag:
+                        self.cell(YARI_ARALIGI, SATIR_YUKSEKLIGI, "", 0, 0)
+            self.set_y(son_y)
+
+    def _imza_alanlari(self):
+        # Her sayfaya alt bilgileri ekle
+        self.ln(4)
+        self.set_font(self.fnt, '', 9)
+        self.cell(0, 5, "Bu sınıfta ................. öğrenci sınava girmiş ve sınav kağıtları teslim edilmiştir.", ln=True)
+        self.ln(2)
+        
+        y_pos = self.get_y()
+        box_w = 62.4
+
+        for j in range(3):
+            x_coord = 10 + (j * (box_w + 1.9))
+            self.rect(x_coord, y_pos, box_w, 25)
+            self.set_xy(x_coord, y_pos + 1)
+            titles = ["Gözetmen 1", "Gözetmen 2", "Öğretim Üyesi"]
+            self.set_font(self.fnt, 'B', 9)
+            self.cell(box_w, 5, titles[j], 0, 1, 'C')
+            self.set_font(self.fnt, '', 8)
+            if j == 2:
+                hoca_clean = self._clean_text(self.hoc_str)
+                self.set_x(x_coord); self.cell(box_w, 5, f" {hoca_clean}", 0, 1, 'C')
+            else:
+                self.set_x(x_coord); self.cell(box_w, 5, " Adı Soyadı:", 0, 1, 'L')
+            self.set_x(x_coord); self.cell(box_w, 5, " İmza:", 0, 1, 'L')
+
+    def yoklama_tablo(self, room_list, sinif_adi):
+        """Dinamik yoklama tablosu - öğrenci sayısına göre otomatik ayarlanır.
+
+        room_list bir DataFrame veya ogrenci_satirlari ile hazırlanmış satır listesi olabilir.
+        İlk sayfaya yoklama_header(sinif_adi) çizilmiş olmalıdır; sonraki sayfalar
+        ilk sayfanın başlığını ve imza alanlarını şablon olarak tekrarlar.
+        """
+        self._iki_sutunlu_tablo(
+            _satirlar(room_list), YOKLAMA_SUTUNLARI, lambda: self.yoklama_header(sinif_adi), self._imza_alanlari
+        )
+    
+    def kapi_listesi_tablo(self, room_list, sinif_adi):
+        """Dinamik kapı listesi tablosu - öğrenci sayısına göre otomatik ayarlanır.
+
+        room_list bir DataFrame veya ogrenci_satirlari ile hazırlanmış satır listesi olabilir.
+        İlk sayfaya kapi_listesi_header(sinif_adi) çizilmiş olmalıdır; sonraki
+        sayfalar ilk sayfanın başlığını şablon olarak tekrarlar.
+        """
+        self._iki_sutunlu_tablo(
+            _satirlar(room_list), KAPI_LISTESI_SUTUNLARI, lambda: self.kapi_listesi_header(sinif_adi)
+        )
@@ -0,0 +1,137 @@
+"""Çok sınavlı oturumlar için çakışma denetimi ve ortak sınıf paylaştırması.
+
+Aynı tarih ve saatteki (oturum) sınavlar birlikte ele alınır:
+    - öğrenci → sınav indeksi ile aynı oturumda birden fazla sınavda
+      listelenen öğrenciler bulunur,
+    - oturum → sınıf indeksi ile aynı sınıfı kullanan sınavlar bulunur.
+İkili karşılaştırma yapılmaz; tüm kayıtlar tek bir tabloda toplanıp
+gruplanır, bu yüzden ~200 sınav ve ~40 bin kayıt bir saniyenin altında
+denetlenir.
+
+Aynı oturumda birden fazla sınava yazılmış bir sınıfın kapasitesi, bu
+sınavların sınıfa ihtiyacı oranında paylaştırılır (bkz. oturum_siniflari);
+ardından her sınavın yerleşimi kendi payıyla yapılır.
+"""
+from collections import defaultdict, namedtuple
+
+import numpy as np
+import pandas as pd
+
+from yerlestirme import dengeli_hedefler
+
+# tur: "ogrenci" veya "sinif"; anahtar: öğrenci numarası veya sınıf adı; sinavlar: sınav indeksleri
+Cakisma = namedtuple('Cakisma', 'tur oturum anahtar sinavlar')
+
+
+def oturum_anahtari(baslik):
+    """Sınavın oturumu: (tarih, saat); boşluk farkları yok sayılır"""
+    return (" ".join(str(baslik['tarih']).split()), " ".join(str(baslik['saat']).split()))
+
+
+def sinif_indeksi(sinavlar):
+    """(oturum, sınıf adı) → o sınıfı kullanan sınav indeksleri"""
+    indeks = defaultdict(list)
+    for idx, sinav in enumerate(sinavlar):
+        oturum = oturum_anahtari(sinav['baslik'])
+        for room in sinav['siniflar']:
+            if idx not in indeks[oturum, room['Ad']]:
+                indeks[oturum, room['Ad']].append(idx)
+    return indeks
+
+
+def ogrenci_indeksi(sinavlar, numaralar):
+    """Tüm kayıtları (oturum, no, sinav) tablosunda toplar.
+
+    numaralar her sınav için öğrenci numaraları dizisidir (listesi okunamayan
+    sınavlar için None). Aynı sınavda iki kez geçen numara bir kez sayılır.
+    """
+    oturumlar = {}
+    kodlar, nolar, idxler = [], [], []
+    for idx, (sinav, seri) in enumerate(zip(sinavlar, numaralar)):
+        if seri is None or len(seri) == 0:
+            continue
+        kod = oturumlar.setdefault(oturum_anahtari(sinav['baslik']), len(oturumlar))
+        nolar.append(np.asarray(seri, dtype=object))
+        kodlar.append(np.full(len(seri), kod))
+        idxler.append(np.full(len(seri), idx))
+    if not nolar:
+        return pd.DataFrame(columns=['oturum', 'no', 'sinav']), []
+    tablo = pd.DataFrame({
+        'oturum': np.concatenate(kodlar),
+        'no': pd.Series(np.concatenate(nolar)).fillna("").astype(str).str.strip(),
+        'sinav': np.concatenate(idxler),
+    }).drop_duplicates()
+    return tablo[tablo['no'] != ""], list(oturumlar)
+
+
+def cakismalari_bul(sinavlar, numaralar):
+    """Öğrenci ve sınıf çakışmalarını Cakisma listesi olarak döndürür"""
+    cakismalar = [
+        Cakisma('sinif', oturum, sinif_adi, tuple(idxler))
+        for (oturum, sinif_adi), idxler in sinif_indeksi(sinavlar).items()
+        if len(idxler) > 1
+    ]
+
+    tablo, oturumlar = ogrenci_indeksi(sinavlar, numaralar)
+    cift = tablo[tablo.duplicated(['oturum', 'no'], keep=False)].sort_values(['oturum', 'no', 'sinav'])
+    if not cift.empty:
+        # Sıralı tabloda her (oturum, no) grubu ardışık satırlardır
+        kod, no, sinav = cift['oturum'].to_numpy(), cift['no'].to_numpy(), cift['sinav'].tolist()
+        baslar = np.flatnonzero(np.r_[True, (kod[1:] != kod[:-1]) | (no[1:] != no[:-1])])
+        sonlar = np.r_[baslar[1:], len(cift)]
+        cakismalar.extend(
+            Cakisma('ogrenci', oturumlar[kod[b]], no[b], tuple(sinav[b:s])) for b, s in zip(baslar, sonlar)
+        )
+    return cakismalar
+
+
+def oturum_siniflari(sinavlar, ogrenci_sayilari):
+    """Her sınav için, aynı oturumdaki diğer sınavlarla paylaşılan sınıfların
+    kapasitesi bölünmüş sınıf listesini döndürür.
+
+    Bir sınava ait olan sınıflar olduğu gibi kalır. Paylaşılan her sınıfın
+    kapasitesi, kendi sınıflarına sığmayan öğrenci sayısıyla orantılı olarak
+    sınavlara bölünür; payı sıfır olan sınav o sınıfı kullanmaz. Paylaşılan
+    sınıfın kapasitesi, sınavlarda yazılan değerlerin en küçüğüdür.
+    ogrenci_sayilari'nda None olan (listesi okunamayan) sınavlar hesaba katılmaz.
+    """
+    sonuc = [list(sinav['siniflar']) for sinav in sinavlar]
+    paylasilan = {
+        anahtar: [i for i in idxler if ogrenci_sayilari[i] is not None]
+        for anahtar, idxler in sinif_indeksi(sinavlar).items()
+        if len(idxler) > 1
+    }
+    paylasilan = {anahtar: idxler for anahtar, idxler in paylasilan.items() if len(idxler) > 1}
+    if not paylasilan:
+        return sonuc
+
+    # Her sınavın kendi sınıflarına sığmayan öğrenci sayısı
+    ihtiyac = {}
+    for idx, sinav in enumerate(sinavlar):
+        if ogrenci_sayilari[idx] is None:
+            continue
+        oturum = oturum_anahtari(sinav['baslik'])
+        kendi = sum(r['Kap'] for r in sinav['siniflar'] if (oturum, r['Ad']) not in paylasilan)
+        ihtiyac[idx] = max(ogrenci_sayilari[idx] - kendi, 0)
+
+    paylar = {}
+    for (oturum, sinif_adi), idxler in paylasilan.items():
+        odalar = [r for i in idxler for r in sinavlar[i]['siniflar'] if r['Ad'] == sinif_adi]
+        kapasite = min(r['Kap'] for r in odalar)
+        gerek = np.array([ihtiyac[i] for i in idxler], dtype=np.int64)
+        dagitim = dengeli_hedefler(min(kapasite, int(gerek.sum())), gerek) if gerek.any() else gerek
+        for i, pay in zip(idxler, dagitim):
+            paylar[i, sinif_adi] = int(pay)
+            ihtiyac[i] -= int(pay)
+
+    for idx, sinav in enumerate(sinavlar):
+        oturum = oturum_anahtari(sinav['baslik'])
+        siniflar = []
+        for room in sinav['siniflar']:
+            if (idx, room['Ad']) in paylar and (oturum, room['Ad']) in paylasilan:
+                if not paylar[idx, room['Ad']]:
+                    continue
+                room = dict(room, Kap=paylar[idx, room['Ad']])
+            siniflar.append(room)
+        sonuc[idx] = siniflar
+    return sonuc
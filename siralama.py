@@ -0,0 +1,121 @@
+"""Türkçe alfabetik sıralama (collation) yardımcıları.
+
+Her harf, sırası Türk alfabesindeki yerini veren tek bir karaktere çevrilir;
+böylece sıralama anahtarları normal metin karşılaştırmasıyla sıralanabilir.
+Çeviri tablosu modül yüklenirken bir kez oluşturulur ve `str.translate` ile
+tek bir C çağrısında uygulanır.
+"""
+import pandas as pd
+
+# Türk alfabesi sırası (q, w, x alfabe dışı olsa da alışılmış yerlerine konur)
+TURKCE_ALFABE = "abcçdefgğhıijklmnoöpqrsştuüvwxyz"
+BUYUK_HARFLER = "ABCÇDEFGĞHIİJKLMNOÖPQRSŞTUÜVWXYZ"
+
+# Ayraçlar tüm harflerden önce gelir ("Ak Yıldız" < "Akın")
+AYRACLAR = " -'’."
+
+# Anahtar karakterleri: ayraç < rakamlar < harfler < bilinmeyen karakterler
+_AYRAC = "\x01"
+_RAKAM_BASI = 0x10
+_HARF_BASI = 0x30
+_BILINMEYEN = "\uffff"
+
+# Seviyeleri (soyad, ad, numara) ayıran karakter; tüm anahtar karakterlerinden küçüktür
+SEVIYE_AYRACI = "\x00"
+
+
+class _CeviriTablosu(dict):
+    """Tabloda olmayan her karakteri 'bilinmeyen' ağırlığına çevirir"""
+
+    def __missing__(self, kod):
+        return _BILINMEYEN
+
+
+def _tablo_olustur():
+    tablo = _CeviriTablosu()
+    for sira, (kucuk, buyuk) in enumerate(zip(TURKCE_ALFABE, BUYUK_HARFLER)):
+        tablo[ord(kucuk)] = tablo[ord(buyuk)] = chr(_HARF_BASI + sira)
+    # Şapkalı harfler şapkasız karşılıklarıyla aynı sıradadır
+    for sapkali, harf in zip("âîûÂÎÛ", "aiuAİU"):
+        tablo[ord(sapkali)] = tablo[ord(harf)]
+    for rakam in range(10):
+        tablo[ord(str(rakam))] = chr(_RAKAM_BASI + rakam)
+    for ayrac in AYRACLAR:
+        tablo[ord(ayrac)] = _AYRAC
+    # "İ".lower() gibi işlemlerden kalan birleşik nokta (U+0307) yok sayılır
+    tablo[0x0307] = None
+    tablo[ord(SEVIYE_AYRACI)] = SEVIYE_AYRACI
+    return tablo
+
+
+CEVIRI_TABLOSU = _tablo_olustur()
+
+
+def turkce_sirala_anahtar(metin):
+    """Tek bir metin için Türkçe sıralama anahtarı"""
+    return str(metin).translate(CEVIRI_TABLOSU)
+
+
+def coklu_anahtar(soyad, ad="", no=""):
+    """Soyad, ad ve numaraya göre çok seviyeli sıralama anahtarı"""
+    return SEVIYE_AYRACI.join(turkce_sirala_anahtar(x) for x in (soyad, ad, no))
+
+
+def _metin_dizisi(seri):
+    return seri.fillna("").astype(str)
+
+
+def seri_anahtarlari(seri):
+    """Bir pandas sütununu tek seferde sıralama anahtarlarına çevirir.
+
+    Tüm değerler tek bir metinde birleştirilip bir kez çevrilir ve yeniden
+    bölünür; satır başına Python çağrısı yapılmaz.
+    """
+    degerler = _metin_dizisi(seri).tolist()
+    birlesik = SEVIYE_AYRACI.join(degerler)
+    if birlesik.count(SEVIYE_AYRACI) != max(len(degerler) - 1, 0):
+        # Değerlerin içinde ayraç karakteri varsa satır satır çevir
+        return _metin_dizisi(seri).str.translate(CEVIRI_TABLOSU)
+    anahtarlar = birlesik.translate(CEVIRI_TABLOSU).split(SEVIYE_AYRACI) if degerler else []
+    return pd.Series(anahtarlar, index=seri.index, dtype=object)
+
+
+def no_genisligi(*seriler):
+    """Numara sütunlarının birlikte sıralanabilmesi için ortak doldurma genişliği (en uzun numara)"""
+    return max((int(_metin_dizisi(seri).str.len().max()) for seri in seriler if len(seri)), default=0)
+
+
+def no_anahtarlari(seri, genislik=None):
+    """Öğrenci numaralarını sayısal sıraya uygun olacak şekilde sıfırla doldurur.
+
+    genislik verilmezse serideki en uzun numaraya göre doldurulur; farklı
+    listelerin anahtarları karşılaştırılacaksa ortak genişlik (bkz.
+    no_genisligi) verilmelidir.
+    """
+    metin = _metin_dizisi(seri)
+    if metin.empty:
+        return metin
+    return metin.str.zfill(no_genisligi(metin) if genislik is None else genislik)
+
+
+def tablo_anahtarlari(df, soyad_sutunu, ad_sutunu=None, no_sutunu=None, genislik=None):
+    """DataFrame satırları için (soyad, ad, numara) çok seviyeli anahtarlar üretir.
+
+    genislik: numaraların doldurulacağı genişlik (bkz. no_anahtarlari)
+    """
+    parcalar = [seri_anahtarlari(df[soyad_sutunu])]
+    if ad_sutunu is not None:
+        parcalar.append(seri_anahtarlari(df[ad_sutunu]))
+    if no_sutunu is not None:
+        parcalar.append(no_anahtarlari(df[no_sutunu], genislik))
+    anahtar = parcalar[0]
+    for parca in parcalar[1:]:
+        anahtar = anahtar + SEVIYE_AYRACI + parca
+    return anahtar
+
+
+def turkce_sirala(df, soyad_sutunu, ad_sutunu=None, no_sutunu=None):
+    """DataFrame'i soyad, ad ve numaraya göre Türkçe alfabetik sıralar (kararlı sıralama)"""
+    anahtar = tablo_anahtarlari(df, soyad_sutunu, ad_sutunu, no_sutunu).tolist()
+    sira = sorted(range(len(anahtar)), key=anahtar.__getitem__)
+    return df.iloc[sira]
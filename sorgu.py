@@ -0,0 +1,245 @@
+"""Öğrencinin sınav yerini (sınıf, sıra) veren hızlı sorgu servisi.
+
+Kullanım:
+    python sorgu.py [--depo sinav_deposu.db] [--port 8503] [--gun 2025-01-15]
+
+Sınav sabahı yüzlerce öğrenci yerini aynı anda sorar. Depodaki yerleşimler
+(bkz. depo.py) bellekte küçük bir indekse yüklenir; anahtar öğrenci numarası
+ile soyadının normalleştirilmiş ilk ONEK harfidir. Sorgu tek bir sözlük
+araması olduğundan süresi öğrenci sayısından bağımsızdır ve veritabanına
+gidilmez. Soyad önekinin de istenmesi, yalnızca numarayı bilen birinin
+başkasının yerini görmesini zorlaştırır.
+
+Normalleştirme siralama.py'deki Türkçe çeviri tablosunu kullanır: büyük/küçük
+harf (İ/i, I/ı) ve şapka farkı yok sayılır, boşluk ve kesme işaretleri atlanır.
+
+Depo değiştiğinde (PRAGMA data_version) indeks arka planda yeniden kurulur ve
+tek bir atamayla değiştirilir; sorgular kilit beklemez.
+
+Uç noktalar:
+    GET /                           arama formu (HTML)
+    GET /api/yer?no=...&soyad=...   {"no": ..., "yerler": [...]}; bulunamazsa 404
+    GET /api/durum                  indeks boyutu ve yüklenme zamanı
+"""
+import argparse
+import collections
+import html
+import json
+import logging
+import sqlite3
+import sys
+import threading
+from datetime import datetime, timezone
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from urllib.parse import parse_qs, urlsplit
+
+from depo import DEPO_YOLU, SinavDeposu
+from siralama import AYRACLAR, turkce_sirala_anahtar
+
+logger = logging.getLogger(__name__)
+
+# İndeks anahtarındaki soyad harfi sayısı (sorguda en az bu kadar harf istenir)
+ONEK = 2
+
+Yer = collections.namedtuple('Yer', 'sinav_id ders sinav_turu tarih saat sinif sira ad soyad')
+
+_AYRAC_SIL = str.maketrans("", "", AYRACLAR)
+
+
+def ad_anahtari(metin):
+    """Adı karşılaştırma için normalleştirir (Türkçe büyük/küçük harf ve ayraçlar yok sayılır)"""
+    return turkce_sirala_anahtar("".join(str(metin).split()).translate(_AYRAC_SIL))
+
+
+def indeks_kur(satirlar):
+    """Yerleşim satırlarından {(no, soyad öneki): ((soyad anahtarı, Yer), ...)} indeksini kurar"""
+    indeks = {}
+    # Ders, sınıf, tarih gibi tekrarlanan metinler tek nesne olarak tutulur
+    ortak = {}
+    for r in satirlar:
+        soyad = r['soyad'] or r['ad'] or ""
+        anahtar = ad_anahtari(soyad)
+        yer = Yer(
+            r['sinav_id'], *(ortak.setdefault(r[k], r[k]) for k in ('ders', 'sinav_turu', 'tarih', 'saat', 'sinif')),
+            r['sira'], r['ad'], r['soyad'],
+        )
+        indeks.setdefault((sys.intern(r['no']), anahtar[:ONEK]), []).append((anahtar, yer))
+    return {k: tuple(v) for k, v in indeks.items()}
+
+
+class YerIndeksi:
+    """Depodaki yerleşimlerin bellek içi sorgu indeksi.
+
+    gun (YYYY-AA-GG) verilirse yalnızca o günden itibaren olan sınavlar
+    yüklenir. yenileme saniyede bir deponun değişip değişmediğine bakılır.
+    """
+
+    def __init__(self, depo, gun=None, yenileme=5.0):
+        self.depo = depo
+        self.gun = gun
+        self.yenileme = yenileme
+        self._indeks = {}
+        self.kayit = 0
+        self.yukleme = None
+        self._dur = threading.Event()
+        self._izleme = sqlite3.connect(depo.yol, check_same_thread=False)
+        self._surum = None
+        self.yenile()
+        self._izleyici = threading.Thread(target=self._izle, name="yer-indeksi", daemon=True)
+        self._izleyici.start()
+
+    def yenile(self):
+        """İndeksi depodan yeniden kurar ve eskisinin yerine koyar"""
+        self._surum = self._izleme.execute("PRAGMA data_version").fetchone()[0]
+        indeks = indeks_kur(self.depo.tum_yerlesimler(self.gun))
+        self.kayit = sum(len(v) for v in indeks.values())
+        self._indeks = indeks
+        self.yukleme = datetime.now(timezone.utc)
+        logger.info("Yer indeksi yüklendi: %d anahtar, %d kayıt", len(indeks), self.kayit)
+
+    def _izle(self):
+        while not self._dur.wait(self.yenileme):
+            try:
+                if self._izleme.execute("PRAGMA data_version").fetchone()[0] != self._surum:
+                    self.yenile()
+            except sqlite3.Error:
+                logger.exception("Yer indeksi yenilenemedi")
+
+    def ara(self, no, soyad):
+        """Numarası no olan ve soyadı soyad ile başlayan öğrencinin yerleri (en erken oturum önce).
+
+        Soyad ONEK harften kısaysa ValueError verir.
+        """
+        anahtar = ad_anahtari(soyad)
+        if len(anahtar) < ONEK:
+            raise ValueError(f"Soyadınızın en az {ONEK} harfini girin.")
+        adaylar = self._indeks.get((str(no).strip(), anahtar[:ONEK]), ())
+        return [yer for a, yer in adaylar if a.startswith(anahtar)]
+
+    def durum(self):
+        return {
+            'anahtar': len(self._indeks),
+            'kayit': self.kayit,
+            'yukleme': self.yukleme.isoformat(timespec="seconds") if self.yukleme else None,
+            'gun': self.gun,
+        }
+
+    def kapat(self):
+        self._dur.set()
+        self._izleyici.join()
+        self._izleme.close()
+
+
+SAYFA = """<!doctype html>
+<html lang="tr"><head><meta charset="utf-8"><meta name="viewport" content="width=device-width, initial-scale=1">
+<title>Sınav yerim nerede?</title>
+<style>body{{font-family:sans-serif;max-width:36em;margin:2em auto;padding:0 1em}}
+input,button{{font-size:1.1em;padding:.3em;margin:.2em 0}}table{{border-collapse:collapse;width:100%}}
+td,th{{border:1px solid #ccc;padding:.4em;text-align:left}}.uyari{{color:#a00}}</style></head>
+<body><h1>🎓 Sınav yerim nerede?</h1>
+<form method="get" action="/">
+<label>Öğrenci numarası<br><input name="no" value="{no}" inputmode="numeric" required autofocus></label><br>
+<label>Soyadınızın ilk harfleri<br><input name="soyad" value="{soyad}" required></label><br>
+<button type="submit">Sorgula</button></form>
+{sonuc}</body></html>
+"""
+
+
+def sonuc_html(no, soyad, indeks):
+    if not no and not soyad:
+        return ""
+    try:
+        yerler = indeks.ara(no, soyad)
+    except ValueError as e:
+        return f'<p class="uyari">{html.escape(str(e))}</p>'
+    if not yerler:
+        return '<p class="uyari">Bu numara ve soyadla kayıtlı bir sınav yeri bulunamadı.</p>'
+    satirlar = "".join(
+        "<tr>" + "".join(f"<td>{html.escape(str(d))}</td>" for d in (
+            y.ders, y.sinav_turu, f"{y.tarih} {y.saat}", y.sinif, y.sira)) + "</tr>"
+        for y in yerler
+    )
+    return (
+        f"<p><b>{html.escape(f'{yerler[0].ad} {yerler[0].soyad}')}</b></p>"
+        "<table><tr><th>Ders</th><th>Sınav</th><th>Tarih / saat</th><th>Sınıf</th><th>Sıra</th></tr>"
+        f"{satirlar}</table>"
+    )
+
+
+class SorguIstegi(BaseHTTPRequestHandler):
+    # Kalıcı bağlantılar (keep-alive) için
+    protocol_version = "HTTP/1.1"
+    # Başlık ve gövde ayrı yazılır; Nagle + gecikmeli ACK her yanıta ~40 ms ekler
+    disable_nagle_algorithm = True
+
+    def do_GET(self):
+        url = urlsplit(self.path)
+        parametreler = parse_qs(url.query)
+        no = parametreler.get('no', [""])[0].strip()
+        soyad = parametreler.get('soyad', [""])[0].strip()
+        indeks = self.server.indeks
+        if url.path == "/api/yer":
+            try:
+                yerler = indeks.ara(no, soyad)
+            except ValueError as e:
+                return self._json(400, {'hata': str(e)})
+            self._json(200 if yerler else 404, {'no': no, 'yerler': [y._asdict() for y in yerler]})
+        elif url.path == "/api/durum":
+            self._json(200, indeks.durum())
+        elif url.path == "/":
+            sayfa = SAYFA.format(no=html.escape(no), soyad=html.escape(soyad), sonuc=sonuc_html(no, soyad, indeks))
+            self._gonder(200, sayfa, "text/html; charset=utf-8")
+        else:
+            self._json(404, {'hata': "Bulunamadı"})
+
+    def _json(self, kod, veri):
+        self._gonder(kod, json.dumps(veri, ensure_ascii=False), "application/json; charset=utf-8")
+
+    def _gonder(self, kod, govde, tur):
+        veri = govde.encode("utf-8")
+        self.send_response(kod)
+        self.send_header("Content-Type", tur)
+        self.send_header("Content-Length", str(len(veri)))
+        self.send_header("Cache-Control", "no-store")
+        self.end_headers()
+        self.wfile.write(veri)
+
+    def log_message(self, bicim, *args):
+        # Her istek için stderr'e yazmak yük altında yavaşlatır
+        logger.debug("%s - %s", self.address_string(), bicim % args)
+
+
+class SorguSunucusu(ThreadingHTTPServer):
+    daemon_threads = True
+    request_queue_size = 256
+
+    def __init__(self, adres, indeks):
+        super().__init__(adres, SorguIstegi)
+        self.indeks = indeks
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Öğrencilerin sınav yerini sorgulayabileceği yerel web servisini başlatır.")
+    parser.add_argument("--depo", default=DEPO_YOLU, help=f"SQLite deposu (varsayılan: {DEPO_YOLU})")
+    parser.add_argument("--host", default="127.0.0.1", help="Dinlenecek adres (ağdan erişim için 0.0.0.0)")
+    parser.add_argument("--port", type=int, default=8503)
+    parser.add_argument("--gun", help="Yalnızca bu günden (YYYY-AA-GG veya GG.AA.YYYY) itibaren olan sınavları yükle")
+    parser.add_argument("--yenileme", type=float, default=5.0, help="Depo değişikliklerini denetleme aralığı, sn (varsayılan: 5)")
+    args = parser.parse_args(argv)
+
+    logging.basicConfig(level=logging.INFO, format="%(asctime)s %(message)s")
+    indeks = YerIndeksi(SinavDeposu(args.depo), args.gun, args.yenileme)
+    sunucu = SorguSunucusu((args.host, args.port), indeks)
+    durum = indeks.durum()
+    print(f"Sorgu sayfası: http://{args.host}:{sunucu.server_port}/ ({durum['kayit']} yerleşim kaydı)")
+    try:
+        sunucu.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        sunucu.server_close()
+        indeks.kapat()
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,265 @@
+"""Sınav haftası programı için tüm belgeleri Streamlit arayüzü olmadan üretir.
+
+Kullanım:
+    python toplu_uretim.py program.json -o cikti
+
+Program dosyası (JSON) örneği:
+
+    {
+      "uni": "Kırıkkale Üniversitesi",
+      "fakulte": "Mühendislik Fakültesi",
+      "sinavlar": [
+        {
+          "bolum": "Bilgisayar Mühendisliği",
+          "ders": "Veri Yapıları",
+          "sinav_turu": "Final Sınavı",
+          "tarih": "15.01.2025",
+          "saat": "10:00",
+          "hoca": "Dr. Ayşe Yılmaz",
+          "siniflar": [{"Ad": "A1", "Kap": 50}, {"Ad": "A2", "Kap": 44, "Erisilebilir": true}],
+          "ogrenci_listesi": "listeler/veri_yapilari.xlsx"
+        }
+      ]
+    }
+
+En üst düzeydeki başlık alanları tüm sınavlar için varsayılan değerdir; her
+sınav kendi değeriyle üzerine yazabilir. Göreli dosya yolları program
+dosyasının bulunduğu klasöre göre çözülür. Öğrenci listeleri .xlsx, .csv
+veya .parquet olabilir. Her sınavın belgeleri çıktı klasöründe ayrı bir alt
+klasöre yazılır (isteğe bağlı "klasor" alanı); --zip verilirse bunun yerine
+her sınav için <klasor>.zip dosyası, --tek-pdf verilirse sınıf yer imli tek
+bir <klasor>.pdf dosyası oluşturulur.
+
+Yerleşim, sınava verilen isteğe bağlı "tohum" değeriyle belirlenir; verilmezse
+rastgele seçilir. Kullanılan tohum çıktıda yazdırılır ve ZIP açıklamasına
+eklenir, böylece aynı yerleşim daha sonra yeniden üretilebilir.
+
+Sınıf kapasiteleri üst sınırdır. Yerleşim yöntemi sınav başına "strateji"
+alanıyla ("rastgele", "dengeli", "kisitli") veya --strateji ile seçilir;
+kısıtlı yöntemde "Erisilebilir" işaretli sınıflar erişilebilirlik gerektiren
+öğrencilere ayrılır (bkz. yerlestirme.py).
+
+Pano listesi sayfa sayfa yazılır; sütun sayısı (1, 2 veya 3) sınav başına
+"pano_sutunu" alanıyla veya --pano-sutun ile seçilir (bkz. pano.py).
+
+Üretimden önce tüm listeler okunur ve aynı tarih/saatteki sınavlar denetlenir:
+aynı oturumda birden fazla sınava yazılmış öğrenciler ve aynı sınıfı kullanan
+sınavlar raporlanır. Paylaşılan sınıfların kapasitesi o oturumdaki sınavlara
+bölünür (bkz. sinav_programi.py). --denetle yalnızca bu raporu verir.
+
+--depo verilirse her sınavın tanımı ve yerleşimi SQLite deposuna kaydedilir
+(bkz. depo.py); uygulamadaki "kayıtlı sınavdan yükle" ve öğrenci yeri
+sorguları bu kayıtları kullanır.
+"""
+import argparse
+import json
+import os
+import sys
+import time
+
+from depo import DEPO_YOLU, SinavDeposu
+from okuma import liste_oku
+from sinav_programi import cakismalari_bul, oturum_siniflari
+from uretim import (
+    BASLIK_ALANLARI, SIKISTIRMA_YONTEMLERI, birlesik_pdf, islem_havuzu, kapasite_kontrol, siniflara_dagit,
+    sinav_belgeleri, uretim_zamani, zipe_akit,
+)
+from yerlestirme import STRATEJILER, yeni_tohum
+
+
+def program_oku(yol, strateji="rastgele", pano_sutunu=1):
+    """Program dosyasını oku; her sınav için başlık, sınıflar ve liste yolunu döndür"""
+    with open(yol, encoding='utf-8') as f:
+        program = json.load(f)
+
+    kok = os.path.dirname(os.path.abspath(yol))
+    varsayilan = {alan: program[alan] for alan in BASLIK_ALANLARI if alan in program}
+
+    sinavlar = []
+    for idx, sinav in enumerate(program.get('sinavlar', []), start=1):
+        baslik = dict(varsayilan)
+        baslik.update({alan: sinav[alan] for alan in BASLIK_ALANLARI if alan in sinav})
+        eksik = [alan for alan in BASLIK_ALANLARI if not str(baslik.get(alan, '')).strip()]
+        if eksik:
+            raise ValueError(f"{idx}. sınavda eksik alanlar: {', '.join(eksik)}")
+
+        liste_yolu = sinav['ogrenci_listesi']
+        if not os.path.isabs(liste_yolu):
+            liste_yolu = os.path.join(kok, liste_yolu)
+
+        sinavlar.append({
+            'baslik': baslik,
+            'siniflar': [
+                {"Ad": str(r['Ad']), "Kap": int(r['Kap']), "Erisilebilir": bool(r.get('Erisilebilir', False))}
+                for r in sinav['siniflar']
+            ],
+            'ogrenci_listesi': liste_yolu,
+            'klasor': sinav.get('klasor') or f"{idx:03d}_{baslik['ders']}".replace(os.sep, '_'),
+            'tohum': int(sinav['tohum']) if 'tohum' in sinav else yeni_tohum(),
+            'strateji': sinav.get('strateji', strateji),
+            'pano_sutunu': int(sinav.get('pano_sutunu', pano_sutunu)),
+        })
+    return sinavlar
+
+
+def program_denetle(sinavlar):
+    """Tüm listeleri okur, çakışmaları bulur ve paylaşılan sınıfları sınavlara böler.
+
+    Okunan listeler üretimde yeniden okunmamak için sınav sözlüğünde tutulur;
+    okunamayan listelerin hatası sınavın sonucunda raporlanır.
+    """
+    numaralar = []
+    for sinav in sinavlar:
+        t0 = time.perf_counter()
+        try:
+            sinav['df'] = liste_oku(sinav['ogrenci_listesi'])
+            numaralar.append(sinav['df'].iloc[:, 0])
+        except Exception as e:
+            sinav['okuma_hatasi'] = str(e)
+            numaralar.append(None)
+        sinav['okuma_suresi'] = time.perf_counter() - t0
+
+    cakismalar = cakismalari_bul(sinavlar, numaralar)
+    sayilar = [None if nolar is None else len(nolar) for nolar in numaralar]
+    for sinav, siniflar in zip(sinavlar, oturum_siniflari(sinavlar, sayilar)):
+        sinav['siniflar'] = siniflar
+    return cakismalar
+
+
+def cakisma_raporu(sinavlar, cakismalar, en_fazla=20):
+    """Çakışmaları okunabilir satırlar olarak verir (her türden en fazla `en_fazla` satır)"""
+    for tur, baslik, ad in (('sinif', "SINIF", "sınıf"), ('ogrenci', "ÖĞRENCİ", "öğrenci")):
+        secilen = [c for c in cakismalar if c.tur == tur]
+        for c in secilen[:en_fazla]:
+            klasorler = ", ".join(sinavlar[i]['klasor'] for i in c.sinavlar)
+            yield f"ÇAKIŞMA {baslik} {c.anahtar} ({' '.join(c.oturum)}): {klasorler}"
+        if len(secilen) > en_fazla:
+            yield f"... ve {len(secilen) - en_fazla} {ad} çakışması daha"
+
+
+def yerlesimi_kaydet(depo, sinav, df):
+    """Sınavın tanımını ve (tohumdan yeniden hesaplanan) yerleşimini depoya yazar; sınav numarasını döndürür"""
+    sinav_id = depo.sinav_kaydet(sinav['baslik'], sinav['siniflar'], sinav['tohum'], sinav['strateji'])
+    depo.yerlesim_kaydet(sinav_id, (
+        (room['Ad'], room_list)
+        for room, room_list in siniflara_dagit(df, sinav['siniflar'], sinav['tohum'], sinav['strateji'])
+        if not room_list.empty
+    ), sinav['tohum'], sinav['strateji'])
+    return sinav_id
+
+
+def program_uret(sinavlar, cikti_klasoru, havuz=None, zip_ayarlari=None, tek_pdf=False, depo=None):
+    """Sınavları tek tek işler, her sınavın belgelerini diske yazar ve sonucu verir.
+
+    program_denetle ile okunmuş listeler kullanılır ve işlenen sınavın listesi
+    bellekten bırakılır; okunmamışsa liste burada okunur. `havuz`
+    verilirse tüm sınavlar boyunca aynı süreç havuzu kullanılır. `zip_ayarlari`
+    ({"sikistirma": ..., "seviye": ...}) verilirse her sınav tek bir ZIP dosyasına
+    akıtılır; tek_pdf ise her sınav yer imli tek bir PDF olarak yazılır (havuz
+    kullanılmaz). `depo` (SinavDeposu) verilirse üretilen her sınavın yerleşimi kaydedilir.
+    """
+    for sinav in sinavlar:
+        sonuc = {'klasor': sinav['klasor'], 'ders': sinav['baslik']['ders'], 'tohum': sinav['tohum'], 'dosya': 0, 'hata': None}
+        sureler = {}
+        t_bas = time.perf_counter()
+        try:
+            if 'okuma_hatasi' in sinav:
+                raise ValueError(sinav['okuma_hatasi'])
+            if 'df' in sinav:
+                df = sinav.pop('df')
+                sureler['okuma'] = sinav.get('okuma_suresi', 0.0)
+            else:
+                t0 = time.perf_counter()
+                df = liste_oku(sinav['ogrenci_listesi'])
+                sureler['okuma'] = time.perf_counter() - t0
+            kapasite_kontrol(df, sinav['siniflar'])
+
+            zaman = uretim_zamani()
+            hedef = os.path.join(cikti_klasoru, sinav['klasor'])
+            if tek_pdf:
+                os.makedirs(cikti_klasoru, exist_ok=True)
+                birlesik_pdf(
+                    hedef + ".pdf", sinav['baslik'], df, sinav['siniflar'], sureler, zaman, sinav['tohum'],
+                    sinav['strateji'], aciklama=f"tohum={sinav['tohum']}", pano_sutunu=sinav['pano_sutunu'],
+                )
+                sonuc['dosya'] = 1
+            else:
+                belgeler = sinav_belgeleri(
+                    sinav['baslik'], df, sinav['siniflar'], sureler, havuz, zaman, sinav['tohum'],
+                    strateji=sinav['strateji'], pano_sutunu=sinav['pano_sutunu'],
+                )
+                if zip_ayarlari is not None:
+                    os.makedirs(cikti_klasoru, exist_ok=True)
+                    sonuc['dosya'] = zipe_akit(hedef + ".zip", belgeler, zaman, aciklama=f"tohum={sinav['tohum']}", **zip_ayarlari)
+                else:
+                    os.makedirs(hedef, exist_ok=True)
+                    for dosya_adi, veri in belgeler:
+                        with open(os.path.join(hedef, dosya_adi), 'wb') as f:
+                            f.write(veri)
+                        sonuc['dosya'] += 1
+            sonuc['ogrenci'] = len(df)
+            if depo is not None:
+                sonuc['sinav_id'] = yerlesimi_kaydet(depo, sinav, df)
+        except Exception as e:
+            sonuc['hata'] = str(e)
+        sureler['toplam'] = time.perf_counter() - t_bas
+        sonuc['sureler'] = sureler
+        yield sonuc
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description="Sınav programındaki tüm sınavlar için yoklama, kapı ve pano listelerini üretir.")
+    parser.add_argument("program", help="Sınav programı (JSON)")
+    parser.add_argument("-o", "--cikti", default="cikti", help="Çıktı klasörü (varsayılan: cikti)")
+    bicim = parser.add_mutually_exclusive_group()
+    bicim.add_argument("--zip", action="store_true", help="Her sınavın belgelerini tek bir ZIP dosyasına yaz")
+    bicim.add_argument("--tek-pdf", action="store_true", help="Her sınavın belgelerini sınıf yer imli tek bir PDF dosyasına yaz")
+    parser.add_argument("--sikistirma", choices=sorted(SIKISTIRMA_YONTEMLERI), default="deflate", help="ZIP sıkıştırma yöntemi (varsayılan: deflate)")
+    parser.add_argument("--seviye", type=int, choices=range(0, 10), metavar="0-9", help="DEFLATE sıkıştırma seviyesi")
+    parser.add_argument("--strateji", choices=list(STRATEJILER), default="rastgele", help="Varsayılan yerleşim yöntemi (varsayılan: rastgele)")
+    parser.add_argument("--pano-sutun", type=int, choices=(1, 2, 3), default=1, help="Pano listesinin sütun sayısı (varsayılan: 1)")
+    parser.add_argument("--depo", nargs="?", const=DEPO_YOLU, metavar="YOL", help=f"Sınav tanımlarını ve yerleşimleri SQLite deposuna kaydet (varsayılan: {DEPO_YOLU})")
+    parser.add_argument("--denetle", action="store_true", help="Yalnızca oturum çakışmalarını denetle, belge üretme")
+    parser.add_argument("-j", "--is-sayisi", type=int, default=1, help="Sınıf PDF'leri için paralel işçi süreç sayısı (varsayılan: 1, sıralı)")
+    args = parser.parse_args(argv)
+
+    sinavlar = program_oku(args.program, args.strateji, args.pano_sutun)
+    hatali = 0
+    t_bas = time.perf_counter()
+
+    cakismalar = program_denetle(sinavlar)
+    for satir in cakisma_raporu(sinavlar, cakismalar):
+        print(satir, flush=True)
+    ogrenci_cakismasi = sum(c.tur == 'ogrenci' for c in cakismalar)
+    print(
+        f"Denetim: {len(sinavlar)} sınav, {ogrenci_cakismasi} öğrenci çakışması, "
+        f"{len(cakismalar) - ogrenci_cakismasi} paylaşılan sınıf ({time.perf_counter() - t_bas:.2f} sn)",
+        flush=True,
+    )
+    if args.denetle:
+        return 1 if ogrenci_cakismasi else 0
+
+    zip_ayarlari = {"sikistirma": args.sikistirma, "seviye": args.seviye} if args.zip else None
+    depo = SinavDeposu(args.depo) if args.depo else None
+
+    with islem_havuzu(args.is_sayisi) as havuz:
+        for sonuc in program_uret(sinavlar, args.cikti, havuz, zip_ayarlari, args.tek_pdf, depo):
+            s = sonuc['sureler']
+            if sonuc['hata']:
+                hatali += 1
+                print(f"HATA  {sonuc['klasor']}: {sonuc['hata']} ({s['toplam']:.2f} sn)", flush=True)
+            else:
+                print(
+                    f"OK    {sonuc['klasor']}: {sonuc['ogrenci']} öğrenci, {sonuc['dosya']} PDF, tohum {sonuc['tohum']} | "
+                    f"okuma {s.get('okuma', 0):.2f} sn, sınıflar {s.get('siniflar', 0):.2f} sn, "
+                    f"pano {s.get('pano', 0):.2f} sn, toplam {s['toplam']:.2f} sn"
+                    + (f" | depo sınav no {sonuc['sinav_id']}" if 'sinav_id' in sonuc else ""),
+                    flush=True,
+                )
+
+    print(f"{len(sinavlar)} sınav, {hatali} hatalı, toplam {time.perf_counter() - t_bas:.2f} sn")
+    return 1 if hatali else 0
+
+
+if __name__ == "__main__":
+    sys.exit(main())
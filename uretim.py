@@ -0,0 +1,458 @@
+import collections
+import hashlib
+import json
+import multiprocessing
+import threading
+import time
+import zipfile
+from concurrent.futures import ProcessPoolExecutor
+from contextlib import contextmanager
+from datetime import datetime, timezone
+
+from olcum import asama, sayfa_sayisi
+from pano import PanoYazici, pano_satirlari
+from sinav_pdf import SinavPDF, ogrenci_satirlari
+from siralama import no_anahtarlari
+from yerlestirme import strateji_al
+
+# ZIP sıkıştırma seçenekleri; PDF'ler zaten sıkıştırılmış olduğundan STORED çoğu zaman yeterlidir
+SIKISTIRMA_YONTEMLERI = {"deflate": zipfile.ZIP_DEFLATED, "stored": zipfile.ZIP_STORED}
+
+# SinavPDF başlık alanları (SinavPDF.__init__ parametre sırası ile aynı)
+BASLIK_ALANLARI = ("uni", "fakulte", "bolum", "ders", "sinav_turu", "tarih", "saat", "hoca")
+
+
+def uretim_zamani():
+    """Bir üretim çalışmasının tüm belgelerinde kullanılacak ortak zaman damgası.
+
+    PDF oluşturma tarihi ve ZIP girdi tarihleri bu değerden alınır; böylece aynı
+    girdi sıralı veya paralel üretildiğinde bayt bayt aynı çıktı elde edilir.
+    """
+    return datetime.now(timezone.utc).replace(microsecond=0)
+
+
+def pdf_bayt(pdf):
+    """PDF çıktısını bytes olarak döndür (eski fpdf sürümleri str döndürebilir)"""
+    output = pdf.output()
+    if isinstance(output, str):
+        output = output.encode('latin-1', 'replace')
+    return bytes(output)
+
+
+def kapasite_kontrol(df, rooms):
+    """Sınıf kapasiteleri üst sınırdır; toplamları öğrenci sayısından az olmamalı"""
+    if len(df.columns) < 3:
+        raise ValueError("Öğrenci listesinde en az 3 sütun (No, Ad, Soyad) olmalıdır.")
+    total_capacity = sum(r['Kap'] for r in rooms)
+    if total_capacity < len(df):
+        raise ValueError(
+            f"Toplam sınıf kapasitesi ({total_capacity}) öğrenci sayısından ({len(df)}) az!"
+        )
+
+
+def siniflara_dagit(df, rooms, tohum=None, strateji=None, olcum=None):
+    """Öğrencileri yerleşim stratejisine göre sınıflara dağıt; (sınıf, liste) çiftleri üretir.
+
+    strateji: "rastgele" (varsayılan), "dengeli", "kisitli" veya bir
+    YerlestirmeStratejisi nesnesi (bkz. yerlestirme.py). Aynı liste ve aynı
+    tohum her zaman aynı yerleşimi verir. Her sınıfın listesi numaraya göre sıralıdır.
+    """
+    with asama(olcum, 'yerlesim', ogrenci=len(df), sinif_sayisi=len(rooms)):
+        dagitim = strateji_al(strateji).dagit(df, rooms, tohum)
+    for room, konumlar in zip(rooms, dagitim):
+        with asama(olcum, 'siralama', sinif=room['Ad']):
+            room_list = df.iloc[konumlar].sort_values(by=df.columns[0], key=no_anahtarlari).reset_index(drop=True)
+        yield room, room_list
+
+
+def yeni_pdf(baslik, zaman=None):
+    pdf = SinavPDF(**baslik)
+    if zaman is not None:
+        pdf.set_creation_date(zaman)
+    return pdf
+
+
+def yer_imleri_ekle(pdf, yer_imleri):
+    """Geçerli sayfaya (ad, seviye) yer imlerini ekle"""
+    for ad, seviye in yer_imleri:
+        pdf.start_section(ad, level=seviye)
+
+
+def yoklama_ciz(pdf, sinif_adi, room_list, yer_imleri=()):
+    """Yoklama listesini yeni sayfadan başlayarak verilen belgeye çiz"""
+    pdf.add_page()
+    yer_imleri_ekle(pdf, yer_imleri)
+    pdf.yoklama_header(sinif_adi)
+    pdf.yoklama_tablo(room_list, sinif_adi)
+
+
+def kapi_listesi_ciz(pdf, sinif_adi, room_list, yer_imleri=()):
+    """Kapı listesini yeni sayfadan başlayarak verilen belgeye çiz"""
+    pdf.add_page()
+    yer_imleri_ekle(pdf, yer_imleri)
+    pdf.kapi_listesi_header(sinif_adi)
+    pdf.kapi_listesi_tablo(room_list, sinif_adi)
+
+
+def yoklama_pdf(baslik, sinif_adi, room_list, zaman=None):
+    pdf = yeni_pdf(baslik, zaman)
+    yoklama_ciz(pdf, sinif_adi, room_list)
+    return pdf_bayt(pdf)
+
+
+def kapi_listesi_pdf(baslik, sinif_adi, room_list, zaman=None):
+    pdf = yeni_pdf(baslik, zaman)
+    kapi_listesi_ciz(pdf, sinif_adi, room_list)
+    return pdf_bayt(pdf)
+
+
+def sinif_belgeleri(baslik, sinif_adi, satirlar, zaman=None):
+    """Bir sınıfın yoklama ve kapı listesi PDF'lerini birlikte üret (işçi süreçlerde çalışır).
+
+    satirlar, ogrenci_satirlari ile bir kez hazırlanır ve iki belge tarafından paylaşılır.
+    """
+    return (
+        yoklama_pdf(baslik, sinif_adi, satirlar, zaman),
+        kapi_listesi_pdf(baslik, sinif_adi, satirlar, zaman),
+    )
+
+
+def olculen_sinif_belgeleri(baslik, sinif_adi, satirlar, zaman=None):
+    """sinif_belgeleri'ni işçi süreçte ölçerek çalıştırır; (belgeler, duvar, cpu) döndürür"""
+    cpu0, duvar0 = time.thread_time(), time.perf_counter()
+    belgeler = sinif_belgeleri(baslik, sinif_adi, satirlar, zaman)
+    return belgeler, time.perf_counter() - duvar0, time.thread_time() - cpu0
+
+
+def pano_listesi_pdf(baslik, siniflar, zaman=None, sutun_sayisi=1):
+    """Tüm sınıfların öğrencilerini soyad, ad ve numaraya göre Türkçe alfabetik sıralayıp pano listesi oluştur.
+
+    siniflar: (sınıf adı, liste) çiftleri; listenin ilk üç sütunu No, Ad, Soyad.
+    """
+    pdf_p = yeni_pdf(baslik, zaman)
+    pano_ciz(pdf_p, baslik, siniflar, sutun_sayisi=sutun_sayisi)
+    return pdf_bayt(pdf_p)
+
+
+def pano_ciz(pdf_p, baslik, siniflar, yer_imleri=(), sutun_sayisi=1):
+    """Pano listesini ve harf dizinini yeni sayfadan başlayarak verilen belgeye çiz (bkz. pano.py)"""
+    yazici = PanoYazici(pdf_p, baslik, sutun_sayisi, yer_imleri)
+    yazici.yaz(pano_satirlari(siniflar))
+    yazici.dizin_yaz()
+
+
+def belge_olcusu(belgeler):
+    """Bir veya birkaç PDF'in toplam sayfa sayısı ve boyutu (olcum kayıtları için)"""
+    if not isinstance(belgeler, tuple):
+        belgeler = (belgeler,)
+    return {'sayfa': sum(sayfa_sayisi(b) for b in belgeler), 'bayt': sum(len(b) for b in belgeler)}
+
+
+def belge_anahtari(tur, baslik, *icerik):
+    """Belgenin içeriğini belirleyen her şeyin özeti (başlık alanları, sınıf, öğrenciler)"""
+    veri = [tur, [baslik[alan] for alan in BASLIK_ALANLARI], *icerik]
+    return hashlib.sha256(json.dumps(veri, ensure_ascii=False, default=str).encode('utf-8')).hexdigest()
+
+
+class BelgeOnbellegi:
+    """İçerik adresli, toplam boyutu sınırlı PDF önbelleği (en eski kullanılan silinir).
+
+    Anahtar belge içeriğinin özeti olduğundan yalnızca başlığı veya öğrencileri
+    değişmeyen sınıfların daha önce oluşturulmuş PDF baytları yeniden kullanılır.
+    """
+
+    def __init__(self, en_fazla_bayt=256 * 1024 * 1024):
+        self.en_fazla_bayt = en_fazla_bayt
+        self.isabet = 0
+        self.iskalama = 0
+        self._belgeler = collections.OrderedDict()
+        self._bayt = 0
+        self._kilit = threading.Lock()
+
+    @staticmethod
+    def _boyut(deger):
+        return sum(len(v) for v in deger) if isinstance(deger, tuple) else len(deger)
+
+    def al(self, anahtar):
+        with self._kilit:
+            deger = self._belgeler.get(anahtar)
+            if deger is None:
+                self.iskalama += 1
+                return None
+            self._belgeler.move_to_end(anahtar)
+            self.isabet += 1
+            return deger
+
+    def koy(self, anahtar, deger):
+        boyut = self._boyut(deger)
+        if boyut > self.en_fazla_bayt:
+            return
+        with self._kilit:
+            eski = self._belgeler.pop(anahtar, None)
+            if eski is not None:
+                self._bayt -= self._boyut(eski)
+            self._belgeler[anahtar] = deger
+            self._bayt += boyut
+            while self._bayt > self.en_fazla_bayt:
+                _, silinen = self._belgeler.popitem(last=False)
+                self._bayt -= self._boyut(silinen)
+
+
+# Havuz modunda işçi başına aynı anda verilen (henüz yazılmamış) sınıf sayısı
+HAVUZ_PENCERESI = 2
+
+# yurutucu: ProcessPoolExecutor, is_sayisi: bu üretimin kullanacağı işçi sayısı
+SurecHavuzu = collections.namedtuple('SurecHavuzu', 'yurutucu is_sayisi')
+
+
+def _havuz_baglami():
+    if "forkserver" in multiprocessing.get_all_start_methods():
+        baglam = multiprocessing.get_context("forkserver")
+        # Her havuzun işçileri modülleri yeniden yüklemez; yalnızca ilk havuzdan önce etkilidir
+        baglam.set_forkserver_preload([__name__])
+        return baglam
+    return multiprocessing.get_context("spawn")
+
+
+def surec_yurutucusu(is_sayisi):
+    """Sınıf PDF'leri için is_sayisi işçili ProcessPoolExecutor.
+
+    Havuz Streamlit sunucusunun iş parçacıklarından açılır; bu süreçten fork
+    edilen işçiler başka iş parçacıklarının tuttuğu kilitleri (önbellek, logging)
+    kilitli hâlde devralıp takılabilir. Bu yüzden işçiler tek iş parçacıklı
+    forkserver sürecinden (bu modül önceden yüklenmiş olarak), forkserver
+    yoksa "spawn" ile başlatılır.
+    """
+    return ProcessPoolExecutor(max_workers=is_sayisi, mp_context=_havuz_baglami())
+
+
+@contextmanager
+def islem_havuzu(is_sayisi):
+    """is_sayisi > 1 ise sınıf PDF'leri için süreç havuzu (SurecHavuzu) açar, aksi halde None verir"""
+    if not is_sayisi or is_sayisi <= 1:
+        yield None
+        return
+    with surec_yurutucusu(is_sayisi) as yurutucu:
+        yield SurecHavuzu(yurutucu, is_sayisi)
+
+
+def sinav_belgeleri(baslik, df, rooms, sureler=None, havuz=None, zaman=None, tohum=None, onbellek=None, strateji=None,
+                    pano_sutunu=1, olcum=None, ilerleme=None):
+    """Bir sınavın tüm belgelerini (dosya_adi, pdf_bytes) olarak sırayla üretir.
+
+    Her belge oluşturulur oluşturulmaz verilir; çağıran taraf hemen diske veya
+    ZIP'e yazabilir. `sureler` sözlüğü verilirse aşama süreleri (saniye) eklenir.
+    `havuz` (bkz. islem_havuzu) verilirse her sınıfın yoklama ve kapı PDF'leri
+    işçi süreçlerde oluşturulur; dosya sırası ve içerikleri sıralı yol ile aynıdır.
+    Havuza aynı anda en fazla HAVUZ_PENCERESI x havuz.is_sayisi sınıf verilir ve
+    sıradaki sınıf hazır olur olmaz verilir; bellekte bekleyen belge sayısı
+    bu pencereyle sınırlıdır.
+    `tohum` ve `strateji` yerleşimi belirler; öğrenci düşmeyen sınıflar için
+    belge üretilmez. `onbellek` (BelgeOnbellegi) verilirse içeriği değişmeyen
+    sınıfların ve pano listesinin PDF'leri yeniden oluşturulmaz. `pano_sutunu`
+    pano listesinin 1, 2 veya 3 sütunlu dizileceğini belirler. `olcum`
+    (olcum.Olcum) verilirse aşama ve sınıf başına ölçümler kaydedilir.
+    `ilerleme(sinif_adi)` verilirse her sınıfın belgeleri hazır olduğunda çağrılır.
+    """
+    if sureler is None:
+        sureler = {}
+    if zaman is None:
+        zaman = uretim_zamani()
+    pano_siniflari = []
+    pano_icerigi = []
+    # Havuz modunda sırası gelmemiş sınıflar: (room, anahtar, belgeler veya Future)
+    bekleyenler = collections.deque()
+    pencere = HAVUZ_PENCERESI * havuz.is_sayisi if havuz is not None else 0
+    t_siniflar = time.perf_counter()
+
+    def havuzdan_al():
+        """Sıradaki sınıfın belgelerini (gerekirse işçiyi bekleyerek) alır"""
+        room, anahtar, belgeler = bekleyenler.popleft()
+        if not isinstance(belgeler, tuple):
+            belgeler = belgeler.result()
+            if olcum is not None:
+                # Süreler işçi süreçte ölçülür; bu süreçteki aşamalardan ayrı kaydedilir
+                belgeler, duvar, cpu = belgeler
+                olcum.ekle('havuz_sinif', duvar=duvar, cpu=cpu, sinif=room['Ad'], **belge_olcusu(belgeler))
+            if onbellek is not None:
+                onbellek.koy(anahtar, belgeler)
+        elif olcum is not None:
+            olcum.ekle('sinif', sinif=room['Ad'], onbellek=True, **belge_olcusu(belgeler))
+        if ilerleme is not None:
+            ilerleme(room['Ad'])
+        return room, belgeler
+
+    def hazir(belgeler):
+        return isinstance(belgeler, tuple) or belgeler.done()
+
+    for room, room_list in siniflara_dagit(df, rooms, tohum, strateji, olcum):
+        if room_list.empty:
+            continue
+        pano_siniflari.append((room['Ad'], room_list.iloc[:, :3]))
+        pano_icerigi.append([room['Ad'], room_list.iloc[:, :3].values.tolist()])
+        satirlar = ogrenci_satirlari(room_list)
+
+        anahtar = belge_anahtari('sinif', baslik, room['Ad'], satirlar)
+        belgeler = onbellek.al(anahtar) if onbellek is not None else None
+
+        if havuz is not None:
+            if belgeler is None:
+                uret = sinif_belgeleri if olcum is None else olculen_sinif_belgeleri
+                belgeler = havuz.yurutucu.submit(uret, baslik, room['Ad'], satirlar, zaman)
+            bekleyenler.append((room, anahtar, belgeler))
+            # Pencere dolduysa sıradaki beklenir; hazır olanlar sırayla hemen verilir
+            while bekleyenler and (len(bekleyenler) > pencere or hazir(bekleyenler[0][2])):
+                hazir_room, (yoklama, kapi) = havuzdan_al()
+                yield f"Yoklama_{hazir_room['Ad']}.pdf", yoklama
+                yield f"Kapi_Listesi_{hazir_room['Ad']}.pdf", kapi
+            continue
+
+        if belgeler is None:
+            t0 = time.perf_counter()
+            with asama(olcum, 'sinif', sinif=room['Ad'], ogrenci=len(room_list)) as ek:
+                belgeler = sinif_belgeleri(baslik, room['Ad'], satirlar, zaman)
+                if olcum is not None:
+                    ek.update(belge_olcusu(belgeler))
+            sureler['siniflar'] = sureler.get('siniflar', 0.0) + time.perf_counter() - t0
+            if onbellek is not None:
+                onbellek.koy(anahtar, belgeler)
+        elif olcum is not None:
+            olcum.ekle('sinif', sinif=room['Ad'], ogrenci=len(room_list), onbellek=True, **belge_olcusu(belgeler))
+        if ilerleme is not None:
+            ilerleme(room['Ad'])
+        yoklama, kapi = belgeler
+
+        yield f"Yoklama_{room['Ad']}.pdf", yoklama
+        yield f"Kapi_Listesi_{room['Ad']}.pdf", kapi
+
+    # Paralel modda işçiler son penceredeki sınıfları oluştururken pano listesi bu süreçte hazırlanır
+    t0 = time.perf_counter()
+    pano_anahtari = belge_anahtari('pano', baslik, pano_sutunu, pano_icerigi)
+    pano = onbellek.al(pano_anahtari) if onbellek is not None else None
+    if pano is None:
+        with asama(olcum, 'pano', sutun=pano_sutunu) as ek:
+            pano = pano_listesi_pdf(baslik, pano_siniflari, zaman, pano_sutunu)
+            if olcum is not None:
+                ek.update(belge_olcusu(pano))
+        if onbellek is not None:
+            onbellek.koy(pano_anahtari, pano)
+    elif olcum is not None:
+        olcum.ekle('pano', sutun=pano_sutunu, onbellek=True, **belge_olcusu(pano))
+    sureler['pano'] = time.perf_counter() - t0
+
+    while bekleyenler:
+        room, (yoklama, kapi) = havuzdan_al()
+        yield f"Yoklama_{room['Ad']}.pdf", yoklama
+        yield f"Kapi_Listesi_{room['Ad']}.pdf", kapi
+    if havuz is not None and pano_siniflari:
+        # Paralel modda pano ile örtüşen toplam duvar saati süresi
+        sureler['siniflar'] = time.perf_counter() - t_siniflar
+
+    yield "Pano_Listesi.pdf", pano
+
+
+def birlesik_pdf(hedef, baslik, df, rooms, sureler=None, zaman=None, tohum=None, strateji=None, aciklama=None,
+                 pano_sutunu=1, olcum=None, ilerleme=None):
+    """Sınavın tüm belgelerini yer imli tek bir PDF olarak hedefe yazar.
+
+    Her sınıf için yoklama ve kapı listesi, en sonda pano listesi aynı belgeye
+    eklenir; fontlar ve kaynaklar belge başına bir kez gömülür. Sınıflar
+    yerleştirildikçe sayfalara çizilir, sınıf listeleri bellekte tutulmaz
+    (yalnızca pano için gereken sütunlar saklanır). Yer imleri: her sınıf
+    (altında Yoklama ve Kapı Listesi) ve Pano Listesi. hedef bir dosya yolu
+    veya yazılabilir dosya nesnesidir. aciklama verilirse PDF anahtar
+    kelimelerine yazılır (ör. yerleşim tohumu). `olcum` verilirse sınıf başına
+    süre ve sayfa sayısı kaydedilir; `ilerleme(sinif_adi)` her sınıf çizildiğinde
+    çağrılır. Çizilen sınıf sayısını döndürür.
+
+    Bellek sınırı: fpdf tüm sayfaların içeriğini output() çağrılana kadar
+    bellekte tutar; belge sayfa sayfa diske akıtılamaz ve bellek sayfa
+    sayısıyla doğrusal artar (yaklaşık 2 MiB / 1000 öğrenci). Ölçüm, tepe
+    RSS artışı: 10 000 öğrenci / 250 sınıf +22 MiB, 40 000 öğrenci / 1000
+    sınıf +79 MiB (ZIP çıktısında sırasıyla +17 ve +62 MiB).
+    """
+    if sureler is None:
+        sureler = {}
+    if zaman is None:
+        zaman = uretim_zamani()
+    pdf = yeni_pdf(baslik, zaman)
+    pdf.set_title(f"{baslik['ders']} {baslik['sinav_turu']}")
+    if aciklama:
+        pdf.set_keywords(aciklama)
+    pano_siniflari = []
+    sinif_sayisi = 0
+
+    t0 = time.perf_counter()
+    for room, room_list in siniflara_dagit(df, rooms, tohum, strateji, olcum):
+        if room_list.empty:
+            continue
+        pano_siniflari.append((room['Ad'], room_list.iloc[:, :3]))
+        with asama(olcum, 'sinif', sinif=room['Ad'], ogrenci=len(room_list)) as ek:
+            ilk_sayfa = pdf.page
+            satirlar = ogrenci_satirlari(room_list)
+            yoklama_ciz(pdf, room['Ad'], satirlar, [(str(room['Ad']), 0), ("Yoklama", 1)])
+            kapi_listesi_ciz(pdf, room['Ad'], satirlar, [("Kapı Listesi", 1)])
+            ek['sayfa'] = pdf.page - ilk_sayfa
+        sinif_sayisi += 1
+        if ilerleme is not None:
+            ilerleme(room['Ad'])
+    sureler['siniflar'] = time.perf_counter() - t0
+
+    t0 = time.perf_counter()
+    with asama(olcum, 'pano', sutun=pano_sutunu) as ek:
+        ilk_sayfa = pdf.page
+        pano_ciz(pdf, baslik, pano_siniflari, [("Pano Listesi", 0)], pano_sutunu)
+        ek['sayfa'] = pdf.page - ilk_sayfa
+    sureler['pano'] = time.perf_counter() - t0
+
+    with asama(olcum, 'cikti') as ek:
+        veri = pdf_bayt(pdf)
+        if hasattr(hedef, 'write'):
+            hedef.write(veri)
+        else:
+            with open(hedef, 'wb') as f:
+                f.write(veri)
+        ek.update(sayfa=pdf.page, bayt=len(veri))
+    return sinif_sayisi
+
+
+def zip_arsivi(hedef, sikistirma="deflate", seviye=None):
+    """Dosya yolu veya dosya nesnesi üzerinde yazılabilir ZIP arşivi açar.
+
+    sikistirma: "deflate" veya "stored"; seviye: DEFLATE için 0-9 (None: varsayılan)
+    """
+    yontem = SIKISTIRMA_YONTEMLERI[sikistirma]
+    if yontem == zipfile.ZIP_STORED:
+        seviye = None
+    return zipfile.ZipFile(hedef, "w", yontem, False, compresslevel=seviye)
+
+
+def zip_yaz(zip_file, dosya_adi, veri, zaman):
+    """Belgeyi sabit tarih damgasıyla ZIP'e ekle (çıktının tekrarlanabilir olması için)"""
+    zinfo = zipfile.ZipInfo(dosya_adi, date_time=zaman.astimezone().timetuple()[:6])
+    zinfo.compress_type = zip_file.compression
+    zinfo.external_attr = 0o600 << 16
+    zip_file.writestr(zinfo, veri, compresslevel=zip_file.compresslevel)
+
+
+def zipe_akit(hedef, belgeler, zaman, sikistirma="deflate", seviye=None, aciklama=None, olcum=None):
+    """Belgeleri üretildikçe doğrudan ZIP'e yazar; bellekte tek belge tutulur
+    (süreç havuzuyla üretilirken en fazla havuz penceresi kadar sınıf bekler,
+    bkz. sinav_belgeleri).
+
+    hedef bir dosya yolu veya geçici dosya gibi yazılabilir bir dosya nesnesidir.
+    aciklama verilirse ZIP arşiv açıklamasına yazılır (ör. yerleşim tohumu).
+    `olcum` verilirse her belgenin ZIP'e yazılma süresi ve sıkıştırılmış boyutu
+    kaydedilir. Yazılan belge sayısını döndürür.
+    """
+    adet = 0
+    with zip_arsivi(hedef, sikistirma, seviye) as zip_file:
+        if aciklama:
+            zip_file.comment = aciklama.encode('utf-8')
+        for dosya_adi, veri in belgeler:
+            with asama(olcum, 'zip', belge=dosya_adi) as ek:
+                zip_yaz(zip_file, dosya_adi, veri, zaman)
+                if olcum is not None:
+                    ek['bayt'] = zip_file.getinfo(dosya_adi).compress_size
+            adet += 1
+    return adet
@@ -0,0 +1,194 @@
+"""Öğrencileri sınıflara dağıtan yerleşim stratejileri.
+
+Sınıf kapasiteleri üst sınırdır; toplam kapasite öğrenci sayısından büyük
+olabilir. Her strateji, her sınıf için öğrenci listesindeki satır konumlarını
+(numpy dizisi) döndürür. Tüm hesaplamalar numpy ile vektörel yapılır; on
+binlerce öğrenci için bile süre milisaniyeler düzeyindedir.
+
+Kısıtlı yerleşimde kullanılan isteğe bağlı sütunlar:
+    Şube             : aynı şubedeki öğrenciler sınıflara dağıtılır
+    Erişilebilirlik  : dolu ("evet", "1", "x" ...) ise öğrenci erişilebilir
+                       olarak işaretlenmiş sınıflardan birine yerleştirilir
+Sınıflar için isteğe bağlı "Erisilebilir": True alanı kullanılır.
+"""
+import secrets
+
+import numpy as np
+
+SUBE_SUTUNU = "Şube"
+ERISIM_SUTUNU = "Erişilebilirlik"
+EVET_DEGERLERI = {"1", "e", "evet", "x", "var", "true", "yes", "y"}
+
+
+class YerlestirmeHatasi(ValueError):
+    """Öğrenciler verilen sınıflara yerleştirilemiyor (kapasite veya erişilebilirlik yetersiz)"""
+
+
+def kapasiteler(rooms):
+    return np.array([int(r['Kap']) for r in rooms], dtype=np.int64)
+
+
+def dengeli_hedefler(n, kap):
+    """n öğrenciyi kapasitelerle orantılı dağıtır (en büyük kalan yöntemi).
+
+    Her sınıfın doluluk oranı n / toplam kapasiteye olabildiğince yakın olur.
+    """
+    kap = np.asarray(kap, dtype=np.int64)
+    toplam = int(kap.sum())
+    if n > toplam:
+        raise YerlestirmeHatasi(f"Toplam sınıf kapasitesi ({toplam}) öğrenci sayısından ({n}) az!")
+    if n == 0:
+        return np.zeros(len(kap), dtype=np.int64)
+    pay = kap * n / toplam
+    hedef = np.floor(pay).astype(np.int64)
+    kalan = n - int(hedef.sum())
+    if kalan:
+        # Kesir kısmı en büyük olan (eşitlikte önce gelen) sınıflara birer kişi daha
+        sira = np.lexsort((np.arange(len(kap)), -(pay - hedef)))
+        hedef[sira[:kalan]] += 1
+    return hedef
+
+
+def serpistir(hedefler):
+    """Her sınıfın hedef sayısı kadar yer içeren, sınıfları eşit aralıklarla
+    karıştıran bir koltuk sırası (sınıf indisleri) üretir.
+
+    Art arda gelen öğrenciler böylece farklı sınıflara düşer.
+    """
+    hedefler = np.asarray(hedefler, dtype=np.int64)
+    sinif = np.repeat(np.arange(len(hedefler)), hedefler)
+    if sinif.size == 0:
+        return sinif
+    # Sınıf içindeki sıra numarası: 0, 1, ..., hedef-1
+    baslangic = np.repeat(np.cumsum(hedefler) - hedefler, hedefler)
+    konum = (np.arange(sinif.size) - baslangic + 0.5) / hedefler[sinif]
+    return sinif[np.lexsort((sinif, konum))]
+
+
+def _gruplara_ayir(konumlar, sinif_indisleri, sinif_sayisi):
+    """Koltuk sırasına göre dağıtılmış konumları sınıf başına dizilere ayırır"""
+    sira = np.argsort(sinif_indisleri, kind="stable")
+    sinirlar = np.cumsum(np.bincount(sinif_indisleri, minlength=sinif_sayisi))[:-1]
+    return np.split(np.asarray(konumlar)[sira], sinirlar)
+
+
+def yeni_tohum():
+    """Yerleşim karıştırması için yeni rastgele tohum"""
+    return secrets.randbelow(2**31)
+
+
+def _karistir(n, tohum):
+    return np.random.RandomState(tohum).permutation(n)
+
+
+def _evet(seri):
+    return seri.fillna("").astype(str).str.strip().str.lower().isin(EVET_DEGERLERI).to_numpy()
+
+
+class YerlestirmeStratejisi:
+    """Yerleşim stratejilerinin ortak arayüzü.
+
+    dagit(df, rooms, tohum) her sınıf için df satır konumlarını döndürür;
+    aynı girdi ve aynı tohum her zaman aynı sonucu vermelidir.
+    """
+    ad = ""
+    aciklama = ""
+
+    def dagit(self, df, rooms, tohum=None):
+        raise NotImplementedError
+
+
+class RastgeleYerlestirme(YerlestirmeStratejisi):
+    """Öğrencileri karıştırıp sınıfları sırayla kapasiteleri kadar doldurur"""
+    ad = "rastgele"
+    aciklama = "Rastgele (sınıfları sırayla doldurur)"
+
+    def dagit(self, df, rooms, tohum=None):
+        kap = kapasiteler(rooms)
+        if len(df) > kap.sum():
+            raise YerlestirmeHatasi(f"Toplam sınıf kapasitesi ({kap.sum()}) öğrenci sayısından ({len(df)}) az!")
+        karisik = df.reset_index(drop=True).sample(frac=1, random_state=tohum).index.to_numpy()
+        sinirlar = np.minimum(np.cumsum(kap), len(df))
+        return np.split(karisik, sinirlar[:-1])
+
+
+class DengeliYerlestirme(YerlestirmeStratejisi):
+    """Öğrencileri karıştırıp tüm sınıfların doluluk oranını eşitleyerek dağıtır"""
+    ad = "dengeli"
+    aciklama = "Dengeli (sınıf doluluk oranları eşit)"
+
+    def dagit(self, df, rooms, tohum=None):
+        hedef = dengeli_hedefler(len(df), kapasiteler(rooms))
+        karisik = _karistir(len(df), tohum)
+        return _gruplara_ayir(karisik, np.repeat(np.arange(len(hedef)), hedef), len(hedef))
+
+
+class KisitliYerlestirme(YerlestirmeStratejisi):
+    """Doluluk oranlarını dengeler, şubeleri sınıflara yayar ve erişilebilirlik
+    gerektiren öğrencileri erişilebilir sınıflara yerleştirir."""
+    ad = "kisitli"
+    aciklama = "Kısıtlı (şubeleri ayır, erişilebilir sınıflar, dengeli doluluk)"
+
+    def dagit(self, df, rooms, tohum=None):
+        n = len(df)
+        kap = kapasiteler(rooms)
+        if n == 0:
+            # Boş listede şube kodu çıkarılamaz; diğer stratejiler gibi tüm sınıflar boş döner
+            return [np.zeros(0, dtype=np.int64) for _ in rooms]
+        rnd = _karistir(n, tohum)
+
+        erisim = _evet(df[ERISIM_SUTUNU]) if ERISIM_SUTUNU in df.columns else np.zeros(n, dtype=bool)
+        erisilebilir = np.array([bool(r.get('Erisilebilir')) for r in rooms], dtype=bool)
+        hedef = self._hedefler(n, int(erisim.sum()), kap, erisilebilir)
+
+        # Öğrenci sırası: şubeler gruplanır (şube sırası ve şube içi sıra rastgele);
+        # serpiştirilmiş koltuk sırasına yerleştirilince her şube sınıflara yayılır
+        if SUBE_SUTUNU in df.columns:
+            sube = df[SUBE_SUTUNU].fillna("").astype(str).to_numpy()
+            _, sube_kodu = np.unique(sube, return_inverse=True)
+            sube_sirasi = np.random.RandomState(tohum).permutation(sube_kodu.max() + 1)[sube_kodu]
+        else:
+            sube_sirasi = np.zeros(n, dtype=np.int64)
+        sira = rnd[np.lexsort((np.arange(n), sube_sirasi[rnd]))]
+
+        # Önce erişilebilirlik gerektiren öğrenciler erişilebilir sınıflara
+        isaretli = sira[erisim[sira]]
+        hedef_isaretli = np.zeros(len(kap), dtype=np.int64)
+        if isaretli.size:
+            hedef_isaretli[erisilebilir] = dengeli_hedefler(isaretli.size, hedef[erisilebilir])
+        digerleri = sira[~erisim[sira]]
+
+        konumlar = np.concatenate([isaretli, digerleri])
+        sinif = np.concatenate([serpistir(hedef_isaretli), serpistir(hedef - hedef_isaretli)])
+        return _gruplara_ayir(konumlar, sinif, len(kap))
+
+    @staticmethod
+    def _hedefler(n, isaretli, kap, erisilebilir):
+        """Sınıf hedeflerini belirler; erişilebilir sınıflar en az işaretli öğrenci sayısı kadar yer alır"""
+        if not isaretli:
+            return dengeli_hedefler(n, kap)
+        kap_a = int(kap[erisilebilir].sum())
+        kap_d = int(kap[~erisilebilir].sum())
+        if isaretli > kap_a:
+            raise YerlestirmeHatasi(
+                f"Erişilebilirlik gerektiren {isaretli} öğrenci var, ancak erişilebilir sınıfların "
+                f"toplam kapasitesi {kap_a}."
+            )
+        hedef = dengeli_hedefler(n, kap)
+        toplam_a = min(max(int(hedef[erisilebilir].sum()), isaretli, n - kap_d), kap_a)
+        hedef[erisilebilir] = dengeli_hedefler(toplam_a, kap[erisilebilir])
+        hedef[~erisilebilir] = dengeli_hedefler(n - toplam_a, kap[~erisilebilir])
+        return hedef
+
+
+STRATEJILER = {s.ad: s for s in (RastgeleYerlestirme(), DengeliYerlestirme(), KisitliYerlestirme())}
+
+
+def strateji_al(strateji):
+    """Strateji adını veya nesnesini YerlestirmeStratejisi nesnesine çevirir"""
+    if isinstance(strateji, YerlestirmeStratejisi):
+        return strateji
+    try:
+        return STRATEJILER[strateji or "rastgele"]
+    except KeyError:
+        raise ValueError(f"Bilinmeyen yerleşim stratejisi: {strateji}") from None